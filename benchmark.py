@@ -0,0 +1,351 @@
+"""
+성능 벤치마크 스크립트
+generate_mock_data로 만든 여러 규모의 합성 데이터셋에서 주요 경로(로컬/GitHub 에뮬레이터 로드와 저장, 검증,
+검색, 빈 시간 계산, 차트 생성)의 지연 시간 백분위수와 최대 메모리를 측정하여 JSON 파일로 저장합니다.
+이전 결과 파일을 지정하면 벤치마크별 p50 변화율을 함께 출력합니다.
+
+사용 예:
+    python benchmark.py                                      # small, medium 규모
+    python benchmark.py --sizes small,medium,large --repeat 30
+    python benchmark.py --latency-ms 80                      # GitHub 왕복 지연 포함
+    python benchmark.py --output new.json --compare bench_results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import streamlit as st
+
+import utils.github_handler as gh
+from generate_mock_data import GeneratorConfig, generate_all
+from utils.aggregates import AGGREGATE_FILENAME
+from utils.dashboard import build_partner_bar, build_region_pie
+from utils.local_store import StampedCache
+from utils.rate_limiter import GitHubScheduler
+from utils.scheduling import busy_slots_by_staff, find_free_slots, group_by_date
+from utils.search import search_cards, search_reports, search_staff
+
+# 상수 정의
+DEFAULT_OUTPUT = "bench_results.json"
+DEFAULT_REPEAT = 20
+DEFAULT_WARMUP = 1
+MAX_SECONDS_PER_BENCHMARK = 10.0  # 벤치마크 하나의 측정 시간 상한 (최소 MIN_SAMPLES회는 측정)
+MIN_SAMPLES = 3
+PERCENTILES = (50, 90, 99)
+FREE_SLOT_STAFF = 5               # 빈 시간 계산에 선택할 직원 수
+
+# 규모별 생성 인자 (large는 운영 규모: 보고서 10만 건, 직원 1천 명, 1년 일정)
+SIZES: Dict[str, Dict[str, int]] = {
+    "small": {"reports": 1_000, "staff": 50, "days": 30, "cards": 100, "manual": 50},
+    "medium": {"reports": 10_000, "staff": 200, "days": 90, "cards": 1_000, "manual": 200},
+    "large": {"reports": 100_000, "staff": 1_000, "days": 365, "cards": 10_000, "manual": 1_000},
+}
+
+# 로드 벤치마크 대상 파일 (가장 큰 두 파일)
+LOAD_FILES = ("weekly_reports.json", "schedules.json")
+SEARCH_QUERIES = {"reports": "예산", "staff": "데이터분석", "cards": "World"}
+SAVE_FILE = "staff_profiles.json"   # 저장 벤치마크 대상 (집계 갱신이 없는 작은 파일)
+FAKE_SECRETS = {
+    "REPO_NAME": "benchmark/data",
+    "BRANCH_NAME": "main",
+    "CHANGE_WATCH_INTERVAL": 0,
+}
+
+
+@dataclass
+class Benchmark:
+    """측정 대상 하나"""
+    name: str
+    run: Callable[[], Any]
+    records: int = 0
+    setup: Optional[Callable[[], None]] = None  # 매 반복 측정 전에 호출 (측정 시간에서 제외)
+
+
+# GitHub 에뮬레이터 -----------------------------------------------------------
+
+@contextlib.contextmanager
+def local_mode() -> Iterator[None]:
+    """GitHub 설정 없이 로컬 data/ 폴더만 사용합니다."""
+    previous = st.secrets
+    st.secrets = {}
+    try:
+        yield
+    finally:
+        st.secrets = previous
+
+
+@contextlib.contextmanager
+def fake_github_mode(latency_ms: float) -> Iterator[None]:
+    """
+    FAKE_GITHUB 설정으로 현재 data/ 폴더를 올린 GitHub 에뮬레이터를 사용합니다.
+    로드/저장 경로(디코딩, 버전 기록, 커밋)의 비용만 측정하도록 요청 스케줄러는 제한 없는 인스턴스로 바꿉니다.
+    """
+    scheduler = GitHubScheduler(rate=1e9, capacity=10 ** 9)
+    previous = (st.secrets, gh.get_scheduler)
+    st.secrets = {**FAKE_SECRETS, "FAKE_GITHUB": {"latency_ms": latency_ms}}
+    gh.get_scheduler = lambda: scheduler
+    # 규모마다 새 데이터셋으로 저장소를 다시 만듦
+    gh._create_fake_github.clear()
+    try:
+        yield
+    finally:
+        st.secrets, gh.get_scheduler = previous
+
+
+# 측정 -----------------------------------------------------------------------
+
+def percentile(samples: List[float], pct: float) -> float:
+    """선형 보간 백분위수"""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def measure(bench: Benchmark, repeat: int, warmup: int = DEFAULT_WARMUP,
+            max_seconds: float = MAX_SECONDS_PER_BENCHMARK) -> Dict[str, Any]:
+    """
+    벤치마크 하나를 반복 실행하여 지연 시간과 최대 메모리를 측정합니다.
+    메모리는 추적 오버헤드가 지연 시간에 섞이지 않도록 별도 1회 실행에서 tracemalloc으로 측정합니다.
+
+    Args:
+        bench: 측정 대상
+        repeat: 최대 반복 횟수
+        warmup: 측정 전 실행 횟수
+        max_seconds: 측정 시간 상한 (최소 MIN_SAMPLES회는 측정)
+
+    Returns:
+        {'samples', 'p50_ms', 'p90_ms', 'p99_ms', 'mean_ms', 'min_ms', 'max_ms', 'peak_kb'}
+    """
+    for _ in range(warmup):
+        if bench.setup:
+            bench.setup()
+        bench.run()
+
+    samples: List[float] = []
+    started = time.perf_counter()
+    while len(samples) < repeat:
+        if bench.setup:
+            bench.setup()
+        begin = time.perf_counter_ns()
+        bench.run()
+        samples.append((time.perf_counter_ns() - begin) / 1e6)
+        if len(samples) >= MIN_SAMPLES and time.perf_counter() - started > max_seconds:
+            break
+
+    if bench.setup:
+        bench.setup()
+    tracemalloc.start()
+    try:
+        bench.run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    result: Dict[str, Any] = {"samples": len(samples)}
+    for pct in PERCENTILES:
+        result[f"p{pct}_ms"] = round(percentile(samples, pct), 4)
+    result.update({
+        "mean_ms": round(sum(samples) / len(samples), 4),
+        "min_ms": round(min(samples), 4),
+        "max_ms": round(max(samples), 4),
+        "peak_kb": round(peak / 1024, 1),
+    })
+    return result
+
+
+def _reset_local_cache() -> None:
+    """로컬 파일 파싱 캐시를 비워 매번 파일을 다시 읽고 파싱하게 합니다."""
+    gh._local_cache = StampedCache()
+
+
+def local_benchmarks() -> List[Benchmark]:
+    """로컬 모드 벤치마크 (로드, 검증, 검색, 빈 시간, 차트)"""
+    benches: List[Benchmark] = []
+    for filename in LOAD_FILES:
+        records = len(gh.load_data(filename) or [])
+        stem = filename.rsplit(".", 1)[0]
+        benches.append(Benchmark(f"load_data.local.cold:{stem}", lambda f=filename: gh.load_data(f),
+                                 records, setup=_reset_local_cache))
+        benches.append(Benchmark(f"load_data.local.warm:{stem}", lambda f=filename: gh.load_data(f), records))
+
+    reports = gh.load_data("weekly_reports.json") or []
+    benches.append(Benchmark("validate_json_data:weekly_reports",
+                             lambda: gh._validate_json_data(reports, "weekly_reports.json"), len(reports)))
+
+    # 페이지와 같이 공유 데이터셋(FrozenRecord)을 검색 (결과 캐시는 거치지 않음)
+    shared_reports = gh.load_shared_data("weekly_reports.json") or ()
+    profiles = gh.load_shared_data("staff_profiles.json") or ()
+    cards = gh.load_shared_data("business_cards.json") or ()
+    benches += [
+        Benchmark("search_reports", lambda: search_reports(SEARCH_QUERIES["reports"], shared_reports),
+                  len(shared_reports)),
+        Benchmark("search_staff", lambda: search_staff(SEARCH_QUERIES["staff"], profiles), len(profiles)),
+        Benchmark("search_cards", lambda: search_cards(SEARCH_QUERIES["cards"], cards), len(cards)),
+    ]
+
+    # 스마트 일정 관리: 직원 여러 명 선택 → 조회 → 날짜별 공통 빈 시간 (모든 날짜)
+    names = gh.distinct_values("schedules.json", "name")[:FREE_SLOT_STAFF]
+
+    def free_slots() -> List[List[str]]:
+        schedules_by_date = group_by_date(gh.query_records("schedules.json", name=names))
+        return [find_free_slots(busy_slots_by_staff(day), names) for day in schedules_by_date.values()]
+
+    benches.append(Benchmark("schedule.free_slots", free_slots, len(gh.load_data("schedules.json") or [])))
+
+    aggregates = gh.load_data(AGGREGATE_FILENAME) or {}
+    region_rows = aggregates.get("students_by_region", [])
+    partner_rows = aggregates.get("partners_by_year", [])
+    benches += [
+        Benchmark("figure.region_pie", lambda: build_region_pie(region_rows), len(region_rows)),
+        Benchmark("figure.partner_bar", lambda: build_partner_bar(partner_rows), len(partner_rows)),
+    ]
+    return benches
+
+
+def github_benchmarks() -> List[Benchmark]:
+    """GitHub 에뮬레이터 모드 로드/저장 벤치마크 (1MB 초과 파일은 Git blob API 경로)"""
+    benches: List[Benchmark] = []
+    for filename in LOAD_FILES:
+        records = len(gh.load_data(filename) or [])
+        stem = filename.rsplit(".", 1)[0]
+        benches.append(Benchmark(f"load_data.github:{stem}", lambda f=filename: gh.load_data(f), records))
+
+    # 매번 레코드 하나를 바꿔 저장 (조회 → 커밋 → 로컬 사본 갱신)
+    loaded, version = gh.load_data_with_version(SAVE_FILE)
+    profiles = [dict(p) for p in loaded or []]
+    state = {"n": 0, "version": version}
+
+    def save() -> bool:
+        state["n"] += 1
+        if profiles:
+            profiles[0]["interests"] = [f"benchmark-{state['n']}"]
+        saved = gh.save_data(SAVE_FILE, profiles, state["version"])
+        # 벤치마크는 단일 스레드이므로 방금 저장한 버전이 다음 저장의 기준
+        state["version"] = gh.get_data_version(SAVE_FILE)
+        return saved
+
+    benches.append(Benchmark(f"save_data.github:{SAVE_FILE.rsplit('.', 1)[0]}", save, len(profiles)))
+    return benches
+
+
+def run_size(size: str, seed: int, repeat: int, max_seconds: float, latency_ms: float) -> List[Dict[str, Any]]:
+    """규모 하나의 데이터셋을 생성하고 모든 벤치마크를 측정합니다 (현재 작업 폴더의 data/ 사용)."""
+    config = GeneratorConfig(seed=seed, start_date=date(2025, 1, 6), **SIZES[size])
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_all(config, Path("data"))
+    _reset_local_cache()
+
+    results: List[Dict[str, Any]] = []
+    groups = [(local_mode, local_benchmarks), (lambda: fake_github_mode(latency_ms), github_benchmarks)]
+    for mode, build in groups:
+        with mode():
+            for bench in build():
+                result = {"benchmark": bench.name, "size": size, "records": bench.records}
+                result.update(measure(bench, repeat, max_seconds=max_seconds))
+                results.append(result)
+                print(f"  {bench.name:<40} {size:<7} n={result['samples']:<3} "
+                      f"p50={result['p50_ms']:>10.3f}ms  p99={result['p99_ms']:>10.3f}ms  "
+                      f"peak={result['peak_kb']:>10.1f}KB")
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[Dict[str, Any]], baseline_path: Path) -> None:
+    """이전 결과 파일과 p50을 비교하여 출력합니다."""
+    try:
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    except (IOError, ValueError) as e:
+        print(f"❌ 비교 파일을 읽을 수 없습니다 ({baseline_path}): {e}")
+        return
+    previous = {(r["benchmark"], r["size"]): r for r in baseline.get("results", [])}
+    print(f"\n📊 {baseline_path} 대비 p50 변화 (기준 커밋: {baseline.get('meta', {}).get('git_commit')})")
+    compared = 0
+    for result in results:
+        base = previous.get((result["benchmark"], result["size"]))
+        if not base or not base.get("p50_ms"):
+            continue
+        compared += 1
+        change = (result["p50_ms"] - base["p50_ms"]) / base["p50_ms"] * 100
+        print(f"  {result['benchmark']:<40} {result['size']:<7} "
+              f"{base['p50_ms']:>10.3f}ms → {result['p50_ms']:>10.3f}ms ({change:+.1f}%)")
+    if not compared:
+        print("  ⚠️ 같은 벤치마크/규모의 이전 결과가 없습니다.")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="KDI 스마트 행정 플랫폼 성능 벤치마크")
+    parser.add_argument("--sizes", default="small,medium", help=f"측정할 규모 (쉼표 구분: {', '.join(SIZES)})")
+    parser.add_argument("--seed", type=int, default=42, help="데이터 생성 시드")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="벤치마크별 최대 반복 횟수")
+    parser.add_argument("--max-seconds", type=float, default=MAX_SECONDS_PER_BENCHMARK,
+                        help="벤치마크별 측정 시간 상한 (초)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="GitHub 에뮬레이터 요청당 지연 (ms)")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="결과 JSON 파일")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args(argv)
+
+    sizes = [s.strip() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown or args.repeat < 1:
+        parser.error(f"알 수 없는 규모: {', '.join(unknown)}" if unknown else "--repeat는 1 이상이어야 합니다.")
+
+    # 실행 컨텍스트 없이 Streamlit 함수를 호출할 때마다 남는 경고 로그 생략
+    logging.disable(logging.WARNING)
+    output = Path(args.output).resolve()
+    baseline = Path(args.compare).resolve() if args.compare else None
+    meta = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "github_latency_ms": args.latency_ms,
+        "sizes": {size: SIZES[size] for size in sizes},
+    }
+
+    results: List[Dict[str, Any]] = []
+    cwd = os.getcwd()
+    # 앱의 data/ 폴더를 건드리지 않도록 임시 작업 폴더에서 생성/측정
+    with tempfile.TemporaryDirectory(prefix="kdis-bench-") as workdir:
+        os.chdir(workdir)
+        try:
+            for size in sizes:
+                print(f"⏱️ {size} 규모 측정 중... {SIZES[size]}")
+                results += run_size(size, args.seed, args.repeat, args.max_seconds, args.latency_ms)
+        finally:
+            os.chdir(cwd)
+
+    output.write_text(json.dumps({"meta": meta, "results": results}, ensure_ascii=False, indent=2),
+                      encoding="utf-8")
+    print(f"\n✅ {len(results)}개 결과를 {output}에 저장했습니다.")
+    if baseline:
+        compare(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,98 +1,451 @@
-import os
+"""
+더미 데이터 생성 스크립트
+시드와 규모(보고서 수, 직원 수, 일정 기간, 부서 수 등)를 지정하여 같은 데이터를 재현할 수 있으며,
+대용량 데이터는 청크 단위로 생성하여 바로 파일에 기록합니다 (선택적으로 여러 프로세스에서 병렬 생성).
+
+사용 예:
+    python generate_mock_data.py                                   # 기본 소규모 데이터
+    python generate_mock_data.py --seed 7 --reports 100000 --staff 1000 --days 365 --workers 4
+"""
+
+import argparse
 import json
 import random
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.blob_cache import git_blob_sha
+from utils.local_store import atomic_write, make_temp_path, replace_file
+from utils.aggregates import AGGREGATE_FILENAME, CUBE_FILENAME, update_aggregates
+from utils.timeseries import KPI_HISTORY_FILENAME, append_kpi_snapshot, compute_kpi_deltas
 
-# 데이터 저장 폴더 생성 (절대 경로 처리)
-data_dir = Path('data')
-try:
-    data_dir.mkdir(exist_ok=True)
-except OSError as e:
-    print(f"❌ 데이터 폴더 생성 실패: {e}")
-    exit(1)
+# 상수 정의
+DEFAULT_SEED = 42
+DEFAULT_CHUNK_SIZE = 1000
+DEFAULT_START_DATE = date(2025, 12, 8)  # 기준 날짜 기본값 (실행 날짜와 무관하게 같은 시드면 같은 데이터)
+MAX_REPORT_WEEKS = 52  # 보고서 분산 기간 기본 상한 (1년)
 
 # 1. 통합 대시보드 데이터 (Dashboard)
-dashboard_data: Dict[str, Any] = {
-    "kpi": {"total_students": 320, "partners": 45, "employment_rate": 92.5},
-    "students_by_region": [
-        {"region": "Asia", "count": 150}, {"region": "Africa", "count": 80},
-        {"region": "Europe", "count": 40}, {"region": "Americas", "count": 30}, {"region": "Others", "count": 20}
-    ],
-    "mou_partners": [
-        {"name": "World Bank", "country": "USA", "year": 2023},
-        {"name": "ADB", "country": "Philippines", "year": 2022},
-        {"name": "KOICA", "country": "Korea", "year": 2021}
-    ]
+# KPI와 분포는 레코드 단위 데이터(students, mou_partners)에서 집계됩니다.
+regions: Dict[str, List[str]] = {
+    "Asia": ["Vietnam", "Indonesia", "Philippines", "Mongolia", "Bangladesh"],
+    "Africa": ["Ghana", "Kenya", "Ethiopia", "Rwanda"],
+    "Europe": ["Germany", "France", "Ukraine"],
+    "Americas": ["USA", "Colombia", "Peru"],
+    "Others": ["Australia", "Fiji"]
 }
+enrolled_by_region = {"Asia": 150, "Africa": 80, "Europe": 40, "Americas": 30, "Others": 20}
+programs = ["MPP", "MDP", "MPM", "PhD"]
+mou_partners: List[Dict[str, Any]] = [
+    {"name": "World Bank", "country": "USA", "year": 2023},
+    {"name": "ADB", "country": "Philippines", "year": 2022},
+    {"name": "KOICA", "country": "Korea", "year": 2021},
+    {"name": "UNDP", "country": "USA", "year": 2021},
+    {"name": "OECD", "country": "France", "year": 2020},
+    {"name": "JICA", "country": "Japan", "year": 2022},
+    {"name": "GIZ", "country": "Germany", "year": 2023},
+    {"name": "AfDB", "country": "Côte d'Ivoire", "year": 2024},
+    {"name": "IDB", "country": "USA", "year": 2024},
+    {"name": "UNESCO", "country": "France", "year": 2019}
+]
 
-# 2. 주간보고서 데이터 (Weekly Reports)
-weekly_reports: List[Dict[str, Any]] = []
-base_date = datetime.now()
-for i in range(5):
-    date_str = (base_date - timedelta(weeks=i)).strftime("%Y-%m-%d")
-    weekly_reports.append({
-        "date": date_str,
-        "department": random.choice(["교학팀", "대외협력팀", "기획팀", "총무팀"]),
-        "summary": f"{date_str} 주간 업무 보고입니다. 주요 행사 및 일정 공유드립니다.",
-        "issues": ["행사장 예약 중복 가능성 있음", "예산 승인 지연 우려"] if i % 2 == 0 else [],
-        "link": f"https://kdischool.ac.kr/report/{date_str}"
-    })
-
-# 3. 일정 데이터 (Schedules)
-schedules: List[Dict[str, Any]] = []
+# 2~6. 기본 데이터 (규모를 키우면 아래 목록 뒤에 생성된 레코드가 이어짐)
+departments = ["교학팀", "대외협력팀", "기획팀", "총무팀"]
+report_issues = ["행사장 예약 중복 가능성 있음", "예산 승인 지연 우려"]
+extra_report_issues = [
+    "장학금 지급 기준 검토 필요", "신규 MOU 체결 일정 지연", "취업 박람회 참여 기업 감소",
+    "전임교원 채용 공고 마감 임박", "LMS 서버 점검 예정", "입학설명회 자료 준비 지연",
+    "국제 세미나 연사 섭외 중", "학사 규정 개정안 검토 요청", "시설 보수 공사 일정 조정"
+]
 staff_names = ["김철수", "이영희", "박지민", "최현우"]
-for name in staff_names:
-    for i in range(5):
-        schedules.append({
-            "name": name,
-            "date": (base_date + timedelta(days=i)).strftime("%Y-%m-%d"),
-            "time_slots": [f"{h}:00" for h in range(9, 18) if random.random() > 0.5],  # Busy slots
-            "event": "수업" if random.random() > 0.7 else "회의"
-        })
-
-# 4. 직원 프로필 (Staff Profiles)
-staff_profiles: List[Dict[str, Any]] = [
+staff_profiles_base: List[Dict[str, Any]] = [
     {"name": "김철수", "dept": "교학팀", "expertise": ["학사관리", "LMS"], "interests": ["생성형AI", "독서"], "email": "cs_kim@kdis.ac.kr"},
     {"name": "이영희", "dept": "대외협력팀", "expertise": ["국제행사", "통역"], "interests": ["여행", "영어"], "email": "yh_lee@kdis.ac.kr"},
     {"name": "박지민", "dept": "기획팀", "expertise": ["예산", "성과관리"], "interests": ["데이터분석", "테니스"], "email": "jm_park@kdis.ac.kr"}
 ]
-
-# 5. 기관평가 매뉴얼 (Evaluation Manual)
-evaluation_manual: List[Dict[str, Any]] = [
+expertise_pool = ["학사관리", "LMS", "국제행사", "통역", "예산", "성과관리", "입학홍보", "장학", "시설관리", "인사", "연구지원", "데이터분석"]
+interest_pool = ["생성형AI", "독서", "여행", "영어", "데이터분석", "테니스", "등산", "사진", "요리", "음악"]
+evaluation_manual_base: List[Dict[str, Any]] = [
     {"category": "교육과정", "criteria": "전임교원 확보율", "guide": "전년도 대비 5% 상승 목표 필요", "prev_feedback": "교원 다양성 부족 지적"},
     {"category": "학생지원", "criteria": "장학금 지급률", "guide": "지급 기준의 투명성 확보 문서화 필요", "prev_feedback": "규정 명문화 미흡"}
 ]
-
-# 6. 명함 데이터 (Business Cards)
-business_cards: List[Dict[str, Any]] = [
+manual_categories = ["교육과정", "학생지원", "연구성과", "국제화", "행정운영"]
+manual_topics = ["확보율", "만족도", "지급률", "참여율", "달성도", "운영 실적", "개선 계획"]
+business_cards_base: List[Dict[str, Any]] = [
     {"name": "John Doe", "org": "World Bank", "position": "Senior Specialist", "contact": "john@wb.org", "history": "2023 입학설명회 참석"},
     {"name": "Jane Smith", "org": "UNESCO", "position": "Director", "contact": "jane@unesco.org", "history": "2024 공동 세미나 논의 중"}
 ]
+card_first_names = ["Alex", "Maria", "David", "Sofia", "James", "Aisha", "Kenji", "Laura", "Omar", "Nina"]
+card_last_names = ["Brown", "Garcia", "Kim", "Nguyen", "Okafor", "Rossi", "Tanaka", "Silva", "Khan", "Müller"]
+card_positions = ["Program Officer", "Director", "Senior Specialist", "Consultant", "Manager"]
+
+_SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+# 기본 직원 이름(박지민, 최현우 등)과 겹치지 않도록 지/현은 제외
+_GIVEN_SYLLABLES = "민서태혜준영수하은도윤우진주연성예시아유"
+
+
+@dataclass(frozen=True)
+class GeneratorConfig:
+    """생성 규모와 시드 (프로세스 간에 전달되므로 불변)"""
+    seed: int = DEFAULT_SEED
+    start_date: date = DEFAULT_START_DATE
+    reports: int = 5
+    report_weeks: Optional[int] = None   # 보고서를 분산할 기간 (주, None이면 보고서 수와 52 중 작은 값)
+    staff: int = 4
+    days: int = 5                       # 일정 기간 (일)
+    departments: int = 4
+    cards: int = 2
+    manual: int = 2
+    kpi_days: int = 730
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    workers: int = 1
+
+
+def _rng(config: GeneratorConfig, dataset: str, key: int = 0) -> random.Random:
+    """
+    (시드, 데이터셋, 키)별 독립 난수 생성기.
+    대용량 데이터셋은 레코드(또는 직원) 번호를 키로 사용하므로 청크 크기/작업자 수와 관계없이 같은 결과가 나옵니다.
+    """
+    return random.Random(f"{config.seed}:{dataset}:{key}")
+
+
+def _start_time(config: GeneratorConfig) -> datetime:
+    """기준 날짜 09:00 (KPI 스냅샷 시각)"""
+    return datetime.combine(config.start_date, datetime.min.time()).replace(hour=9)
+
+
+def department_names(count: int) -> List[str]:
+    """부서명 목록 (기본 부서 뒤에 '부서05' 형식으로 추가)"""
+    return departments[:count] + [f"부서{i + 1:02d}" for i in range(len(departments), count)]
+
+
+def staff_name(index: int) -> str:
+    """직원 번호별 고유 이름 (기본 직원 뒤에 성+이름 조합, 조합이 모자라면 번호 추가)"""
+    if index < len(staff_names):
+        return staff_names[index]
+    n = index - len(staff_names)
+    surnames, syllables = len(_SURNAMES), len(_GIVEN_SYLLABLES)
+    name = (_SURNAMES[n % surnames]
+            + _GIVEN_SYLLABLES[(n // surnames) % syllables]
+            + _GIVEN_SYLLABLES[(n // surnames + n // (surnames * syllables) + 1) % syllables])
+    cycle = n // (surnames * syllables * syllables)
+    return f"{name}{cycle + 1}" if cycle else name
+
+
+# 데이터셋별 생성 함수 ---------------------------------------------------------
+
+def generate_dashboard_data(config: GeneratorConfig) -> Dict[str, Any]:
+    """재학생/졸업생 레코드와 MOU 파트너 목록"""
+    rng = _rng(config, "students")
+    students: List[Dict[str, Any]] = []
+    for region, count in enrolled_by_region.items():
+        for _ in range(count):
+            students.append({
+                "region": region,
+                "country": rng.choice(regions[region]),
+                "program": rng.choice(programs),
+                "cohort_year": rng.choice([2023, 2024, 2025]),
+                "status": "enrolled",
+                "employed": None
+            })
+    # 졸업생 200명 중 185명 취업 (취업률 92.5%)
+    for i in range(200):
+        region = rng.choice(list(regions))
+        students.append({
+            "region": region,
+            "country": rng.choice(regions[region]),
+            "program": rng.choice(programs),
+            "cohort_year": rng.choice([2020, 2021, 2022]),
+            "status": "graduated",
+            "employed": i < 185
+        })
+    for i, student in enumerate(students, 1):
+        student["id"] = f"S{i:04d}"
+
+    return {
+        "kpi": {"total_students": 320, "partners": 45, "employment_rate": 92.5},
+        "students_by_region": [
+            {"region": region, "count": count} for region, count in enrolled_by_region.items()
+        ],
+        "students": students,
+        "mou_partners": mou_partners
+    }
+
+
+def generate_kpi_history(config: GeneratorConfig) -> List[Dict[str, Any]]:
+    """KPI 이력 (일별 스냅샷, 현재 KPI 값으로 끝나는 시계열)"""
+    rng = _rng(config, "kpi_history")
+    history: List[Dict[str, Any]] = []
+    history_students, history_partners, history_rate = 260, 4, 88.0
+    start = _start_time(config)
+    for day in range(config.kpi_days, 0, -1):
+        progress = (config.kpi_days - day) / config.kpi_days
+        history.append({
+            "timestamp": (start - timedelta(days=day)).isoformat(timespec="seconds"),
+            "total_students": round(history_students + (320 - history_students) * progress + rng.randint(-5, 5)),
+            "partners": round(history_partners + (len(mou_partners) - history_partners) * progress),
+            "employment_rate": round(history_rate + (92.5 - history_rate) * progress + rng.uniform(-0.5, 0.5), 1)
+        })
+    return history
+
+
+def generate_report_chunk(args: Tuple[GeneratorConfig, int]) -> List[Dict[str, Any]]:
+    """주간보고서 청크 (최신순, 보고서 i는 기간 안에서 고르게 과거로 분산)"""
+    config, chunk = args
+    weeks = config.report_weeks or min(config.reports, MAX_REPORT_WEEKS)
+    depts = department_names(config.departments)
+    records = []
+    for i in range(chunk * config.chunk_size, min((chunk + 1) * config.chunk_size, config.reports)):
+        rng = _rng(config, "reports", i)
+        date_str = (config.start_date - timedelta(weeks=i * weeks // config.reports)).strftime("%Y-%m-%d")
+        if i < 5:
+            issues = list(report_issues) if i % 2 == 0 else []
+        else:
+            issues = rng.sample(report_issues + extra_report_issues, rng.randint(0, 3))
+        records.append({
+            "date": date_str,
+            "department": rng.choice(depts),
+            "summary": f"{date_str} 주간 업무 보고입니다. 주요 행사 및 일정 공유드립니다.",
+            "issues": issues,
+            "link": f"https://kdischool.ac.kr/report/{date_str}" + (f"-{i}" if i >= 5 else "")
+        })
+    return records
+
+
+def generate_schedule_chunk(args: Tuple[GeneratorConfig, int]) -> List[Dict[str, Any]]:
+    """일정 청크 (직원 단위로 나눔: 청크 하나 = chunk_size // days명의 전체 기간 일정)"""
+    config, chunk = args
+    staff_per_chunk = max(1, config.chunk_size // max(config.days, 1))
+    records = []
+    for index in range(chunk * staff_per_chunk, min((chunk + 1) * staff_per_chunk, config.staff)):
+        name = staff_name(index)
+        rng = _rng(config, "schedules", index)
+        for day in range(config.days):
+            records.append({
+                "name": name,
+                "date": (config.start_date + timedelta(days=day)).strftime("%Y-%m-%d"),
+                "time_slots": [f"{h}:00" for h in range(9, 18) if rng.random() > 0.5],  # Busy slots
+                "event": "수업" if rng.random() > 0.7 else "회의"
+            })
+    return records
+
 
-# 파일 저장 함수 (에러 처리 포함)
-def save_json(filename: str, data: Any) -> None:
+def generate_staff_profiles(config: GeneratorConfig) -> List[Dict[str, Any]]:
+    """직원 프로필 (기본 프로필 + 기본 직원 이후 번호의 생성 프로필)"""
+    rng = _rng(config, "profiles")
+    depts = department_names(config.departments)
+    profiles = [p for p in staff_profiles_base if p["name"] in staff_names[:config.staff]]
+    for index in range(len(staff_names), config.staff):
+        profiles.append({
+            "name": staff_name(index),
+            "dept": rng.choice(depts),
+            "expertise": rng.sample(expertise_pool, 2),
+            "interests": rng.sample(interest_pool, 2),
+            "email": f"staff{index:05d}@kdis.ac.kr"
+        })
+    return profiles
+
+
+def generate_evaluation_manual(config: GeneratorConfig) -> List[Dict[str, Any]]:
+    """기관평가 매뉴얼 (기본 항목 + 카테고리/주제 조합 항목)"""
+    rng = _rng(config, "manual")
+    manual = list(evaluation_manual_base[:config.manual])
+    for i in range(len(manual), config.manual):
+        category = manual_categories[i % len(manual_categories)]
+        topic = manual_topics[(i // len(manual_categories)) % len(manual_topics)]
+        manual.append({
+            "category": category,
+            "criteria": f"{category} {topic} {i + 1}",
+            "guide": f"{category} {topic} 관련 실적을 전년도 대비 {rng.randint(3, 10)}% 개선하는 계획 필요",
+            "prev_feedback": rng.choice(["근거 자료 부족", "목표 설정 모호", "성과 측정 지표 미흡", ""])
+        })
+    return manual
+
+
+def generate_business_cards(config: GeneratorConfig) -> List[Dict[str, Any]]:
+    """명함 (기본 명함 + 파트너 기관 담당자)"""
+    rng = _rng(config, "cards")
+    cards = list(business_cards_base[:config.cards])
+    for i in range(len(cards), config.cards):
+        first, last = rng.choice(card_first_names), rng.choice(card_last_names)
+        org = rng.choice(mou_partners)["name"]
+        cards.append({
+            "name": f"{first} {last} {i + 1}",
+            "org": org,
+            "position": rng.choice(card_positions),
+            "contact": f"{first.lower()}.{last.lower()}{i + 1}@{org.lower().replace(' ', '')}.org",
+            "history": f"{rng.choice([2022, 2023, 2024, 2025])} {rng.choice(['입학설명회 참석', '공동 세미나 논의 중', 'MOU 실무 협의'])}"
+        })
+    return cards
+
+
+# 파일 기록 ------------------------------------------------------------------
+
+def _dump_record(record: Any) -> bytes:
+    """배열 항목 하나를 indent=4 JSON 배열 안의 형식으로 직렬화합니다."""
+    text = json.dumps(record, ensure_ascii=False, indent=4)
+    return ("    " + text.replace("\n", "\n    ")).encode("utf-8")
+
+
+def write_json_array(path: Path, chunks: Iterable[List[Dict[str, Any]]],
+                     on_record: Optional[Callable[[Dict[str, Any]], None]] = None) -> int:
+    """
+    청크 단위로 받은 레코드를 JSON 배열 파일로 기록합니다 (임시 파일 작성 후 교체).
+
+    Args:
+        path: 대상 파일
+        chunks: 레코드 청크
+        on_record: 레코드마다 호출할 함수 (집계용)
+
+    Returns:
+        기록한 레코드 수
+    """
+    tmp_path = make_temp_path(path)
+    count = 0
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b"[")
+            for chunk in chunks:
+                for record in chunk:
+                    f.write((b",\n" if count else b"\n") + _dump_record(record))
+                    count += 1
+                    if on_record:
+                        on_record(record)
+            f.write(b"\n]" if count else b"]")
+        replace_file(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return count
+
+
+def _chunks(fn: Callable[[Tuple[GeneratorConfig, int]], List[Dict[str, Any]]],
+            config: GeneratorConfig, chunk_count: int,
+            pool: Optional[ProcessPoolExecutor]) -> Iterator[List[Dict[str, Any]]]:
+    """청크 생성 (작업자가 있으면 병렬 생성하되 순서대로 반환)"""
+    args = [(config, chunk) for chunk in range(chunk_count)]
+    if pool is None:
+        return map(fn, args)
+    return pool.map(fn, args)
+
+
+def save_json(filepath: Path, data: Any) -> None:
     """JSON 파일을 안전하게 저장합니다."""
-    filepath = data_dir / filename
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
-        print(f"✅ {filename} 저장 완료")
+        # 임시 파일 작성 후 교체: 실행 중인 앱이 반쯤 쓰인 파일을 읽지 않도록 함
+        atomic_write(filepath, json.dumps(data, ensure_ascii=False, indent=4).encode('utf-8'))
+        print(f"✅ {filepath.name} 저장 완료")
     except (IOError, OSError) as e:
-        print(f"❌ {filename} 저장 실패: {e}")
+        print(f"❌ {filepath.name} 저장 실패: {e}")
         raise
 
-# 모든 파일 저장 시도
-try:
-    save_json('dashboard_data.json', dashboard_data)
-    save_json('weekly_reports.json', weekly_reports)
-    save_json('schedules.json', schedules)
-    save_json('staff_profiles.json', staff_profiles)
-    save_json('evaluation_manual.json', evaluation_manual)
-    save_json('business_cards.json', business_cards)
-    print("\n✅ 6개의 더미 데이터 파일이 'data/' 폴더에 생성되었습니다.")
-except Exception as e:
-    print(f"\n❌ 데이터 생성 중 오류 발생: {e}")
-    exit(1)
 
+def generate_all(config: GeneratorConfig, data_dir: Path = Path('data')) -> Dict[str, int]:
+    """
+    모든 더미 데이터 파일과 집계 파일을 생성합니다.
+
+    Args:
+        config: 생성 규모와 시드
+        data_dir: 저장 폴더
+
+    Returns:
+        파일별 레코드 수
+    """
+    data_dir.mkdir(parents=True, exist_ok=True)
+    counts: Dict[str, int] = {}
+    pool = ProcessPoolExecutor(max_workers=config.workers) if config.workers > 1 else None
+    try:
+        dashboard_data = generate_dashboard_data(config)
+        save_json(data_dir / 'dashboard_data.json', dashboard_data)
+        counts['dashboard_data.json'] = len(dashboard_data["students"])
+
+        report_chunks = -(-config.reports // config.chunk_size)
+        counts['weekly_reports.json'] = write_json_array(
+            data_dir / 'weekly_reports.json', _chunks(generate_report_chunk, config, report_chunks, pool)
+        )
+        print(f"✅ weekly_reports.json 저장 완료 ({counts['weekly_reports.json']:,}건)")
+
+        # 일정 집계에는 날짜만 필요하므로 레코드 대신 날짜만 모아 둠
+        schedule_dates: List[str] = []
+        staff_per_chunk = max(1, config.chunk_size // max(config.days, 1))
+        schedule_chunks = -(-config.staff // staff_per_chunk)
+        counts['schedules.json'] = write_json_array(
+            data_dir / 'schedules.json', _chunks(generate_schedule_chunk, config, schedule_chunks, pool),
+            on_record=lambda record: schedule_dates.append(record["date"])
+        )
+        print(f"✅ schedules.json 저장 완료 ({counts['schedules.json']:,}건)")
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    for filename, records in (
+        ('staff_profiles.json', generate_staff_profiles(config)),
+        ('evaluation_manual.json', generate_evaluation_manual(config)),
+        ('business_cards.json', generate_business_cards(config)),
+    ):
+        save_json(data_dir / filename, records)
+        counts[filename] = len(records)
+
+    # 대시보드 집계 (원본 데이터셋에서 미리 계산, 집계 시각도 기준 날짜로 고정)
+    # 앱이 집계 이후 바뀐 원본을 알아볼 수 있도록 저장된 원본 파일의 blob SHA를 기록
+    start_time = _start_time(config)
+    dashboard_version = git_blob_sha((data_dir / 'dashboard_data.json').read_bytes())
+    aggregates = update_aggregates(None, AGGREGATE_FILENAME, 'dashboard_data.json', dashboard_data,
+                                   dashboard_version, start_time)
+    aggregates = update_aggregates(aggregates, AGGREGATE_FILENAME, 'schedules.json',
+                                   ({"date": d} for d in schedule_dates),
+                                   git_blob_sha((data_dir / 'schedules.json').read_bytes()), start_time)
+    kpi_history = append_kpi_snapshot(generate_kpi_history(config), aggregates["kpi"], start_time)
+    aggregates["kpi_deltas"] = compute_kpi_deltas(kpi_history)
+    save_json(data_dir / KPI_HISTORY_FILENAME, kpi_history)
+    save_json(data_dir / AGGREGATE_FILENAME, aggregates)
+    save_json(data_dir / CUBE_FILENAME, update_aggregates(None, CUBE_FILENAME, 'dashboard_data.json', dashboard_data,
+                                                          dashboard_version, start_time))
+    return counts
+
+
+def parse_args(argv: Optional[List[str]] = None) -> GeneratorConfig:
+    """명령행 인자를 GeneratorConfig로 변환합니다."""
+    parser = argparse.ArgumentParser(description="KDI 스마트 행정 플랫폼 더미 데이터 생성")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="난수 시드 (같은 시드와 인자면 같은 데이터)")
+    parser.add_argument("--start-date", type=date.fromisoformat, default=DEFAULT_START_DATE,
+                        help=f"기준 날짜 YYYY-MM-DD (기본값: {DEFAULT_START_DATE.isoformat()})")
+    parser.add_argument("--reports", type=int, default=5, help="주간보고서 수")
+    parser.add_argument("--report-weeks", type=int, default=None, help="보고서를 분산할 기간 (주, 기본값: 보고서 수와 52 중 작은 값)")
+    parser.add_argument("--staff", type=int, default=4, help="직원 수 (일정/프로필)")
+    parser.add_argument("--days", type=int, default=5, help="일정 기간 (일)")
+    parser.add_argument("--departments", type=int, default=4, help="부서 수")
+    parser.add_argument("--cards", type=int, default=2, help="명함 수")
+    parser.add_argument("--manual", type=int, default=2, help="기관평가 항목 수")
+    parser.add_argument("--kpi-days", type=int, default=730, help="KPI 이력 기간 (일)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="한 번에 생성/기록할 레코드 수")
+    parser.add_argument("--workers", type=int, default=1, help="병렬 생성 프로세스 수")
+    args = parser.parse_args(argv)
+    if min(args.reports, args.staff, args.days, args.departments, args.cards, args.manual, args.kpi_days) < 0:
+        parser.error("레코드 수와 기간은 0 이상이어야 합니다.")
+    if args.chunk_size < 1 or args.workers < 1 or args.departments < 1 or args.kpi_days < 1:
+        parser.error("--chunk-size, --workers, --departments, --kpi-days는 1 이상이어야 합니다.")
+    if args.report_weeks is not None and args.report_weeks < 1:
+        parser.error("--report-weeks는 1 이상이어야 합니다.")
+    return GeneratorConfig(
+        seed=args.seed, start_date=args.start_date, reports=args.reports, report_weeks=args.report_weeks,
+        staff=args.staff, days=args.days, departments=args.departments, cards=args.cards,
+        manual=args.manual, kpi_days=args.kpi_days, chunk_size=args.chunk_size, workers=args.workers
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    config = parse_args(argv)
+    try:
+        counts = generate_all(config)
+        print(f"\n✅ {len(counts)}개의 더미 데이터 파일과 집계 파일들이 'data/' 폴더에 생성되었습니다. (seed={config.seed})")
+    except Exception as e:
+        print(f"\n❌ 데이터 생성 중 오류 발생: {e}")
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,9 @@ Streamlit Multi-page Application
 """
 
 import streamlit as st
-from utils.style import load_css, page_header, card_metric, safe_load_data, navigate_to_page
+from datetime import datetime
+from utils.style import load_css, page_header, card_metric, navigate_to_page
+from utils.dashboard import load_dashboard_aggregates
 
 # 1. 페이지 설정
 st.set_page_config(
@@ -17,9 +19,9 @@ st.set_page_config(
 # 2. Tailwind CSS 및 스타일 로드
 load_css()
 
-# 3. 데이터 로드 (요약 정보 표시용) - 에러 처리 포함
+# 3. 데이터 로드 (저장 시점에 미리 계산된 집계) - 에러 처리 포함
 default_kpi = {"total_students": 0, "partners": 0, "employment_rate": 0}
-dash_data = safe_load_data("dashboard_data.json", {"kpi": default_kpi})
+dash_data = load_dashboard_aggregates()
 
 # 4. 메인 헤더
 page_header(
@@ -29,18 +31,21 @@ page_header(
 
 # 5. 핵심 KPI 요약 (카드 형태) - HTML/Tailwind로 렌더링
 kpi = dash_data.get("kpi", default_kpi)
+# 증감은 KPI 이력에서 저장 시점에 계산됨
+kpi_deltas = dash_data.get("kpi_deltas", {})
 
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
-    st.markdown(card_metric("총 재학생 수", f"{kpi.get('total_students', 0):,}명", "+12%", "🎓", "text-[#155e34]"), unsafe_allow_html=True)
+    st.markdown(card_metric("총 재학생 수", f"{kpi.get('total_students', 0):,}명", kpi_deltas.get("total_students"), "🎓", "text-[#155e34]"), unsafe_allow_html=True)
 with col2:
-    st.markdown(card_metric("글로벌 파트너", f"{kpi.get('partners', 0):,}개", "+3", "🌍", "text-blue-600"), unsafe_allow_html=True)
+    st.markdown(card_metric("글로벌 파트너", f"{kpi.get('partners', 0):,}개", kpi_deltas.get("partners"), "🌍", "text-blue-600"), unsafe_allow_html=True)
 with col3:
-    st.markdown(card_metric("취업률", f"{kpi.get('employment_rate', 0):.1f}%", "+1.5%", "📈", "text-emerald-600"), unsafe_allow_html=True)
+    st.markdown(card_metric("취업률", f"{kpi.get('employment_rate', 0):.1f}%", kpi_deltas.get("employment_rate"), "📈", "text-emerald-600"), unsafe_allow_html=True)
 with col4:
-    # 오늘의 일정은 schedules 데이터에서 계산 (간단히 하드코딩)
-    st.markdown(card_metric("오늘의 일정", "5건", None, "📅", "text-slate-600"), unsafe_allow_html=True)
+    # 오늘의 일정은 schedules 집계에서 조회
+    today_count = dash_data.get("schedules_by_date", {}).get(datetime.now().strftime("%Y-%m-%d"), 0)
+    st.markdown(card_metric("오늘의 일정", f"{today_count}건", None, "📅", "text-slate-600"), unsafe_allow_html=True)
 
 st.markdown('<div class="h-8"></div>', unsafe_allow_html=True)  # 여백
 
@@ -5,8 +5,20 @@ JSON 파일 업로드 및 GitHub 저장 기능
 
 import streamlit as st
 import json
+from datetime import datetime
 from pathlib import Path
-from utils.github_handler import save_data, load_data
+from utils.github_handler import (
+    save_data, save_raw_data, load_data, load_data_with_version, list_data_files, get_watcher_stats, get_journal_stats,
+    get_shared_store_stats, get_fake_github, get_file_history, load_data_version, load_data_as_of, LARGE_FILE_THRESHOLD
+)
+from utils.json_stream import is_json_array, scan_array
+from utils.manual_ingest import import_manual_document
+from utils.pagination import render_pagination
+from utils.query_cache import get_query_cache
+from utils.rate_limiter import get_scheduler
+from utils.record_diff import diff_for_file
+from utils.shared_store import thaw
+from utils.storage_format import to_readable_json
 
 st.set_page_config(
     page_title="데이터 관리 - Admin",
@@ -30,18 +42,26 @@ uploaded_file = st.file_uploader(
 
 if uploaded_file is not None:
     # 파일 크기 검증
-    file_size = len(uploaded_file.getvalue())
+    file_size = uploaded_file.size
     if file_size > MAX_FILE_SIZE:
         st.error(f"❌ 파일 크기가 너무 큽니다. (현재: {file_size / 1024 / 1024:.2f}MB, 최대: {MAX_FILE_SIZE / 1024 / 1024}MB)")
     else:
         try:
-            # 파일 내용 읽기
-            content = uploaded_file.read().decode('utf-8')
-            data = json.loads(content)
-            
             # 파일명 추출
             filename = uploaded_file.name
             
+            # 업로드한 시점의 데이터 버전을 편집 기준으로 보관 (저장 시 그 사이 다른 사용자의 변경과 병합)
+            base_key = f"upload_base_{uploaded_file.file_id}"
+            if base_key not in st.session_state:
+                st.session_state[base_key] = load_data_with_version(filename)[1]
+            
+            # 최상위가 배열이면 스트리밍으로 검증하며 앞부분 레코드만 보관
+            summary = scan_array(uploaded_file) if is_json_array(uploaded_file) else None
+            data = None
+            if summary is None:
+                data = json.load(uploaded_file)
+                uploaded_file.seek(0)
+            
             # 미리보기 섹션
             st.success(f"✅ 파일 업로드 성공: {filename} ({file_size / 1024:.2f}KB)")
             
@@ -49,17 +69,25 @@ if uploaded_file is not None:
             
             with col1:
                 st.subheader("📄 파일 미리보기")
-                st.json(data)
+                if summary is None:
+                    st.json(data)
+                else:
+                    if summary["count"] > len(summary["preview"]):
+                        st.caption(f"전체 {summary['count']:,}개 중 앞 {len(summary['preview'])}개 레코드")
+                    st.json(summary["preview"])
             
             with col2:
                 st.subheader("📊 데이터 정보")
                 st.metric("파일 크기", f"{file_size / 1024:.2f} KB")
-                st.metric("데이터 타입", type(data).__name__)
+                st.metric("데이터 타입", "list" if summary is not None else type(data).__name__)
                 
-                if isinstance(data, dict):
+                if summary is not None:
+                    st.metric("항목 개수", summary["count"])
+                    st.caption("항목 타입: " + ", ".join(f"{t} {n:,}개" for t, n in summary["item_types"].items()))
+                    if summary["fields"]:
+                        st.caption("필드: " + ", ".join(summary["fields"]))
+                elif isinstance(data, dict):
                     st.metric("키 개수", len(data))
-                elif isinstance(data, list):
-                    st.metric("항목 개수", len(data))
             
             # GitHub 저장 버튼
             st.markdown("---")
@@ -67,9 +95,16 @@ if uploaded_file is not None:
             
             if st.button("🚀 GitHub에 저장하기", type="primary", use_container_width=True):
                 with st.spinner("GitHub에 저장 중..."):
-                    success = save_data(filename, data)
+                    if file_size > LARGE_FILE_THRESHOLD:
+                        # 대용량 파일은 재직렬화 없이 원본 바이트를 스트리밍 저장
+                        success = save_raw_data(filename, uploaded_file, st.session_state[base_key])
+                    else:
+                        success = save_data(filename, data if data is not None else json.load(uploaded_file),
+                                            st.session_state[base_key])
                     
                     if success:
+                        # 다시 저장하면 그때의 최신 버전을 기준으로 삼음
+                        st.session_state.pop(base_key, None)
                         st.success(f"✅ {filename} 파일이 GitHub에 성공적으로 저장되었습니다!")
                         st.balloons()
                     else:
@@ -81,24 +116,271 @@ if uploaded_file is not None:
         except Exception as e:
             st.error(f"❌ 파일 처리 중 오류 발생: {e}")
 
-# 현재 데이터 파일 목록
+# 평가 매뉴얼 문서 가져오기 (마크다운/텍스트 → evaluation_manual.json)
+st.markdown("---")
+st.header("📚 평가 매뉴얼 가져오기")
+
+manual_file = st.file_uploader(
+    "평가 매뉴얼 문서를 선택하세요 (마크다운/텍스트)",
+    type=['md', 'markdown', 'txt'],
+    help="카테고리는 상위 제목(#), 평가 항목은 그 아래 제목(##), '가이드라인:' / '전년도 피드백:'으로 필드를 구분합니다.",
+    key="manual_upload"
+)
+
+if manual_file is not None:
+    # 문서를 올린 시점의 매뉴얼 버전을 편집 기준으로 보관
+    manual_base_key = f"manual_base_{manual_file.file_id}"
+    if manual_base_key not in st.session_state:
+        st.session_state[manual_base_key] = load_data_with_version("evaluation_manual.json")[1]
+    
+    level_option = st.selectbox(
+        "카테고리 제목 단계",
+        ["자동", 1, 2, 3],
+        help="문서 제목 아래에 카테고리가 있으면 자동 판별이 맞지 않을 수 있습니다."
+    )
+    st.warning("⚠️ 가져오면 기존 evaluation_manual.json 내용이 문서 내용으로 교체됩니다.")
+    
+    if st.button("📥 매뉴얼 가져오기", type="primary", use_container_width=True):
+        progress_bar = st.progress(0.0, text="문서 읽는 중...")
+        result = import_manual_document(
+            manual_file,
+            st.session_state[manual_base_key],
+            numbered=manual_file.name.endswith('.txt'),
+            category_level=None if level_option == "자동" else level_option,
+            progress=lambda ratio, lines, records: progress_bar.progress(
+                ratio, text=f"{lines:,}줄 처리 · 평가 항목 {records:,}개"
+            )
+        )
+        progress_bar.empty()
+        if result is not None:
+            st.session_state.pop(manual_base_key, None)
+            st.success(f"✅ 평가 항목 {result.records:,}개 ({len(result.categories)}개 카테고리)를 가져왔습니다.")
+            for warning in result.warnings[:20]:
+                st.warning(f"⚠️ {warning}")
+            if len(result.warnings) > 20:
+                st.caption(f"외 경고 {len(result.warnings) - 20:,}건")
+
+# 현재 데이터 파일 목록 (메타데이터만 조회, 내용은 파일을 열 때만 로드)
 st.markdown("---")
 st.header("📁 현재 데이터 파일 목록")
 
-data_files = [
-    "dashboard_data.json",
-    "weekly_reports.json",
-    "schedules.json",
-    "staff_profiles.json",
-    "evaluation_manual.json",
-    "business_cards.json"
-]
-
-for filename in data_files:
-    with st.expander(f"📄 {filename}"):
-        data = load_data(filename)
-        if data:
-            st.json(data)
+data_files = list_data_files()
+
+if not data_files:
+    st.warning("⚠️ 데이터 파일을 찾을 수 없습니다.")
+else:
+    st.dataframe(
+        [
+            {
+                "파일명": f["name"],
+                "크기 (KB)": round(f["size"] / 1024, 1),
+                "SHA": f["sha"][:7],
+                "마지막 커밋": f["last_commit"],
+                "레코드 수": f["records"]
+            }
+            for f in data_files
+        ],
+        use_container_width=True,
+        hide_index=True
+    )
+    st.caption("레코드 수는 해당 버전의 파일을 한 번 이상 연 경우에만 표시됩니다.")
+    
+    selected_file = st.selectbox(
+        "내용을 확인할 파일을 선택하세요",
+        [f["name"] for f in data_files],
+        index=None,
+        placeholder="파일 선택"
+    )
+    
+    if selected_file:
+        data = load_data(selected_file)
+        if data is None:
+            st.warning(f"⚠️ {selected_file} 파일을 찾을 수 없습니다.")
         else:
-            st.warning(f"⚠️ {filename} 파일을 찾을 수 없습니다.")
+            # 딕셔너리는 최상위 키를 골라 해당 값만 표시
+            records = data
+            selected_key = None
+            if isinstance(data, dict):
+                st.caption(f"최상위 키 {len(data)}개")
+                selected_key = st.selectbox("표시할 키", list(data.keys()), key="viewer_key")
+                records = data[selected_key]
+            
+            if isinstance(records, list):
+                page = render_pagination(records, key="viewer", page_size=10,
+                                         reset_on=(selected_file, selected_key))
+                st.json(page.items)
+            else:
+                st.json(records)
+            
+            # 압축 형식으로 저장된 파일도 사람이 읽는 JSON으로 내려받기
+            st.download_button(
+                "⬇️ JSON으로 내보내기",
+                data=to_readable_json(data),
+                file_name=selected_file,
+                mime="application/json"
+            )
+
+# 버전 기록 (GitHub 커밋 기준 과거 버전 조회 및 비교)
+st.markdown("---")
+st.header("🕰️ 버전 기록")
+
+history_file = st.selectbox(
+    "기록을 확인할 파일을 선택하세요",
+    [f["name"] for f in data_files],
+    index=None,
+    placeholder="파일 선택",
+    key="history_file"
+)
+
+if history_file:
+    history = get_file_history(history_file)
+    if not history:
+        st.info("조회할 수 있는 버전 기록이 없습니다.")
+    else:
+        st.dataframe(
+            [
+                {"커밋": h["commit"][:7], "날짜": h["date"], "작성자": h["author"], "메시지": h["message"]}
+                for h in history
+            ],
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        # 두 버전 레코드 단위 비교
+        labels = {h["commit"]: f"{h['date']} · {h['commit'][:7]} · {h['message']}" for h in history}
+        commits = list(labels)
+        col1, col2 = st.columns(2)
+        with col1:
+            old_commit = st.selectbox("이전 버전", commits, index=min(1, len(commits) - 1),
+                                      format_func=labels.get, key="history_old")
+        with col2:
+            new_commit = st.selectbox("비교할 버전", commits, index=0, format_func=labels.get, key="history_new")
+        
+        if old_commit != new_commit:
+            diff = diff_for_file(
+                history_file,
+                load_data_version(history_file, old_commit),
+                load_data_version(history_file, new_commit)
+            )
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                st.metric("추가", f"{len(diff.added):,}")
+            with col2:
+                st.metric("삭제", f"{len(diff.removed):,}")
+            with col3:
+                st.metric("변경", f"{len(diff.changed):,}")
+            with col4:
+                st.metric("동일", f"{diff.unchanged:,}")
+            
+            if diff.is_empty:
+                st.success("✅ 두 버전의 레코드가 같습니다.")
+            if diff.added:
+                with st.expander(f"➕ 추가된 레코드 ({len(diff.added):,})"):
+                    page = render_pagination(diff.added, key="diff_added", page_size=10,
+                                             reset_on=(history_file, old_commit, new_commit))
+                    st.json(thaw(list(page.items)))
+            if diff.removed:
+                with st.expander(f"➖ 삭제된 레코드 ({len(diff.removed):,})"):
+                    page = render_pagination(diff.removed, key="diff_removed", page_size=10,
+                                             reset_on=(history_file, old_commit, new_commit))
+                    st.json(thaw(list(page.items)))
+            if diff.changed:
+                with st.expander(f"✏️ 변경된 레코드 ({len(diff.changed):,})"):
+                    page = render_pagination(diff.changed, key="diff_changed", page_size=10,
+                                             reset_on=(history_file, old_commit, new_commit))
+                    for change in page.items:
+                        st.markdown(f"**{change['key']}** · 변경 필드: {', '.join(change['fields']) or '(전체)'}")
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.json(thaw(change["before"]))
+                        with col2:
+                            st.json(thaw(change["after"]))
+        
+        # 특정 날짜 기준 조회
+        as_of = st.date_input("날짜 기준으로 보기", value=None, key="history_as_of")
+        if as_of:
+            snapshot = load_data_as_of(history_file, datetime.combine(as_of, datetime.max.time()))
+            if snapshot is None:
+                st.info(f"{as_of} 이전에는 {history_file} 파일이 없었습니다.")
+            else:
+                st.caption(f"{as_of} 기준 레코드 {len(snapshot):,}개")
+                st.download_button(
+                    "⬇️ 이 시점 데이터 내보내기",
+                    data=to_readable_json(thaw(snapshot)),
+                    file_name=f"{as_of}_{history_file}",
+                    mime="application/json"
+                )
+
+# 검색 캐시 통계
+st.markdown("---")
+st.header("🧮 검색 캐시 통계")
+
+cache_stats = get_query_cache().stats()
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.metric("캐시 항목", f"{cache_stats['size']:,} / {cache_stats['max_entries']:,}")
+with col2:
+    st.metric("히트율", f"{cache_stats['hit_rate'] * 100:.1f}%")
+with col3:
+    st.metric("히트 / 미스", f"{cache_stats['hits']:,} / {cache_stats['misses']:,}")
+with col4:
+    st.metric("제거된 항목", f"{cache_stats['evictions']:,}")
+
+if st.button("🗑️ 검색 캐시 비우기"):
+    removed = get_query_cache().invalidate()
+    st.success(f"✅ {removed}개의 캐시 항목을 삭제했습니다.")
 
+# GitHub API 요청 스케줄러 상태
+st.markdown("---")
+st.header("🚦 GitHub API 요청 현황")
+
+scheduler_stats = get_scheduler().stats()
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    st.metric("버킷 토큰", f"{scheduler_stats['tokens']} / {scheduler_stats['capacity']}")
+with col2:
+    if scheduler_stats["limit"] < 0:
+        st.metric("남은 시간당 할당량", "-")
+    else:
+        st.metric("남은 시간당 할당량", f"{scheduler_stats['remaining']:,} / {scheduler_stats['limit']:,}")
+with col3:
+    st.metric("대기 / 제한된 요청", f"{scheduler_stats['waits']:,} / {scheduler_stats['throttled']:,}")
+
+watcher_stats = get_watcher_stats()
+if watcher_stats is None:
+    st.caption("데이터 변경 감시: 꺼짐 (GitHub 설정 필요)")
+else:
+    status = "정상" if watcher_stats["fresh"] else "확인 지연"
+    if watcher_stats["last_error"]:
+        status = f"오류 ({watcher_stats['last_error']})"
+    head = (watcher_stats["head"] or "-")[:7]
+    st.caption(
+        f"데이터 변경 감시: {status} · {watcher_stats['interval']:.0f}초 간격 · "
+        f"확인 {watcher_stats['polls']:,}회 · 변경 감지 {watcher_stats['changes']:,}회 · head {head}"
+    )
+
+journal_stats = get_journal_stats()
+if journal_stats["pending"] or journal_stats["failed"]:
+    st.warning(
+        f"⏳ GitHub 반영 대기 중인 저장 {journal_stats['pending']}건"
+        + (f", 반영 실패 {journal_stats['failed']}건 ({', '.join(journal_stats['failed_files'])})" if journal_stats["failed"] else "")
+        + (f" · 마지막 오류: {journal_stats['last_error']}" if journal_stats["last_error"] else "")
+    )
+else:
+    st.caption("저장 저널: 대기 중인 저장 없음")
+
+fake_github = get_fake_github()
+if fake_github is not None:
+    fake_stats = fake_github.stats()
+    st.info(
+        f"🧪 GitHub 에뮬레이터 사용 중 (FAKE_GITHUB) · 요청 {sum(fake_stats['calls'].values()):,}회 · "
+        f"주입된 오류 {sum(fake_stats['errors'].values()):,}회 · 누적 지연 {fake_stats['latency_seconds']:.1f}초"
+    )
+
+shared_stats = get_shared_store_stats()
+st.caption(
+    f"공유 데이터셋: {shared_stats['datasets']}개 · "
+    f"재사용 {shared_stats['hits']:,}회 · 변환 {shared_stats['builds']:,}회"
+)
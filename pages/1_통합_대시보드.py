@@ -4,9 +4,10 @@
 """
 
 import streamlit as st
-import plotly.express as px
-import pandas as pd
-from utils.github_handler import load_data
+from utils.github_handler import load_shared_data_with_version
+from utils.dashboard import load_dashboard_aggregates, get_figure_spec, get_cube, get_kpi_trend
+from utils.timeseries import KPI_HISTORY_FILENAME, KPI_LABELS
+from utils.aggregates import CUBE_FILENAME
 
 st.set_page_config(
     page_title="통합 대시보드",
@@ -16,8 +17,19 @@ st.set_page_config(
 
 st.title("📊 통합 대시보드")
 
-# 데이터 로드
-data = load_data("dashboard_data.json")
+# KPI 추이 조회 기간 (일, None이면 전체)
+TREND_RANGES = {"최근 90일": 90, "최근 1년": 365, "전체": None}
+
+# 드릴다운 단계 (차원, 표시명)
+DRILL_LEVELS = [
+    ("region", "지역"),
+    ("country", "국가"),
+    ("program", "프로그램"),
+    ("cohort_year", "입학 연도")
+]
+
+# 데이터 로드 (저장 시점에 미리 계산된 집계)
+data = load_dashboard_aggregates()
 
 if not data:
     st.error("❌ 데이터를 불러올 수 없습니다.")
@@ -27,47 +39,59 @@ if not data:
 st.header("📈 주요 지표 (KPI)")
 
 kpi = data.get("kpi", {})
+kpi_deltas = data.get("kpi_deltas", {})
 col1, col2, col3 = st.columns(3)
 
 with col1:
     st.metric(
         label="재학생 수",
-        value=f"{kpi.get('total_students', 0):,}명"
+        value=f"{kpi.get('total_students', 0):,}명",
+        delta=kpi_deltas.get("total_students")
     )
 
 with col2:
     st.metric(
         label="파트너 기관 수",
-        value=f"{kpi.get('partners', 0):,}개"
+        value=f"{kpi.get('partners', 0):,}개",
+        delta=kpi_deltas.get("partners")
     )
 
 with col3:
     st.metric(
         label="취업률",
-        value=f"{kpi.get('employment_rate', 0):.1f}%"
+        value=f"{kpi.get('employment_rate', 0):.1f}%",
+        delta=kpi_deltas.get("employment_rate")
     )
 
+# KPI 추이 (이력 시계열, 다운샘플링하여 표시)
+kpi_history, history_version = load_shared_data_with_version(KPI_HISTORY_FILENAME)
+kpi_history = kpi_history or []
+if kpi_history:
+    with st.expander("📉 KPI 추이"):
+        col1, col2 = st.columns(2)
+        with col1:
+            trend_field = st.selectbox("지표", list(KPI_LABELS), format_func=KPI_LABELS.get, key="trend_field")
+        with col2:
+            trend_range = st.selectbox("기간", list(TREND_RANGES), key="trend_range")
+        
+        trend_rows = get_kpi_trend(kpi_history, history_version, trend_field, TREND_RANGES[trend_range])
+        if trend_rows:
+            st.line_chart(trend_rows, x="timestamp", y=trend_field, x_label="날짜", y_label=KPI_LABELS[trend_field])
+            st.caption(f"{len(trend_rows):,}개 포인트 표시 (전체 이력 {len(kpi_history):,}건)")
+        else:
+            st.info(f"{trend_range} 동안 기록된 KPI 이력이 없습니다. 기간을 늘려 확인해주세요.")
+
 # 재학생 현황 (Pie Chart)
 st.markdown("---")
 st.header("🌍 지역별 재학생 현황")
 
-students_by_region = data.get("students_by_region", [])
-if students_by_region:
-    df_region = pd.DataFrame(students_by_region)
-    
-    fig_pie = px.pie(
-        df_region,
-        values='count',
-        names='region',
-        title='지역별 재학생 분포',
-        color_discrete_sequence=px.colors.qualitative.Set3
-    )
-    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+fig_pie = get_figure_spec(data, "students_by_region")
+if fig_pie:
     st.plotly_chart(fig_pie, use_container_width=True)
     
     # 데이터 테이블
     with st.expander("📋 상세 데이터"):
-        st.dataframe(df_region, use_container_width=True)
+        st.dataframe(data.get("students_by_region", []), use_container_width=True)
 else:
     st.info("데이터가 없습니다.")
 
@@ -75,25 +99,72 @@ else:
 st.markdown("---")
 st.header("🤝 MOU 파트너 현황")
 
-mou_partners = data.get("mou_partners", [])
-if mou_partners:
-    df_mou = pd.DataFrame(mou_partners)
-    
-    fig_bar = px.bar(
-        df_mou,
-        x='name',
-        y='year',
-        color='country',
-        title='MOU 파트너 기관 (체결 연도)',
-        labels={'name': '기관명', 'year': '체결 연도', 'country': '국가'},
-        color_discrete_sequence=px.colors.qualitative.Pastel
-    )
-    fig_bar.update_layout(xaxis_tickangle=-45)
+fig_bar = get_figure_spec(data, "partners_by_year")
+if fig_bar:
     st.plotly_chart(fig_bar, use_container_width=True)
     
     # 데이터 테이블
-    with st.expander("📋 상세 데이터"):
-        st.dataframe(df_mou, use_container_width=True)
+    with st.expander("📋 국가별 파트너 수"):
+        st.dataframe(data.get("partners_by_country", []), use_container_width=True)
 else:
     st.info("데이터가 없습니다.")
 
+# 재학생 드릴다운 (미리 계산된 큐브에서 조회)
+st.markdown("---")
+st.header("🔎 재학생 드릴다운")
+
+cube_data = load_dashboard_aggregates(CUBE_FILENAME)
+student_cube = get_cube(cube_data, "student_cube")
+
+if student_cube:
+    filters = {}
+    drill_cols = st.columns(len(DRILL_LEVELS))
+    for col, (dim, label) in zip(drill_cols, DRILL_LEVELS):
+        with col:
+            choice = st.selectbox(label, ["전체"] + student_cube.values(dim, filters), key=f"drill_{dim}")
+        if choice != "전체":
+            filters[dim] = choice
+    
+    cell = student_cube.get(filters)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("재학생 수", f"{cell['enrolled']:,}명")
+    with col2:
+        st.metric("졸업생 수", f"{cell['graduated']:,}명")
+    with col3:
+        rate = cell['employed'] / cell['graduated'] * 100 if cell['graduated'] else 0
+        st.metric("취업률", f"{rate:.1f}%")
+    
+    # 다음 단계 차원으로 분해
+    next_level = next(((dim, label) for dim, label in DRILL_LEVELS if dim not in filters), None)
+    if next_level:
+        dim, label = next_level
+        rows = student_cube.breakdown(dim, filters)
+        if rows:
+            st.subheader(f"{label}별 재학생 수")
+            st.bar_chart(rows, x=dim, y="enrolled", x_label=label, y_label="재학생 수")
+else:
+    st.info("레코드 단위 재학생 데이터가 없습니다.")
+
+# MOU 파트너 필터 (국가 × 체결 연도)
+st.markdown("---")
+st.header("🌐 MOU 파트너 검색")
+
+partner_cube = get_cube(cube_data, "partner_cube")
+
+if partner_cube:
+    col1, col2 = st.columns(2)
+    with col1:
+        partner_country = st.selectbox("국가", ["전체"] + partner_cube.values("country"), key="partner_country")
+    partner_filters = {} if partner_country == "전체" else {"country": partner_country}
+    with col2:
+        partner_year = st.selectbox("체결 연도", ["전체"] + partner_cube.values("year", partner_filters), key="partner_year")
+    if partner_year != "전체":
+        partner_filters["year"] = partner_year
+    
+    partner_names = partner_cube.members(partner_filters)
+    st.info(f"조건에 맞는 파트너 기관: {len(partner_names)}개")
+    if partner_names:
+        st.markdown(" ".join(f"`{name}`" for name in partner_names))
+else:
+    st.info("데이터가 없습니다.")
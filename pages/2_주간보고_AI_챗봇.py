@@ -4,7 +4,9 @@
 """
 
 import streamlit as st
-from utils.github_handler import load_data
+from utils.github_handler import load_shared_data_with_version
+from utils.query_cache import cached_search
+from utils.search import search_reports
 from datetime import datetime
 
 st.set_page_config(
@@ -16,7 +18,7 @@ st.set_page_config(
 st.title("🤖 주간보고 AI 챗봇")
 
 # 데이터 로드
-weekly_reports = load_data("weekly_reports.json")
+weekly_reports, reports_version = load_shared_data_with_version("weekly_reports.json")
 
 if not weekly_reports:
     st.error("❌ 데이터를 불러올 수 없습니다.")
@@ -31,32 +33,6 @@ if "messages" not in st.session_state:
         }
     ]
 
-# 키워드 매칭 함수
-def search_reports(query: str, reports: list) -> list:
-    """키워드 기반 보고서 검색"""
-    query_lower = query.lower()
-    results = []
-    
-    for report in reports:
-        score = 0
-        # 부서명 매칭
-        if query_lower in report.get("department", "").lower():
-            score += 10
-        # 요약 내용 매칭
-        if query_lower in report.get("summary", "").lower():
-            score += 5
-        # 이슈 매칭
-        for issue in report.get("issues", []):
-            if query_lower in issue.lower():
-                score += 8
-        
-        if score > 0:
-            results.append((report, score))
-    
-    # 점수순 정렬
-    results.sort(key=lambda x: x[1], reverse=True)
-    return [r[0] for r in results]
-
 # 채팅 메시지 표시
 for message in st.session_state.messages:
     with st.chat_message(message["role"]):
@@ -70,7 +46,7 @@ if prompt := st.chat_input("주간보고서에 대해 물어보세요..."):
         st.markdown(prompt)
     
     # 검색 수행
-    results = search_reports(prompt, weekly_reports)
+    results = cached_search("weekly_reports.json", reports_version, prompt, weekly_reports, search_reports)
     
     # 응답 생성
     with st.chat_message("assistant"):
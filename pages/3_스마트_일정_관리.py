@@ -5,9 +5,9 @@
 
 import streamlit as st
 import pandas as pd
-from utils.github_handler import load_data
+from utils.github_handler import query_records, distinct_values
+from utils.scheduling import WORK_SLOTS, busy_slots_by_staff, find_free_slots, group_by_date
 from datetime import datetime, timedelta
-from collections import defaultdict
 
 st.set_page_config(
     page_title="스마트 일정 관리",
@@ -17,16 +17,13 @@ st.set_page_config(
 
 st.title("📅 스마트 일정 관리")
 
-# 데이터 로드
-schedules = load_data("schedules.json")
+# 직원 목록 (색인된 이름 목록만 조회)
+staff_names = distinct_values("schedules.json", "name")
 
-if not schedules:
+if not staff_names:
     st.error("❌ 데이터를 불러올 수 없습니다.")
     st.stop()
 
-# 직원 목록 추출
-staff_names = sorted(list(set([s.get('name') for s in schedules if s.get('name')])))
-
 # 직원 선택
 st.header("👥 직원 선택")
 selected_staff = st.multiselect(
@@ -39,15 +36,11 @@ if not selected_staff:
     st.info("👆 직원을 선택해주세요.")
     st.stop()
 
-# 선택된 직원의 일정 필터링
-filtered_schedules = [s for s in schedules if s.get('name') in selected_staff]
+# 선택된 직원의 일정만 조회
+filtered_schedules = query_records("schedules.json", name=selected_staff)
 
 # 날짜별로 그룹화
-schedules_by_date = defaultdict(list)
-for schedule in filtered_schedules:
-    date = schedule.get('date')
-    if date:
-        schedules_by_date[date].append(schedule)
+schedules_by_date = group_by_date(filtered_schedules)
 
 # 날짜 선택
 st.markdown("---")
@@ -69,17 +62,8 @@ st.header(f"📋 {selected_date} 일정")
 
 date_schedules = schedules_by_date[selected_date]
 
-# 시간대 정의 (9:00 ~ 17:00)
-time_slots = [f"{h}:00" for h in range(9, 18)]
-
 # 각 직원별 바쁜 시간대
-staff_busy_times = {}
-for schedule in date_schedules:
-    name = schedule.get('name')
-    busy_slots = schedule.get('time_slots', [])
-    if name not in staff_busy_times:
-        staff_busy_times[name] = set()
-    staff_busy_times[name].update(busy_slots)
+staff_busy_times = busy_slots_by_staff(date_schedules)
 
 # 일정 테이블
 schedule_data = []
@@ -101,14 +85,8 @@ st.markdown("---")
 st.header("🕐 공통 빈 시간")
 
 if len(selected_staff) > 1:
-    # 모든 직원의 바쁜 시간대 합집합
-    all_busy_times = set()
-    for name in selected_staff:
-        if name in staff_busy_times:
-            all_busy_times.update(staff_busy_times[name])
-    
-    # 빈 시간대 계산
-    free_times = [t for t in time_slots if t not in all_busy_times]
+    # 빈 시간대 계산 (모든 직원의 바쁜 시간대 합집합 제외)
+    free_times = find_free_slots(staff_busy_times, selected_staff, WORK_SLOTS)
     
     if free_times:
         st.success(f"✅ **{len(free_times)}개의 공통 빈 시간대를 찾았습니다:**")
@@ -123,8 +101,7 @@ if len(selected_staff) > 1:
 else:
     # 단일 직원 선택 시
     if selected_staff[0] in staff_busy_times:
-        busy_times = staff_busy_times[selected_staff[0]]
-        free_times = [t for t in time_slots if t not in busy_times]
+        free_times = find_free_slots(staff_busy_times, selected_staff[:1], WORK_SLOTS)
         
         if free_times:
             st.success(f"✅ **{selected_staff[0]}님의 빈 시간대:**")
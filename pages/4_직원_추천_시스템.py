@@ -4,7 +4,11 @@
 """
 
 import streamlit as st
-from utils.github_handler import load_data
+from utils.github_handler import load_shared_data_with_version
+from utils.pagination import render_pagination
+from utils.autocomplete import get_autocomplete_index, render_suggestions
+from utils.query_cache import cached_search
+from utils.search import search_staff
 
 st.set_page_config(
     page_title="직원 추천 시스템",
@@ -15,7 +19,7 @@ st.set_page_config(
 st.title("👥 직원 추천 시스템")
 
 # 데이터 로드
-staff_profiles = load_data("staff_profiles.json")
+staff_profiles, profiles_version = load_shared_data_with_version("staff_profiles.json")
 
 if not staff_profiles:
     st.error("❌ 데이터를 불러올 수 없습니다.")
@@ -26,45 +30,17 @@ st.header("🔍 직원 검색")
 
 search_keyword = st.text_input(
     "키워드를 입력하세요 (전문성, 관심사, 부서명 등)",
-    placeholder="예: 학사관리, 데이터분석, 교학팀"
+    placeholder="예: 학사관리, 데이터분석, 교학팀",
+    key="staff_search"
 )
 
-# 검색 함수
-def search_staff(keyword: str, profiles: list) -> list:
-    """키워드 기반 직원 검색"""
-    if not keyword:
-        return profiles
-    
-    keyword_lower = keyword.lower()
-    results = []
-    
-    for profile in profiles:
-        score = 0
-        # 부서명 매칭
-        if keyword_lower in profile.get("dept", "").lower():
-            score += 10
-        # 전문성 매칭
-        for expertise in profile.get("expertise", []):
-            if keyword_lower in expertise.lower():
-                score += 8
-        # 관심사 매칭
-        for interest in profile.get("interests", []):
-            if keyword_lower in interest.lower():
-                score += 5
-        # 이름 매칭
-        if keyword_lower in profile.get("name", "").lower():
-            score += 3
-        
-        if score > 0:
-            results.append((profile, score))
-    
-    # 점수순 정렬
-    results.sort(key=lambda x: x[1], reverse=True)
-    return [r[0] for r in results]
+# 자동완성 후보 (이름/초성/접두어)
+autocomplete_index = get_autocomplete_index("staff_profiles.json", staff_profiles, profiles_version)
+render_suggestions(autocomplete_index, "staff_search")
 
 # 검색 결과
 if search_keyword:
-    results = search_staff(search_keyword, staff_profiles)
+    results = cached_search("staff_profiles.json", profiles_version, search_keyword, staff_profiles, search_staff)
     st.info(f"'{search_keyword}' 검색 결과: {len(results)}명")
 else:
     results = staff_profiles
@@ -77,10 +53,11 @@ st.header("👤 직원 프로필")
 if not results:
     st.warning("검색 결과가 없습니다.")
 else:
-    # 2열 그리드로 표시
+    # 현재 페이지만 2열 그리드로 표시
+    page = render_pagination(results, key="staff", reset_on=search_keyword)
     cols = st.columns(2)
     
-    for i, profile in enumerate(results):
+    for i, profile in enumerate(page.items):
         with cols[i % 2]:
             with st.container():
                 st.markdown("---")
@@ -120,7 +97,8 @@ if selected_dept and selected_dept != "전체":
     dept_staff = [p for p in staff_profiles if p.get('dept') == selected_dept]
     st.info(f"{selected_dept} 소속 직원: {len(dept_staff)}명")
     
-    for profile in dept_staff:
+    dept_page = render_pagination(dept_staff, key="dept_staff", reset_on=selected_dept)
+    for profile in dept_page.items:
         with st.expander(f"👤 {profile.get('name', 'N/A')}"):
             st.write("**부서:**", profile.get('dept', 'N/A'))
             st.write("**전문성:**", ", ".join(profile.get('expertise', [])))
@@ -1,10 +1,13 @@
 """
 기관평가 코칭 페이지
-평가 항목별 가이드라인 및 전년도 피드백 제공
+평가 항목별 가이드라인 및 전년도 피드백 제공, 관련 주간보고 이슈와 KPI 근거 연결
 """
 
 import streamlit as st
-from utils.github_handler import load_data
+from utils.github_handler import load_shared_data_with_version
+from utils.dashboard import load_dashboard_aggregates
+from utils.evaluation_index import get_evaluation_index
+from utils.timeseries import KPI_LABELS
 
 st.set_page_config(
     page_title="기관평가 코칭",
@@ -15,24 +18,89 @@ st.set_page_config(
 st.title("📋 기관평가 코칭")
 
 # 데이터 로드
-evaluation_manual = load_data("evaluation_manual.json")
+evaluation_manual, manual_version = load_shared_data_with_version("evaluation_manual.json")
 
 if not evaluation_manual:
     st.error("❌ 데이터를 불러올 수 없습니다.")
     st.stop()
 
+# 근거 자료 (없어도 매뉴얼은 표시)
+weekly_reports, reports_version = load_shared_data_with_version("weekly_reports.json")
+weekly_reports = weekly_reports or []
+kpi = load_dashboard_aggregates().get("kpi", {})
+
+# 검색 색인과 항목별 근거 연결 (데이터 버전별로 한 번만 계산)
+evaluation_index = get_evaluation_index(evaluation_manual, manual_version, weekly_reports, reports_version)
+
 st.info("""
 이 페이지에서는 기관평가 항목별 가이드라인과 전년도 피드백을 확인할 수 있습니다.
-각 평가 항목을 선택하여 상세 정보를 확인하세요.
+각 평가 항목을 선택하거나 검색하여 상세 정보와 관련 근거(주간보고 이슈, KPI)를 확인하세요.
 """)
 
-# 카테고리별로 그룹화
+
+def render_evidence(doc_id: int) -> None:
+    """평가 항목과 연결된 주간보고 이슈와 KPI를 표시합니다."""
+    related_kpis = evaluation_index.related_kpis(doc_id)
+    related_issues = evaluation_index.related_issues(doc_id)
+    if not related_kpis and not related_issues:
+        st.caption("연결된 근거 자료가 없습니다.")
+        return
+
+    if related_kpis:
+        st.markdown("#### 📊 관련 KPI")
+        cols = st.columns(len(related_kpis))
+        for col, (field, _) in zip(cols, related_kpis):
+            with col:
+                value = kpi.get(field)
+                if field == "employment_rate" and value is not None:
+                    value = f"{value:.1f}%"
+                st.metric(KPI_LABELS.get(field, field), value if value is not None else "-")
+
+    if related_issues:
+        st.markdown("#### 🔗 관련 주간보고 이슈")
+        for issue, score in related_issues:
+            latest = issue["occurrences"][0]
+            st.markdown(
+                f"- **{issue['text']}** · {latest['department']} {latest['date']}"
+                + (f" 외 {len(issue['occurrences']) - 1}건" if len(issue["occurrences"]) > 1 else "")
+                + (f" · [보고서]({latest['link']})" if latest.get("link") else "")
+                + f" (유사도 {score:.2f})"
+            )
+
+
+# 검색
+st.markdown("---")
+st.header("🔍 평가 항목 검색")
+
+search_query = st.text_input(
+    "검색어를 입력하세요 (평가 항목, 가이드라인, 전년도 피드백)",
+    placeholder="예: 장학금, 교원 확보, 규정",
+    key="evaluation_search"
+)
+
+if search_query:
+    matches = evaluation_index.search(search_query)
+    st.info(f"'{search_query}' 검색 결과: {len(matches)}개 항목")
+
+    for doc_id in matches:
+        item = evaluation_manual[doc_id]
+        with st.expander(f"📌 [{item.get('category', '기타')}] {item.get('criteria', 'N/A')}", expanded=len(matches) <= 3):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("### 💡 가이드라인")
+                st.info(item.get('guide', '가이드라인이 없습니다.'))
+            with col2:
+                st.markdown("### 📝 전년도 피드백")
+                st.warning(item.get('prev_feedback', '전년도 피드백이 없습니다.'))
+            render_evidence(doc_id)
+
+# 카테고리별로 그룹화 (평가 항목 번호)
 categories = {}
-for item in evaluation_manual:
+for doc_id, item in enumerate(evaluation_manual):
     category = item.get('category', '기타')
     if category not in categories:
         categories[category] = []
-    categories[category].append(item)
+    categories[category].append(doc_id)
 
 # 카테고리 선택
 st.markdown("---")
@@ -48,9 +116,10 @@ st.markdown("---")
 
 if selected_category == "전체":
     st.header("📋 전체 평가 항목")
-    for category, items in sorted(categories.items()):
+    for category, doc_ids in sorted(categories.items()):
         st.subheader(f"📂 {category}")
-        for item in items:
+        for doc_id in doc_ids:
+            item = evaluation_manual[doc_id]
             with st.expander(f"📌 {item.get('criteria', 'N/A')}"):
                 col1, col2 = st.columns(2)
                 
@@ -63,11 +132,13 @@ if selected_category == "전체":
                     st.warning(item.get('prev_feedback', '전년도 피드백이 없습니다.'))
                 
                 st.markdown(f"**카테고리:** {item.get('category', 'N/A')}")
+                render_evidence(doc_id)
 else:
     st.header(f"📂 {selected_category}")
-    items = categories[selected_category]
+    doc_ids = categories[selected_category]
     
-    for item in items:
+    for doc_id in doc_ids:
+        item = evaluation_manual[doc_id]
         with st.container():
             st.markdown("---")
             st.subheader(f"📌 {item.get('criteria', 'N/A')}")
@@ -89,6 +160,8 @@ else:
                 st.metric("카테고리", item.get('category', 'N/A'))
             with col4:
                 st.metric("평가 항목", item.get('criteria', 'N/A'))
+            
+            render_evidence(doc_id)
 
 # 통계 정보
 st.markdown("---")
@@ -110,7 +183,6 @@ with col3:
 st.markdown("---")
 st.subheader("📈 카테고리별 항목 수")
 
-category_counts = {cat: len(items) for cat, items in categories.items()}
+category_counts = {cat: len(doc_ids) for cat, doc_ids in categories.items()}
 for category, count in sorted(category_counts.items()):
     st.write(f"- **{category}**: {count}개 항목")
-
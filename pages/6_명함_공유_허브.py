@@ -5,7 +5,11 @@
 
 import streamlit as st
 import pandas as pd
-from utils.github_handler import load_data
+from utils.github_handler import load_shared_data_with_version
+from utils.pagination import render_pagination
+from utils.autocomplete import get_autocomplete_index, render_suggestions
+from utils.query_cache import cached_search
+from utils.search import search_cards
 
 st.set_page_config(
     page_title="명함 공유 허브",
@@ -15,8 +19,11 @@ st.set_page_config(
 
 st.title("💼 명함 공유 허브")
 
+# 기관별 통계에 표시할 최대 기관 수
+TOP_ORG_COUNT = 20
+
 # 데이터 로드
-business_cards = load_data("business_cards.json")
+business_cards, cards_version = load_shared_data_with_version("business_cards.json")
 
 if not business_cards:
     st.error("❌ 데이터를 불러올 수 없습니다.")
@@ -33,43 +40,17 @@ st.header("🔍 담당자 검색")
 
 search_keyword = st.text_input(
     "검색어를 입력하세요 (기관명, 담당자명, 이력 등)",
-    placeholder="예: World Bank, UNESCO, 입학설명회"
+    placeholder="예: World Bank, UNESCO, 입학설명회",
+    key="card_search"
 )
 
-# 검색 함수
-def search_cards(keyword: str, cards: list) -> list:
-    """키워드 기반 명함 검색"""
-    if not keyword:
-        return cards
-    
-    keyword_lower = keyword.lower()
-    results = []
-    
-    for card in cards:
-        score = 0
-        # 기관명 매칭
-        if keyword_lower in card.get("org", "").lower():
-            score += 10
-        # 담당자명 매칭
-        if keyword_lower in card.get("name", "").lower():
-            score += 8
-        # 직책 매칭
-        if keyword_lower in card.get("position", "").lower():
-            score += 5
-        # 이력 매칭
-        if keyword_lower in card.get("history", "").lower():
-            score += 6
-        
-        if score > 0:
-            results.append((card, score))
-    
-    # 점수순 정렬
-    results.sort(key=lambda x: x[1], reverse=True)
-    return [r[0] for r in results]
+# 자동완성 후보 (이름/초성/접두어)
+autocomplete_index = get_autocomplete_index("business_cards.json", business_cards, cards_version)
+render_suggestions(autocomplete_index, "card_search")
 
 # 검색 결과
 if search_keyword:
-    results = search_cards(search_keyword, business_cards)
+    results = cached_search("business_cards.json", cards_version, search_keyword, business_cards, search_cards)
     st.info(f"'{search_keyword}' 검색 결과: {len(results)}건")
 else:
     results = business_cards
@@ -82,9 +63,11 @@ st.header("📇 담당자 정보")
 if not results:
     st.warning("검색 결과가 없습니다.")
 else:
-    # 테이블 형식으로 표시
+    # 현재 페이지만 테이블로 구성
+    page = render_pagination(results, key="cards", reset_on=search_keyword)
+    
     table_data = []
-    for card in results:
+    for card in page.items:
         table_data.append({
             "이름": card.get('name', 'N/A'),
             "기관": card.get('org', 'N/A'),
@@ -93,15 +76,23 @@ else:
             "이력": card.get('history', 'N/A')
         })
     
-    df = pd.DataFrame(table_data)
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    df = pd.DataFrame(table_data, index=range(page.start + 1, page.end + 1))
+    st.dataframe(df, use_container_width=True)
     
-    # 상세 카드 뷰
+    # 상세 카드 뷰 (선택한 1건만 렌더링)
     st.markdown("---")
     st.subheader("📋 상세 정보")
     
-    for i, card in enumerate(results, 1):
-        with st.expander(f"💼 {i}. {card.get('name', 'N/A')} - {card.get('org', 'N/A')}"):
+    selected_index = st.selectbox(
+        "상세 정보를 볼 담당자를 선택하세요",
+        range(len(page.items)),
+        format_func=lambda i: f"{page.start + i + 1}. {page.items[i].get('name', 'N/A')} - {page.items[i].get('org', 'N/A')}",
+        key="cards_detail"
+    )
+    
+    if selected_index is not None:
+        card = page.items[selected_index]
+        with st.container(border=True):
             col1, col2 = st.columns(2)
             
             with col1:
@@ -135,8 +126,11 @@ if orgs:
     
     with col1:
         st.subheader("기관별 담당자 수")
-        for org, count in sorted(orgs.items(), key=lambda x: x[1], reverse=True):
+        top_orgs = sorted(orgs.items(), key=lambda x: x[1], reverse=True)
+        for org, count in top_orgs[:TOP_ORG_COUNT]:
             st.write(f"- **{org}**: {count}명")
+        if len(top_orgs) > TOP_ORG_COUNT:
+            st.caption(f"상위 {TOP_ORG_COUNT}개 기관만 표시합니다.")
     
     with col2:
         st.metric("전체 기관 수", len(orgs))
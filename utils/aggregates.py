@@ -0,0 +1,186 @@
+"""
+대시보드 집계 모듈
+원본 데이터셋이 저장될 때 KPI, 지역별 분포, 파트너 수 등을 미리 계산하여
+작은 집계 파일(dashboard_aggregates.json)로 보관합니다.
+드릴다운용 큐브는 크기가 더 크므로 별도 파일(dashboard_cubes.json)에 보관합니다.
+집계 파일과 KPI 이력은 원본과 같은 커밋으로 저장되며, 각 섹션에는 계산에 사용한 원본 버전이 기록됩니다.
+"""
+
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from utils.cube import build_partner_cube, build_student_cube
+from utils.timeseries import KPI_HISTORY_FILENAME, append_kpi_snapshot, compute_kpi_deltas, needs_kpi_snapshot
+
+# 상수 정의
+AGGREGATE_FILENAME = "dashboard_aggregates.json"
+CUBE_FILENAME = "dashboard_cubes.json"
+GRADUATED_STATUS = "graduated"
+
+
+def _count_rows(counter: Counter, key_name: str) -> List[Dict[str, Any]]:
+    """Counter를 [{key_name: 값, 'count': 개수}] 형태로 변환합니다 (개수 내림차순)."""
+    return [
+        {key_name: key, "count": count}
+        for key, count in sorted(counter.items(), key=lambda x: (-x[1], str(x[0])))
+    ]
+
+
+def compute_dashboard_section(dashboard_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    dashboard_data.json에서 KPI와 분포를 계산합니다.
+    레코드 단위 데이터(students, mou_partners)가 있으면 그로부터 계산하고,
+    없는 항목만 수기로 관리되는 kpi/students_by_region 값을 사용합니다.
+
+    Args:
+        dashboard_data: dashboard_data.json 내용
+
+    Returns:
+        집계 섹션 (kpi, students_by_region, partners_by_country, partners_by_year)
+    """
+    manual_kpi = dashboard_data.get("kpi", {})
+    students = dashboard_data.get("students")
+    partners = dashboard_data.get("mou_partners", [])
+
+    kpi = {
+        "total_students": manual_kpi.get("total_students", 0),
+        "partners": manual_kpi.get("partners", 0),
+        "employment_rate": manual_kpi.get("employment_rate", 0),
+    }
+
+    if students:
+        enrolled = [s for s in students if s.get("status") != GRADUATED_STATUS]
+        graduates = [s for s in students if s.get("status") == GRADUATED_STATUS]
+        employed = sum(1 for s in graduates if s.get("employed"))
+
+        kpi["total_students"] = len(enrolled)
+        kpi["total_graduates"] = len(graduates)
+        if graduates:
+            kpi["employment_rate"] = round(employed / len(graduates) * 100, 1)
+        students_by_region = _count_rows(Counter(s.get("region", "Others") for s in enrolled), "region")
+    else:
+        students_by_region = list(dashboard_data.get("students_by_region", []))
+
+    if partners:
+        kpi["partners"] = len(partners)
+
+    partners_by_year_country = Counter((p.get("year"), p.get("country", "기타")) for p in partners)
+
+    return {
+        "kpi": kpi,
+        "students_by_region": students_by_region,
+        "partners_by_country": _count_rows(Counter(p.get("country", "기타") for p in partners), "country"),
+        "partners_by_year": [
+            {"year": year, "country": country, "count": count}
+            for (year, country), count in sorted(partners_by_year_country.items(), key=lambda x: (str(x[0][0]), x[0][1]))
+        ],
+    }
+
+
+def compute_schedule_section(schedules: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    schedules.json에서 날짜별 일정 수를 계산합니다.
+
+    Args:
+        schedules: schedules.json 내용
+
+    Returns:
+        집계 섹션 (schedules_by_date)
+    """
+    return {
+        "schedules_by_date": dict(sorted(Counter(s.get("date") for s in schedules if s.get("date")).items()))
+    }
+
+
+def compute_cube_section(dashboard_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    dashboard_data.json의 레코드 단위 데이터로 드릴다운 큐브를 계산합니다.
+
+    Args:
+        dashboard_data: dashboard_data.json 내용
+
+    Returns:
+        집계 섹션 (student_cube, partner_cube). 레코드가 없으면 값은 None
+    """
+    students = dashboard_data.get("students")
+    partners = dashboard_data.get("mou_partners")
+    return {
+        "student_cube": build_student_cube(students) if students else None,
+        "partner_cube": build_partner_cube(partners) if partners else None,
+    }
+
+
+# 집계 파일 → {원본 파일 → 집계 섹션 계산 함수}
+MATERIALIZERS: Dict[str, Dict[str, Callable[[Any], Dict[str, Any]]]] = {
+    AGGREGATE_FILENAME: {
+        "dashboard_data.json": compute_dashboard_section,
+        "schedules.json": compute_schedule_section,
+    },
+    CUBE_FILENAME: {
+        "dashboard_data.json": compute_cube_section,
+    },
+}
+
+
+def get_materialized_targets(filename: str) -> List[str]:
+    """원본 파일이 저장될 때 갱신해야 하는 집계 파일 목록을 반환합니다."""
+    return [target for target, sources in MATERIALIZERS.items() if filename in sources]
+
+
+def update_aggregates(aggregates: Optional[Dict[str, Any]], target: str, filename: str, data: Any,
+                      version: Optional[str] = None, materialized_at: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    기존 집계에 원본 파일 하나의 섹션을 다시 계산하여 반영합니다.
+
+    Args:
+        aggregates: 기존 집계 데이터 (없으면 None)
+        target: 집계 파일명 (MATERIALIZERS의 키)
+        filename: 저장된 원본 파일명
+        data: 원본 파일 내용
+        version: 원본 파일의 데이터 버전 (Git blob SHA)
+        materialized_at: 집계 시각 기록값 (None이면 현재 시각)
+
+    Returns:
+        갱신된 집계 데이터
+    """
+    updated = dict(aggregates or {})
+    updated.update(MATERIALIZERS[target][filename](data))
+
+    sources = dict(updated.get("sources", {}))
+    sources[filename] = {
+        "version": version,
+        "materialized_at": (materialized_at or datetime.now()).isoformat(timespec="seconds")
+    }
+    updated["sources"] = sources
+    return updated
+
+
+def derive_files(filename: str, data: Any, version: Optional[str], read: Callable[[str], Any],
+                 targets: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    원본 파일 하나가 바뀌었을 때 함께 갱신할 파생 파일(집계 파일, KPI 이력)의 새 내용을 계산합니다.
+
+    Args:
+        filename: 바뀐 원본 파일명
+        data: 원본 파일 내용
+        version: 원본 파일의 데이터 버전 (Git blob SHA, 집계 섹션에 기록)
+        read: 파생 파일명 → 같은 시점의 현재 내용 (없으면 None, 반환값은 수정하지 않음)
+        targets: 계산할 집계 파일 (None이면 전체)
+
+    Returns:
+        {파생 파일명: 새 내용}. KPI 이력은 새 스냅샷이 필요할 때만 포함
+    """
+    derived: Dict[str, Any] = {}
+    for target in get_materialized_targets(filename):
+        if targets is not None and target not in targets:
+            continue
+        updated = update_aggregates(read(target) or {}, target, filename, data, version)
+        # KPI가 다시 계산되면 이력에 기록하고 증감도 함께 저장
+        if "kpi" in updated and filename == "dashboard_data.json":
+            history = read(KPI_HISTORY_FILENAME) or []
+            if needs_kpi_snapshot(history, updated["kpi"]):
+                history = append_kpi_snapshot(history, updated["kpi"])
+                derived[KPI_HISTORY_FILENAME] = history
+            updated["kpi_deltas"] = compute_kpi_deltas(history)
+        derived[target] = updated
+    return derived
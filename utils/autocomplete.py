@@ -0,0 +1,309 @@
+"""
+자동완성 모듈
+이름, 부서, 기관, 태그를 트라이(Trie)에 색인하여 접두어/초성 자동완성을 제공합니다.
+예: "ㄱㅊㅅ" → 김철수, "교학" → 교학팀
+"""
+
+import streamlit as st
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 상수 정의
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG_INTERVAL = 588  # 중성 21 × 종성 28
+CHOSEONG = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"
+]
+CHOSEONG_SET = frozenset(CHOSEONG)
+MAX_SUGGESTIONS_PER_NODE = 10  # 노드마다 미리 계산해 둘 상위 후보 수
+DEFAULT_SUGGESTION_LIMIT = 5
+
+# 파일별 색인 대상 필드: (필드명, 분류)
+AUTOCOMPLETE_FIELDS: Dict[str, List[Tuple[str, str]]] = {
+    "staff_profiles.json": [("name", "이름"), ("dept", "부서"), ("expertise", "태그"), ("interests", "태그")],
+    "business_cards.json": [("name", "이름"), ("org", "기관"), ("position", "직책")],
+}
+
+
+def get_choseong(text: str) -> str:
+    """
+    한글 음절을 초성으로 분해합니다. 한글이 아닌 문자는 소문자로 유지합니다.
+
+    Args:
+        text: 원본 문자열 (예: '김철수')
+
+    Returns:
+        초성 문자열 (예: 'ㄱㅊㅅ')
+    """
+    chars = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            chars.append(CHOSEONG[(code - HANGUL_BASE) // CHOSEONG_INTERVAL])
+        else:
+            chars.append(ch.lower())
+    return "".join(chars)
+
+
+def has_choseong(query: str) -> bool:
+    """질의에 초성(자음) 문자가 포함되어 있는지 확인합니다."""
+    return any(ch in CHOSEONG_SET for ch in query)
+
+
+def _char_matches(query_ch: str, text_ch: str) -> bool:
+    """질의 문자 하나가 대상 문자와 일치하는지 확인합니다 (초성은 음절의 초성과 비교)."""
+    if query_ch in CHOSEONG_SET:
+        return get_choseong(text_ch) == query_ch
+    return query_ch == text_ch.lower()
+
+
+def matches_prefix(query: str, text: str) -> bool:
+    """음절과 초성이 섞인 질의(예: '김ㅊ')가 text의 접두어인지 확인합니다."""
+    if len(query) > len(text):
+        return False
+    return all(_char_matches(q, t) for q, t in zip(query, text))
+
+
+def contains_query(text: str, query: str) -> bool:
+    """
+    text에 query가 포함되어 있는지 확인합니다.
+    질의에 초성이 있으면 음절의 초성과 비교합니다 (예: 'ㄱㅊㅅ' in '김철수').
+
+    Args:
+        text: 검색 대상 문자열
+        query: 검색어 (소문자 변환 전 원본)
+
+    Returns:
+        포함 여부
+    """
+    query_lower = query.lower()
+    if not has_choseong(query_lower):
+        return query_lower in text.lower()
+    for start in range(len(text) - len(query_lower) + 1):
+        if matches_prefix(query_lower, text[start:]):
+            return True
+    return False
+
+
+class _TrieNode:
+    """트라이 노드: 자식 노드, 이 접두어로 시작하는 상위 후보 ID 목록, 키가 여기서 끝나는 후보 ID 목록"""
+    __slots__ = ("children", "top", "ends")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.top: List[int] = []
+        self.ends: List[int] = []
+
+
+class AutocompleteIndex:
+    """
+    접두어/초성 자동완성 색인
+
+    각 용어는 원문(소문자)과 초성 분해형 두 가지 키로, 단어 시작 위치마다 삽입됩니다.
+    노드마다 상위 후보를 미리 계산해 두므로 조회 비용은 질의 길이에만 비례합니다.
+    """
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        self._terms: List[Tuple[str, str]] = []   # (용어, 분류)
+        self._weights: List[int] = []
+        self._term_ids: Dict[Tuple[str, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def add(self, term: str, category: str, weight: int = 1) -> None:
+        """
+        용어를 색인에 추가합니다. 같은 (용어, 분류)가 다시 들어오면 가중치만 누적합니다.
+
+        Args:
+            term: 표시할 용어 (예: '김철수')
+            category: 분류 (예: '이름', '부서', '기관', '태그')
+            weight: 정렬 가중치 (등장 빈도 등)
+        """
+        term = (term or "").strip()
+        if not term:
+            return
+        key = (term, category)
+        term_id = self._term_ids.get(key)
+        if term_id is not None:
+            self._weights[term_id] += weight
+            return
+
+        term_id = len(self._terms)
+        self._term_ids[key] = term_id
+        self._terms.append(key)
+        self._weights.append(weight)
+
+        keys = set()
+        for word_start in self._word_starts(term):
+            suffix = term[word_start:]
+            keys.add(suffix.lower())
+            keys.add(get_choseong(suffix))
+        for k in keys:
+            self._insert(k, term_id)
+
+    def build(self) -> "AutocompleteIndex":
+        """노드별 후보 목록을 가중치순으로 정렬하고 상위 N개만 남깁니다."""
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            node.top = sorted(set(node.top), key=self._sort_key)[:MAX_SUGGESTIONS_PER_NODE]
+            stack.extend(node.children.values())
+        return self
+
+    def suggest(self, query: str, limit: int = DEFAULT_SUGGESTION_LIMIT,
+                categories: Optional[Iterable[str]] = None) -> List[Tuple[str, str]]:
+        """
+        접두어에 해당하는 후보를 반환합니다.
+
+        Args:
+            query: 입력 중인 문자열 (음절, 초성, 혼합 모두 가능)
+            limit: 최대 후보 수
+            categories: 허용할 분류 (None이면 전체)
+
+        Returns:
+            (용어, 분류) 튜플 리스트
+        """
+        query = (query or "").strip().lower()
+        if not query:
+            return []
+
+        # 음절+초성 혼합 질의(예: '김ㅊ')는 초성 키로 찾은 뒤 원문으로 재확인
+        mixed = has_choseong(query) and get_choseong(query) != query
+        node = self._find(get_choseong(query) if mixed else query)
+        if node is None:
+            return []
+
+        allowed = set(categories) if categories is not None else None
+
+        def accept(term_id: int) -> bool:
+            term, category = self._terms[term_id]
+            if allowed is not None and category not in allowed:
+                return False
+            return not mixed or any(matches_prefix(query, term[s:]) for s in self._word_starts(term))
+
+        results = [term_id for term_id in node.top if accept(term_id)][:limit]
+        # 필터로 걸러져 상위 후보만으로 부족하면 하위 트리 전체에서 다시 찾음
+        if len(results) < limit and len(node.top) >= MAX_SUGGESTIONS_PER_NODE:
+            checked = set(node.top)
+            rest = sorted(self._subtree_terms(node) - checked, key=self._sort_key)
+            results += [term_id for term_id in rest if accept(term_id)][:limit - len(results)]
+        return [self._terms[term_id] for term_id in results]
+
+    def _sort_key(self, term_id: int) -> Tuple[int, str]:
+        return (-self._weights[term_id], self._terms[term_id][0])
+
+    @staticmethod
+    def _subtree_terms(node: _TrieNode) -> set:
+        """노드 아래에서 키가 끝나는 모든 후보 ID (잘라내지 않은 전체 목록)"""
+        ids = set()
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            ids.update(current.ends)
+            stack.extend(current.children.values())
+        return ids
+
+    def _insert(self, key: str, term_id: int) -> None:
+        node = self._root
+        for ch in key:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.top.append(term_id)
+        node.ends.append(term_id)
+
+    def _find(self, key: str) -> Optional[_TrieNode]:
+        node = self._root
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    @staticmethod
+    def _word_starts(term: str) -> List[int]:
+        """단어가 시작되는 위치 목록 (예: 'World Bank' → [0, 6])"""
+        return [i for i, ch in enumerate(term) if not ch.isspace() and (i == 0 or term[i - 1].isspace())]
+
+
+def build_autocomplete_index(filename: str, records: Iterable[Dict[str, Any]]) -> AutocompleteIndex:
+    """
+    데이터셋 레코드로 자동완성 색인을 생성합니다.
+
+    Args:
+        filename: 데이터 파일명 (AUTOCOMPLETE_FIELDS의 키)
+        records: 해당 파일의 레코드 리스트
+
+    Returns:
+        빌드가 완료된 AutocompleteIndex
+    """
+    index = AutocompleteIndex()
+    fields = AUTOCOMPLETE_FIELDS.get(filename, [])
+    for record in records or []:
+        for field, category in fields:
+            value = record.get(field)
+            if isinstance(value, (list, tuple)):
+                for item in value:
+                    index.add(str(item), category)
+            elif value:
+                index.add(str(value), category)
+    return index.build()
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _get_cached_index(filename: str, version: str, _records: Any) -> AutocompleteIndex:
+    """(파일, 데이터 버전)별로 한 번만 색인을 빌드합니다 (프로세스 전체에서 공유)."""
+    return build_autocomplete_index(filename, _records)
+
+
+def get_autocomplete_index(filename: str, records: Any, version: Optional[str]) -> AutocompleteIndex:
+    """
+    현재 데이터 버전에 해당하는 공유 자동완성 색인을 반환합니다.
+
+    Args:
+        filename: 데이터 파일명 (예: 'staff_profiles.json')
+        records: load_shared_data_with_version()으로 로드한 해당 파일 데이터
+        version: records와 함께 반환된 데이터 버전
+
+    Returns:
+        AutocompleteIndex
+    """
+    if version is None:
+        # 버전을 알 수 없으면 공유 캐시를 오염시키지 않도록 바로 빌드
+        return build_autocomplete_index(filename, records)
+    return _get_cached_index(filename, version, records)
+
+
+def render_suggestions(index: AutocompleteIndex, input_key: str,
+                       categories: Optional[Iterable[str]] = None,
+                       limit: int = DEFAULT_SUGGESTION_LIMIT) -> None:
+    """
+    검색 입력창 아래에 자동완성 후보 버튼을 표시합니다.
+    버튼을 누르면 해당 용어로 입력창 값을 바꿉니다.
+
+    Args:
+        index: 자동완성 색인
+        input_key: 대상 st.text_input의 key
+        categories: 표시할 분류 (None이면 전체)
+        limit: 최대 후보 수
+    """
+    query = st.session_state.get(input_key, "")
+    suggestions = index.suggest(query, limit=limit, categories=categories)
+    # 이미 정확히 입력된 용어만 있으면 표시하지 않음
+    if not suggestions or (len(suggestions) == 1 and suggestions[0][0] == query.strip()):
+        return
+
+    def _apply(term: str) -> None:
+        st.session_state[input_key] = term
+
+    cols = st.columns(len(suggestions))
+    for col, (term, category) in zip(cols, suggestions):
+        with col:
+            st.button(
+                f"{term} · {category}",
+                key=f"{input_key}_suggest_{category}_{term}",
+                on_click=_apply,
+                args=(term,),
+                use_container_width=True
+            )
@@ -0,0 +1,113 @@
+"""
+불변 blob 캐시 모듈
+Git blob SHA를 키로 파일 바이트를 보관합니다. 같은 SHA의 내용은 절대 바뀌지 않으므로
+무효화 없이 메모리(바이트 예산 LRU)와 디스크(data/.blobs/)에 저장하고,
+과거 버전 비교를 반복해도 GitHub에서 다시 받지 않습니다.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from utils.local_store import atomic_write
+
+# 상수 정의
+DEFAULT_BLOB_DIR = "data/.blobs"
+MAX_MEMORY_BYTES = 64 * 1024 * 1024  # 메모리에 보관할 blob 총 크기
+
+
+def git_blob_sha(raw: bytes) -> str:
+    """GitHub와 동일한 방식으로 Git blob SHA를 계산합니다."""
+    header = f"blob {len(raw)}\0".encode('utf-8')
+    return hashlib.sha1(header + raw).hexdigest()
+
+
+class BlobCache:
+    """
+    내용 주소 기반 blob 캐시 (스레드 안전)
+
+    디스크에서 읽은 blob은 SHA를 다시 계산하여 손상된 파일을 걸러냅니다.
+    """
+
+    def __init__(self, directory: str = DEFAULT_BLOB_DIR, max_memory_bytes: int = MAX_MEMORY_BYTES) -> None:
+        self.directory = Path(directory)
+        self.max_memory_bytes = max_memory_bytes
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._hits = 0
+        self._disk_hits = 0
+        self._fetches = 0
+
+    def _path(self, sha: str) -> Path:
+        return self.directory / sha[:2] / sha[2:]
+
+    def _remember(self, sha: str, raw: bytes) -> None:
+        """메모리 LRU에 넣고 예산을 넘으면 오래된 blob부터 제거합니다 (잠금 안에서 호출)."""
+        if sha in self._memory:
+            self._memory.move_to_end(sha)
+            return
+        self._memory[sha] = raw
+        self._memory_bytes += len(raw)
+        while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def get(self, sha: str) -> Optional[bytes]:
+        """캐시된 blob을 반환합니다 (메모리 → 디스크, 없으면 None)."""
+        with self._lock:
+            raw = self._memory.get(sha)
+            if raw is not None:
+                self._memory.move_to_end(sha)
+                self._hits += 1
+                return raw
+
+        path = self._path(sha)
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return None
+        if git_blob_sha(raw) != sha:
+            return None
+        with self._lock:
+            self._disk_hits += 1
+            self._remember(sha, raw)
+        return raw
+
+    def put(self, sha: str, raw: bytes) -> None:
+        """
+        blob을 저장합니다.
+
+        Raises:
+            ValueError: 내용의 SHA가 키와 다른 경우
+        """
+        if git_blob_sha(raw) != sha:
+            raise ValueError(f"blob SHA 불일치: {sha}")
+        with self._lock:
+            self._remember(sha, raw)
+        path = self._path(sha)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, raw)
+
+    def get_or_fetch(self, sha: str, fetch: Callable[[], bytes]) -> bytes:
+        """캐시에 없을 때만 fetch()로 받아 저장한 뒤 반환합니다."""
+        raw = self.get(sha)
+        if raw is None:
+            raw = fetch()
+            with self._lock:
+                self._fetches += 1
+            self.put(sha, raw)
+        return raw
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "memory_blobs": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "fetches": self._fetches
+            }
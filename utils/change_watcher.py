@@ -0,0 +1,100 @@
+"""
+변경 감시 모듈
+백그라운드 스레드 하나가 주기적으로 원격 저장소의 변경 여부를 확인하고,
+바뀐 경우에만 파일별 버전 스냅샷을 콜백으로 전달합니다.
+모든 세션이 매 재실행마다 원격을 확인하는 대신 프로세스당 하나의 감시자가 확인합니다.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# 상수 정의
+FRESHNESS_FACTOR = 3  # 마지막 성공 확인이 (간격 × 이 값) 이내여야 감시 결과를 신뢰
+
+
+class ChangeWatcher:
+    """
+    주기적 변경 감시자 (데몬 스레드)
+
+    poll_fn은 변경이 없으면 None, 변경이 있으면 {파일명: 버전} 스냅샷을 반환합니다.
+    스냅샷이 이전과 다르면 on_change(스냅샷, 바뀐 파일 목록)를 호출하고, 확인 결과를 모두 반영하면
+    on_synced()를 호출합니다. 중간에 예외가 나면 스냅샷을 갱신하지 않으므로 다음 확인에서 다시 반영합니다.
+    """
+
+    def __init__(self, poll_fn: Callable[[], Optional[Dict[str, str]]],
+                 on_change: Callable[[Dict[str, str], List[str]], None],
+                 interval: float, on_synced: Optional[Callable[[], None]] = None) -> None:
+        self.interval = interval
+        self._poll_fn = poll_fn
+        self._on_change = on_change
+        self._on_synced = on_synced
+        self._snapshot: Dict[str, str] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_ok = 0.0
+        self._polls = 0
+        self._changes = 0
+        self._last_error: Optional[str] = None
+
+    def start(self) -> "ChangeWatcher":
+        """감시 스레드를 시작합니다 (이미 실행 중이면 무시)."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="data-change-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """감시 스레드를 멈춥니다."""
+        self._stop.set()
+
+    def is_fresh(self) -> bool:
+        """최근 확인이 성공하여 감시 결과를 신뢰할 수 있는지 여부"""
+        return (self._thread is not None and self._thread.is_alive()
+                and time.time() - self._last_ok < self.interval * FRESHNESS_FACTOR)
+
+    def poll_once(self) -> List[str]:
+        """
+        한 번 확인하고 바뀐 파일 목록을 반환합니다.
+
+        Returns:
+            추가/수정/삭제된 파일명 리스트 (변경이 없으면 빈 리스트)
+        """
+        self._polls += 1
+        snapshot = self._poll_fn()
+        changed: List[str] = []
+        if snapshot is not None and snapshot != self._snapshot:
+            changed = sorted(
+                name for name in set(snapshot) | set(self._snapshot)
+                if snapshot.get(name) != self._snapshot.get(name)
+            )
+            self._on_change(snapshot, changed)
+            self._snapshot = dict(snapshot)
+            self._changes += 1
+        if self._on_synced is not None:
+            self._on_synced()
+        self._last_ok = time.time()
+        return changed
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+                self._last_error = None
+            except Exception as e:
+                self._last_error = str(e)
+            self._stop.wait(self.interval)
+
+    def stats(self) -> Dict[str, Any]:
+        """감시 상태를 반환합니다."""
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "fresh": self.is_fresh(),
+            "interval": self.interval,
+            "polls": self._polls,
+            "changes": self._changes,
+            "files": len(self._snapshot),
+            "last_ok": self._last_ok,
+            "last_error": self._last_error
+        }
@@ -0,0 +1,151 @@
+"""
+집계 큐브 모듈
+레코드 단위 데이터에서 차원 조합별 롤업(모든 부분집합)을 미리 계산해 두고,
+드릴다운/필터 질의를 원본 레코드 재집계 없이 조회합니다.
+"""
+
+from collections import defaultdict
+from itertools import product
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 상수 정의
+ALL = "*"             # 롤업된(전체) 차원 값
+KEY_SEPARATOR = "|"
+
+# 재학생 큐브: 지역 → 국가 → 프로그램 → 입학 연도
+STUDENT_DIMENSIONS = ["region", "country", "program", "cohort_year"]
+STUDENT_MEASURES = ["enrolled", "graduated", "employed"]
+
+# 파트너 큐브: 국가 × 체결 연도
+PARTNER_DIMENSIONS = ["country", "year"]
+
+
+def _cell_key(values: Sequence[Any]) -> str:
+    return KEY_SEPARATOR.join(str(v) for v in values)
+
+
+def build_cube(records: Iterable[Dict[str, Any]], dimensions: Sequence[str],
+               measure_fn, measures: Sequence[str],
+               member_field: Optional[str] = None) -> Dict[str, Any]:
+    """
+    레코드에서 모든 차원 조합(2^N)의 롤업 셀을 계산합니다.
+
+    Args:
+        records: 원본 레코드
+        dimensions: 차원 필드 목록 (드릴다운 순서)
+        measure_fn: 레코드 → 측정값 리스트 (measures 순서)
+        measures: 측정값 이름 목록
+        member_field: 지정하면 셀별로 해당 필드 값 목록도 보관 (예: 파트너 기관명)
+
+    Returns:
+        JSON 직렬화 가능한 큐브 {'dimensions', 'measures', 'cells', ['members']}
+    """
+    cells: Dict[str, List[int]] = {}
+    members: Dict[str, List[str]] = defaultdict(list)
+    rollups = list(product([False, True], repeat=len(dimensions)))
+
+    for record in records:
+        values = [record.get(dim) if record.get(dim) is not None else "기타" for dim in dimensions]
+        record_measures = measure_fn(record)
+        for rollup in rollups:
+            key = _cell_key(ALL if rolled else value for value, rolled in zip(values, rollup))
+            cell = cells.setdefault(key, [0] * len(measures))
+            for i, m in enumerate(record_measures):
+                cell[i] += m
+            if member_field:
+                members[key].append(str(record.get(member_field, "")))
+
+    cube: Dict[str, Any] = {
+        "dimensions": list(dimensions),
+        "measures": list(measures),
+        "cells": cells
+    }
+    if member_field:
+        cube["members"] = {key: sorted(names) for key, names in members.items()}
+    return cube
+
+
+def build_student_cube(students: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """재학생/졸업생 레코드로 지역 → 국가 → 프로그램 → 입학 연도 큐브를 만듭니다."""
+    def measure(student: Dict[str, Any]) -> List[int]:
+        graduated = student.get("status") == "graduated"
+        return [0 if graduated else 1, 1 if graduated else 0, 1 if graduated and student.get("employed") else 0]
+
+    return build_cube(students, STUDENT_DIMENSIONS, measure, STUDENT_MEASURES)
+
+
+def build_partner_cube(partners: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """MOU 파트너 레코드로 국가 × 체결 연도 큐브를 만듭니다 (셀별 기관명 포함)."""
+    return build_cube(partners, PARTNER_DIMENSIONS, lambda p: [1], ["count"], member_field="name")
+
+
+class Cube:
+    """
+    직렬화된 큐브 조회기
+
+    셀 조회는 딕셔너리 한 번, 하위 항목 목록은 생성 시 한 번 만든 색인으로 조회합니다.
+    """
+
+    def __init__(self, cube: Dict[str, Any]) -> None:
+        self.dimensions: List[str] = cube.get("dimensions", [])
+        self.measures: List[str] = cube.get("measures", [])
+        self._cells: Dict[str, List[int]] = cube.get("cells", {})
+        self._members: Dict[str, List[str]] = cube.get("members", {})
+
+        # (부모 셀 키, 차원) → 하위 값 목록
+        self._children: Dict[Tuple[str, str], List[str]] = defaultdict(list)
+        for key in self._cells:
+            values = key.split(KEY_SEPARATOR)
+            for i, value in enumerate(values):
+                if value == ALL:
+                    continue
+                parent = values[:i] + [ALL] + values[i + 1:]
+                self._children[(_cell_key(parent), self.dimensions[i])].append(value)
+        for values in self._children.values():
+            values.sort()
+
+    def __bool__(self) -> bool:
+        return bool(self._cells)
+
+    def _key(self, filters: Dict[str, Any]) -> str:
+        return _cell_key(filters[dim] if filters.get(dim) is not None else ALL for dim in self.dimensions)
+
+    def get(self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+        """
+        필터 조건에 해당하는 셀의 측정값을 반환합니다.
+
+        Args:
+            filters: {차원: 값} (지정하지 않은 차원은 전체로 롤업)
+
+        Returns:
+            {측정값 이름: 값}
+        """
+        cell = self._cells.get(self._key(filters or {}), [0] * len(self.measures))
+        return dict(zip(self.measures, cell))
+
+    def values(self, dimension: str, filters: Optional[Dict[str, Any]] = None) -> List[str]:
+        """필터 조건 아래에서 해당 차원이 가질 수 있는 값 목록 (드릴다운 선택지)"""
+        filters = {k: v for k, v in (filters or {}).items() if k != dimension}
+        return list(self._children.get((self._key(filters), dimension), []))
+
+    def breakdown(self, dimension: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        필터 조건 아래에서 한 차원으로 분해한 측정값 목록을 반환합니다.
+
+        Args:
+            dimension: 분해할 차원
+            filters: {차원: 값}
+
+        Returns:
+            [{dimension: 값, 측정값...}] 리스트
+        """
+        rows = []
+        for value in self.values(dimension, filters):
+            row = {dimension: value}
+            row.update(self.get({**(filters or {}), dimension: value}))
+            rows.append(row)
+        return rows
+
+    def members(self, filters: Optional[Dict[str, Any]] = None) -> List[str]:
+        """필터 조건에 해당하는 셀의 구성원 목록 (member_field로 만든 큐브만 해당)"""
+        return list(self._members.get(self._key(filters or {}), []))
@@ -0,0 +1,194 @@
+"""
+대시보드 데이터 모듈
+미리 계산된 집계 파일을 로드합니다. 집계 파일이 없거나 일부 섹션이 빠졌거나
+섹션에 기록된 원본 버전이 현재 원본과 다른 경우에만 원본 데이터셋에서 해당 섹션을 즉시 계산합니다.
+차트는 데이터 버전별로 직렬화된 Plotly JSON을 캐시하여 재실행 시 다시 만들지 않습니다.
+"""
+
+import json
+from datetime import datetime, timedelta
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from utils.github_handler import load_data, load_data_with_version
+from utils.aggregates import AGGREGATE_FILENAME, MATERIALIZERS, derive_files
+from utils.cube import Cube
+from utils.timeseries import kpi_series
+
+
+def _refresh_sections(target: str, aggregates: Dict[str, Any],
+                      stale: Dict[str, Tuple[Any, str]]) -> Dict[str, Any]:
+    """뒤처진 원본의 섹션만 다시 계산합니다 (저장은 하지 않음)."""
+    for filename, (data, data_version) in stale.items():
+        current = aggregates
+        derived = derive_files(filename, data, data_version,
+                               lambda name: current if name == target else load_data(name), targets=[target])
+        aggregates = derived[target]
+    return aggregates
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _get_cached_sections(target: str, version: str, _aggregates: Dict[str, Any],
+                         _stale: Dict[str, Tuple[Any, str]]) -> Dict[str, Any]:
+    """(집계 파일 버전, 원본 버전)별로 한 번만 섹션을 다시 계산합니다 (프로세스 전체에서 공유)."""
+    return _refresh_sections(target, _aggregates, _stale)
+
+
+def load_dashboard_aggregates(target: str = AGGREGATE_FILENAME) -> Dict[str, Any]:
+    """
+    대시보드 집계 데이터를 로드합니다.
+    섹션에 기록된 원본 버전이 현재 원본 버전과 다르면(원격 변경 반영, 이전 형식의 집계 파일 등)
+    그 섹션은 현재 원본에서 다시 계산합니다.
+
+    Args:
+        target: 집계 파일명 (dashboard_aggregates.json 또는 dashboard_cubes.json)
+
+    Returns:
+        집계 데이터 (예: kpi, students_by_region, partners_by_country,
+        partners_by_year, schedules_by_date, sources, version)
+    """
+    try:
+        aggregates, version = load_data_with_version(target)
+    except Exception as e:
+        st.warning(f"⚠️ 대시보드 집계 로드 중 오류 발생: {e}. 원본 데이터에서 계산합니다.")
+        aggregates, version = None, None
+
+    # 집계 파일의 blob SHA를 차트/큐브 캐시 키로 사용
+    aggregates = aggregates or {}
+    version = version if aggregates else None
+
+    # 집계되지 않았거나 집계 이후 바뀐 원본 찾기
+    sources = aggregates.get("sources", {})
+    stale: Dict[str, Tuple[Any, str]] = {}
+    for filename in MATERIALIZERS[target]:
+        data, data_version = load_data_with_version(filename)
+        if data and (sources.get(filename) or {}).get("version") != data_version:
+            stale[filename] = (data, data_version)
+
+    if stale:
+        # 집계 파일 버전과 원본 버전을 합친 값을 캐시 키와 데이터 버전으로 사용
+        version = "+".join([version or "-"] + [data_version or "-" for _, data_version in stale.values()])
+        aggregates = _get_cached_sections(target, version, aggregates, stale)
+
+    # 로드된 데이터는 다른 세션과 공유될 수 있으므로 복사본에 버전 기록
+    aggregates = {**aggregates, "version": version}
+    return aggregates
+
+
+def build_region_pie(rows: List[Dict[str, Any]]) -> str:
+    """지역별 재학생 분포 파이 차트를 만들어 Plotly JSON 문자열로 반환합니다."""
+    df_region = pd.DataFrame(rows)
+    fig_pie = px.pie(
+        df_region,
+        values='count',
+        names='region',
+        title='지역별 재학생 분포',
+        color_discrete_sequence=px.colors.qualitative.Set3
+    )
+    fig_pie.update_traces(textposition='inside', textinfo='percent+label')
+    return fig_pie.to_json()
+
+
+def build_partner_bar(rows: List[Dict[str, Any]]) -> str:
+    """연도별 MOU 체결 현황 막대 차트를 만들어 Plotly JSON 문자열로 반환합니다."""
+    df_mou = pd.DataFrame(rows)
+    fig_bar = px.bar(
+        df_mou,
+        x='year',
+        y='count',
+        color='country',
+        title='연도별 MOU 체결 현황',
+        labels={'year': '체결 연도', 'count': '기관 수', 'country': '국가'},
+        color_discrete_sequence=px.colors.qualitative.Pastel
+    )
+    fig_bar.update_layout(xaxis_type='category')
+    return fig_bar.to_json()
+
+
+FIGURE_BUILDERS: Dict[str, Callable[[List[Dict[str, Any]]], str]] = {
+    "students_by_region": build_region_pie,
+    "partners_by_year": build_partner_bar,
+}
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _get_cached_figure_json(section: str, version: str, _rows: List[Dict[str, Any]]) -> str:
+    """(집계 섹션, 데이터 버전)별로 한 번만 차트를 생성합니다 (프로세스 전체에서 공유)."""
+    return FIGURE_BUILDERS[section](_rows)
+
+
+def get_figure_spec(aggregates: Dict[str, Any], section: str) -> Optional[Dict[str, Any]]:
+    """
+    집계 섹션에 해당하는 차트 스펙을 반환합니다.
+    데이터 버전이 같으면 pandas/Plotly Express 작업 없이 캐시된 JSON만 사용합니다.
+
+    Args:
+        aggregates: load_dashboard_aggregates() 결과
+        section: 집계 섹션 이름 (FIGURE_BUILDERS의 키)
+
+    Returns:
+        st.plotly_chart에 전달할 figure dict, 데이터가 없으면 None
+    """
+    rows = aggregates.get(section, [])
+    if not rows:
+        return None
+
+    version = aggregates.get("version")
+    if version is None:
+        figure_json = FIGURE_BUILDERS[section](rows)
+    else:
+        figure_json = _get_cached_figure_json(section, version, rows)
+    return json.loads(figure_json)
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _get_cached_cube(section: str, version: str, _cube: Dict[str, Any]) -> Cube:
+    """(큐브 섹션, 데이터 버전)별로 한 번만 조회 색인을 만듭니다 (프로세스 전체에서 공유)."""
+    return Cube(_cube)
+
+
+def get_cube(aggregates: Dict[str, Any], section: str) -> Cube:
+    """
+    집계 데이터에 포함된 큐브 조회기를 반환합니다.
+
+    Args:
+        aggregates: load_dashboard_aggregates(CUBE_FILENAME) 결과
+        section: 'student_cube' 또는 'partner_cube'
+
+    Returns:
+        Cube (데이터가 없으면 빈 큐브)
+    """
+    cube = aggregates.get(section) or {}
+    version = aggregates.get("version")
+    if version is None or not cube:
+        return Cube(cube)
+    return _get_cached_cube(section, version, cube)
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _get_cached_kpi_trend(version: str, field: str, days: Optional[int],
+                          _history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """(이력 버전, 지표, 기간)별로 한 번만 다운샘플링합니다."""
+    since = datetime.now() - timedelta(days=days) if days else None
+    return kpi_series(_history, field, since=since)
+
+
+def get_kpi_trend(history: List[Dict[str, Any]], version: Optional[str], field: str,
+                  days: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    KPI 이력에서 차트용 시계열을 반환합니다 (최대 MAX_CHART_POINTS개로 다운샘플링).
+
+    Args:
+        history: kpi_history.json 내용
+        version: history와 함께 반환된 데이터 버전 (None이면 캐시하지 않음)
+        field: KPI 필드명
+        days: 최근 N일만 사용 (None이면 전체)
+
+    Returns:
+        [{'timestamp': datetime, field: 값}] 리스트
+    """
+    if version is None:
+        since = datetime.now() - timedelta(days=days) if days else None
+        return kpi_series(history, field, since=since)
+    return _get_cached_kpi_trend(version, field, days, history)
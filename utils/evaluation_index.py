@@ -0,0 +1,144 @@
+"""
+기관평가 근거 색인 모듈
+평가 매뉴얼(평가 항목, 가이드라인, 전년도 피드백)의 전문 검색 색인과,
+각 평가 항목을 관련 주간보고 이슈 및 대시보드 KPI에 연결하는 유사도 조인을 미리 계산합니다.
+데이터 버전별로 한 번만 계산하여 모든 세션이 공유합니다.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import streamlit as st
+
+from utils.text_index import TextIndex, count_terms, similarity_join
+from utils.timeseries import KPI_FIELDS, KPI_LABELS
+
+# 상수 정의
+MANUAL_FIELD_WEIGHTS = {"criteria": 3.0, "guide": 1.5, "prev_feedback": 1.5, "category": 1.0}
+# KPI별 연결 키워드 (KPI 이름은 영문 필드이므로 평가 항목과 비교할 설명어 사용)
+KPI_KEYWORDS = {
+    "total_students": ["재학생 수", "학생 충원", "입학 정원", "신입생 모집"],
+    "partners": ["파트너 기관", "협력 기관", "MOU 체결", "국제 교류"],
+    "employment_rate": ["취업률", "졸업생 진로", "취업 지원", "경력 개발"],
+}
+ISSUE_LINKS_PER_CRITERION = 5
+KPI_LINKS_PER_CRITERION = 2
+MIN_SIMILARITY = 0.1
+MAX_PREBUILT_TEXT_INDEXES = 2  # 사용되지 않은 채 보관할 미리 만든 색인 수 (초과 시 오래된 것부터 버림)
+
+# 매뉴얼 가져오기 중에 미리 만든 검색 색인 (매뉴얼 버전별, 근거 색인 계산 시 한 번 사용)
+_prebuilt_text_indexes: "OrderedDict[str, TextIndex]" = OrderedDict()
+
+
+@dataclass
+class EvaluationIndex:
+    """평가 매뉴얼 검색 색인과 항목별 근거 연결"""
+    text_index: TextIndex
+    # 같은 문구의 이슈는 하나로 묶음: {'text', 'occurrences': [{'date', 'department', 'link'}, ...]} (최신순)
+    issues: List[Dict[str, Any]]
+    issue_links: List[List[Tuple[int, float]]]
+    kpi_links: List[List[Tuple[str, float]]]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """검색어와 관련된 평가 항목 번호를 관련도순으로 반환합니다."""
+        return [doc_id for doc_id, _ in self.text_index.search(query, limit)]
+
+    def related_issues(self, doc_id: int) -> List[Tuple[Dict[str, Any], float]]:
+        """평가 항목과 관련된 주간보고 이슈 (이슈, 유사도)"""
+        return [(self.issues[i], score) for i, score in self.issue_links[doc_id]]
+
+    def related_kpis(self, doc_id: int) -> List[Tuple[str, float]]:
+        """평가 항목과 관련된 KPI 필드 (필드명, 유사도)"""
+        return self.kpi_links[doc_id]
+
+
+def _collect_issues(reports: Sequence[Any]) -> List[Dict[str, Any]]:
+    """주간보고 이슈를 문구별로 묶습니다."""
+    grouped: Dict[str, Dict[str, Any]] = {}
+    for report in reports or []:
+        for issue in report.get("issues", []):
+            text = str(issue).strip()
+            if not text:
+                continue
+            entry = grouped.setdefault(text, {"text": text, "occurrences": []})
+            entry["occurrences"].append({
+                "date": report.get("date", ""),
+                "department": report.get("department", ""),
+                "link": report.get("link")
+            })
+    for entry in grouped.values():
+        entry["occurrences"].sort(key=lambda o: o["date"], reverse=True)
+    return list(grouped.values())
+
+
+def build_evaluation_index(manual: Sequence[Any], reports: Sequence[Any],
+                           text_index: Optional[TextIndex] = None) -> EvaluationIndex:
+    """
+    평가 매뉴얼 색인과 항목별 근거 연결을 계산합니다.
+
+    Args:
+        manual: evaluation_manual.json 레코드
+        reports: weekly_reports.json 레코드
+        text_index: 같은 레코드로 미리 만든 검색 색인 (없으면 새로 생성)
+
+    Returns:
+        EvaluationIndex (평가 항목 번호는 manual 순서)
+    """
+    if text_index is None or len(text_index) != len(manual or []):
+        text_index = TextIndex(MANUAL_FIELD_WEIGHTS)
+        for item in manual or []:
+            text_index.add(item)
+        text_index.build()
+    criteria = [text_index.term_counts(i) for i in range(len(text_index))]
+
+    issues = _collect_issues(reports)
+    issue_links = similarity_join(
+        criteria, [count_terms([issue["text"]]) for issue in issues],
+        top_k=ISSUE_LINKS_PER_CRITERION, min_score=MIN_SIMILARITY
+    )
+
+    kpi_docs = [count_terms([KPI_LABELS[f]] + KPI_KEYWORDS.get(f, [])) for f in KPI_FIELDS]
+    kpi_links = [
+        [(KPI_FIELDS[i], score) for i, score in links]
+        for links in similarity_join(criteria, kpi_docs, top_k=KPI_LINKS_PER_CRITERION, min_score=MIN_SIMILARITY)
+    ]
+    return EvaluationIndex(text_index, issues, issue_links, kpi_links)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _get_cached_index(manual_version: str, reports_version: str, _manual: Any, _reports: Any) -> EvaluationIndex:
+    """(매뉴얼 버전, 주간보고 버전)별로 한 번만 계산합니다 (프로세스 전체에서 공유)."""
+    return build_evaluation_index(_manual, _reports, _prebuilt_text_indexes.pop(manual_version, None))
+
+
+def register_text_index(manual_version: str, text_index: TextIndex) -> None:
+    """
+    매뉴얼 가져오기에서 레코드마다 만들어 둔 검색 색인을 해당 버전의 근거 색인 계산에 사용합니다.
+    근거 색인을 계산하기 전에 다른 버전이 저장되면 쓰이지 않으므로 최근 MAX_PREBUILT_TEXT_INDEXES개만 보관합니다.
+    """
+    _prebuilt_text_indexes[manual_version] = text_index
+    _prebuilt_text_indexes.move_to_end(manual_version)
+    while len(_prebuilt_text_indexes) > MAX_PREBUILT_TEXT_INDEXES:
+        _prebuilt_text_indexes.popitem(last=False)
+
+
+def get_evaluation_index(manual: Any, manual_version: Optional[str], reports: Any,
+                         reports_version: Optional[str]) -> EvaluationIndex:
+    """
+    현재 데이터 버전에 해당하는 공유 평가 근거 색인을 반환합니다.
+
+    Args:
+        manual: load_shared_data_with_version('evaluation_manual.json')의 데이터
+        manual_version: manual과 함께 반환된 데이터 버전
+        reports: load_shared_data_with_version('weekly_reports.json')의 데이터 (없으면 None)
+        reports_version: reports와 함께 반환된 데이터 버전
+
+    Returns:
+        EvaluationIndex
+    """
+    reports_version = reports_version if reports else "none"
+    if manual_version is None or reports_version is None:
+        # 버전을 알 수 없으면 공유 캐시를 오염시키지 않도록 바로 계산
+        return build_evaluation_index(manual, reports)
+    return _get_cached_index(manual_version, reports_version, manual, reports)
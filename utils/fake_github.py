@@ -0,0 +1,552 @@
+"""
+GitHub API 에뮬레이터 모듈
+github_handler가 사용하는 PyGithub API(Contents, Git Data의 blob/tree/commit/ref, 커밋 목록,
+브랜치 ref 조건부 요청)를 프로세스 안의 메모리 Git 저장소로 흉내 냅니다.
+응답 지연, 오류(401/403/404/409/422/5xx, 네트워크 오류), 속도 제한 헤더를 설정할 수 있어
+캐시/재시도/저장 경로를 네트워크 없이 같은 조건으로 반복 측정하고 시험할 수 있습니다.
+
+secrets.toml 설정 예:
+    FAKE_GITHUB = true              # 지연/오류 없는 기본 설정
+
+    [FAKE_GITHUB]                   # 또는 세부 설정
+    latency_ms = 80                 # 요청당 지연
+    jitter_ms = 20                  # 지연 편차 (±)
+    error_rate = 0.05               # 무작위 오류 비율
+    error_statuses = [500, 502, 503]
+    network_error_rate = 0.01       # 연결 오류 비율
+    rate_limit = 5000               # 시간당 할당량 (소진 시 403 + X-RateLimit-* 헤더)
+    seed = 0                        # 지연/오류 난수 시드
+"""
+
+import base64
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple, Union
+
+import requests
+from github.GithubException import (
+    BadCredentialsException, GithubException, RateLimitExceededException, UnknownObjectException
+)
+
+from utils.blob_cache import git_blob_sha
+
+# 상수 정의
+DEFAULT_BRANCH = "main"
+CONTENTS_SIZE_LIMIT = 1 * 1024 * 1024  # 이보다 큰 파일은 Contents API 응답에 내용이 없음
+NETWORK_ERROR = 0                     # fail_next()에 지정하면 연결 오류 발생
+
+
+@dataclass(frozen=True)
+class FakeGithubConfig:
+    """에뮬레이터 설정"""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_statuses: Tuple[int, ...] = (500, 502, 503)
+    network_error_rate: float = 0.0
+    rate_limit: int = 5000
+    reset_seconds: int = 3600
+    seed: int = 0
+    seed_data_dir: Optional[str] = "data"  # 저장소 생성 시 첫 커밋으로 올릴 폴더 (빈 문자열이면 빈 저장소)
+
+    @classmethod
+    def from_options(cls, options: Any) -> "FakeGithubConfig":
+        """secrets 값(true 또는 설정 테이블)에서 설정을 만듭니다. 모르는 키는 무시합니다."""
+        if not isinstance(options, Mapping):
+            return cls()
+        known = {f.name for f in fields(cls)}
+        values = {key: value for key, value in options.items() if key in known}
+        if "error_statuses" in values:
+            values["error_statuses"] = tuple(int(status) for status in values["error_statuses"])
+        return cls(**values)
+
+
+# PyGithub 응답 객체 (github_handler가 읽는 속성만) ------------------------------
+
+@dataclass
+class FakeContentFile:
+    path: str
+    sha: str
+    size: int
+    encoding: str
+    content: str
+    type: str = "file"
+
+    @property
+    def name(self) -> str:
+        return self.path.rsplit("/", 1)[-1]
+
+    @property
+    def decoded_content(self) -> bytes:
+        return base64.b64decode(self.content)
+
+
+@dataclass
+class FakeGitBlob:
+    sha: str
+    content: str
+    size: int
+    encoding: str = "base64"
+
+
+@dataclass
+class FakeGitTreeElement:
+    path: str
+    sha: str
+    size: int
+    type: str = "blob"
+    mode: str = "100644"
+
+
+@dataclass
+class FakeGitTree:
+    sha: str
+    tree: List[FakeGitTreeElement]
+
+
+@dataclass
+class FakeGitAuthor:
+    name: str
+    date: datetime
+
+
+@dataclass
+class FakeGitObject:
+    sha: str
+    type: str = "commit"
+
+
+@dataclass
+class FakeGitCommit:
+    sha: str
+    message: str
+    tree: FakeGitTree
+    parents: List["FakeGitCommit"]
+    author: FakeGitAuthor
+
+
+@dataclass
+class FakeCommit:
+    """repo.get_commits() 항목 (commit.sha, commit.commit.message/author)"""
+    sha: str
+    commit: FakeGitCommit
+
+
+@dataclass
+class _CommitData:
+    tree: str
+    parents: List[str]
+    message: str
+    author: FakeGitAuthor
+
+
+class FakeGitRef:
+    """브랜치 ref. edit()는 fast-forward가 아니면 422로 거절합니다."""
+
+    def __init__(self, repo: "FakeRepository", ref: str, sha: str) -> None:
+        self._repo = repo
+        self.ref = f"refs/{ref}"
+        self.object = FakeGitObject(sha)
+
+    def edit(self, sha: str, force: bool = False) -> None:
+        self._repo._update_ref(self.ref[len("refs/"):], sha, force)
+        self.object = FakeGitObject(sha)
+
+
+# 요청 처리 (지연, 오류, 할당량) -------------------------------------------------
+
+class _Server:
+    """모든 저장소가 공유하는 요청 처리기 (클라이언트 하나 = 토큰 하나의 할당량)"""
+
+    def __init__(self, config: FakeGithubConfig) -> None:
+        self.config = config
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+        self._scripted: Deque[Tuple[int, Optional[str]]] = deque()
+        self.remaining = config.rate_limit
+        self.reset_at = int(time.time()) + config.reset_seconds
+        self.calls: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.latency_total = 0.0
+
+    def rate_headers(self) -> Dict[str, str]:
+        return {
+            "x-ratelimit-limit": str(self.config.rate_limit),
+            "x-ratelimit-remaining": str(self.remaining),
+            "x-ratelimit-reset": str(self.reset_at),
+        }
+
+    def fail_next(self, status: int, times: int = 1, endpoint: Optional[str] = None) -> None:
+        with self._lock:
+            self._scripted.extend([(status, endpoint)] * times)
+
+    def _scripted_failure(self, endpoint: str) -> Optional[int]:
+        for i, (status, target) in enumerate(self._scripted):
+            if target is None or target == endpoint:
+                del self._scripted[i]
+                return status
+        return None
+
+    def call(self, endpoint: str, consume: bool = True) -> None:
+        """
+        요청 하나를 처리합니다: 지연 → 할당량 차감 → 오류 주입.
+
+        Raises:
+            GithubException: 주입된 오류 또는 할당량 소진(403)
+            requests.exceptions.ConnectionError: 주입된 연결 오류
+        """
+        config = self.config
+        with self._lock:
+            delay = max(0.0, config.latency_ms + self._rng.uniform(-config.jitter_ms, config.jitter_ms)) / 1000
+            scripted = self._scripted_failure(endpoint)
+            roll_network, roll_error = self._rng.random(), self._rng.random()
+            random_status = self._rng.choice(config.error_statuses) if config.error_statuses else 500
+            self.calls[endpoint] += 1
+            self.latency_total += delay
+        if delay:
+            time.sleep(delay)
+
+        with self._lock:
+            now = time.time()
+            if now >= self.reset_at:
+                self.remaining = config.rate_limit
+                self.reset_at = int(now) + config.reset_seconds
+            if scripted is None and consume and self.remaining <= 0:
+                self.errors[403] += 1
+                headers = {**self.rate_headers(), "retry-after": str(max(1, int(self.reset_at - now)))}
+                raise RateLimitExceededException(403, {"message": "API rate limit exceeded"}, headers)
+            if consume:
+                self.remaining -= 1
+            status = scripted
+            if status is None and roll_network < config.network_error_rate:
+                status = NETWORK_ERROR
+            elif status is None and roll_error < config.error_rate:
+                status = random_status
+            if status is not None:
+                self.errors[status] += 1
+            headers = self.rate_headers()
+
+        if status == NETWORK_ERROR:
+            raise requests.exceptions.ConnectionError(f"Fake GitHub connection error ({endpoint})")
+        if status == 401:
+            raise BadCredentialsException(401, {"message": "Bad credentials"}, headers)
+        if status == 403:
+            raise RateLimitExceededException(403, {"message": "API rate limit exceeded"},
+                                             {**headers, "x-ratelimit-remaining": "0", "retry-after": "1"})
+        if status == 404:
+            raise UnknownObjectException(404, {"message": "Not Found"}, headers)
+        if status is not None:
+            raise GithubException(status, {"message": f"Injected error ({endpoint})"}, headers)
+
+
+# 저장소 ------------------------------------------------------------------------
+
+class FakeRepository:
+    """메모리 Git 저장소 (blob/tree/commit/ref). 트리는 경로 → blob SHA의 평면 구조입니다."""
+
+    def __init__(self, server: _Server, full_name: str, seed_dir: Optional[Path] = None) -> None:
+        self._server = server
+        self.full_name = full_name
+        self._lock = threading.RLock()
+        self._blobs: Dict[str, bytes] = {}
+        self._trees: Dict[str, Dict[str, str]] = {}
+        self._commits: Dict[str, _CommitData] = {}
+        self._refs: Dict[str, str] = {}
+        self._counter = 0
+
+        files: Dict[str, str] = {}
+        if seed_dir is not None and seed_dir.is_dir():
+            for path in sorted(seed_dir.glob("*.json")):
+                files[f"data/{path.name}"] = self._put_blob(path.read_bytes())
+        self._refs[f"heads/{DEFAULT_BRANCH}"] = self._put_commit("Initial data", self._put_tree(files), [])
+
+    # 내부 저장 ---------------------------------------------------------------
+
+    def _put_blob(self, raw: bytes) -> str:
+        sha = git_blob_sha(raw)
+        self._blobs[sha] = raw
+        return sha
+
+    def _put_tree(self, entries: Dict[str, str]) -> str:
+        sha = hashlib.sha1(json.dumps(sorted(entries.items())).encode("utf-8")).hexdigest()
+        self._trees[sha] = dict(entries)
+        return sha
+
+    def _put_commit(self, message: str, tree_sha: str, parents: List[str]) -> str:
+        self._counter += 1
+        author = FakeGitAuthor("Fake GitHub", datetime.now(timezone.utc))
+        sha = hashlib.sha1(
+            f"{tree_sha}:{','.join(parents)}:{message}:{self._counter}:{author.date.isoformat()}".encode("utf-8")
+        ).hexdigest()
+        self._commits[sha] = _CommitData(tree_sha, parents, message, author)
+        return sha
+
+    def _resolve_commit(self, ref: Optional[str]) -> str:
+        """브랜치 이름 또는 커밋 SHA → 커밋 SHA"""
+        ref = ref or DEFAULT_BRANCH
+        if f"heads/{ref}" in self._refs:
+            return self._refs[f"heads/{ref}"]
+        if ref in self._commits:
+            return ref
+        raise UnknownObjectException(404, {"message": f"No commit found for the ref {ref}"}, {})
+
+    def _tree_object(self, tree_sha: str) -> FakeGitTree:
+        return FakeGitTree(tree_sha, [
+            FakeGitTreeElement(path, sha, len(self._blobs[sha]))
+            for path, sha in sorted(self._trees[tree_sha].items())
+        ])
+
+    def _commit_object(self, sha: str, depth: int = 1) -> FakeGitCommit:
+        data = self._commits[sha]
+        parents = [self._commit_object(p, depth - 1) for p in data.parents] if depth > 0 else []
+        return FakeGitCommit(sha, data.message, self._tree_object(data.tree), parents, data.author)
+
+    def _content_file(self, path: str, sha: str) -> FakeContentFile:
+        raw = self._blobs[sha]
+        if len(raw) > CONTENTS_SIZE_LIMIT:
+            return FakeContentFile(path, sha, len(raw), "none", "")
+        return FakeContentFile(path, sha, len(raw), "base64", base64.b64encode(raw).decode("ascii"))
+
+    def _update_ref(self, ref: str, sha: str, force: bool) -> None:
+        with self._lock:
+            current = self._refs.get(ref)
+            if sha not in self._commits:
+                raise GithubException(422, {"message": "Object does not exist"}, self._server.rate_headers())
+            if not force and current not in self._commits[sha].parents:
+                raise GithubException(422, {"message": "Update is not a fast forward"}, self._server.rate_headers())
+            self._refs[ref] = sha
+
+    def _commit_file(self, branch: str, path: str, raw: Optional[bytes], message: str) -> Dict[str, Any]:
+        head = self._resolve_commit(branch)
+        entries = dict(self._trees[self._commits[head].tree])
+        if raw is None:
+            entries.pop(path, None)
+        else:
+            entries[path] = self._put_blob(raw)
+        sha = self._put_commit(message, self._put_tree(entries), [head])
+        self._refs[f"heads/{branch}"] = sha
+        return {
+            "commit": FakeCommit(sha, self._commit_object(sha)),
+            "content": self._content_file(path, entries[path]) if raw is not None else None,
+        }
+
+    # PyGithub Repository API -----------------------------------------------
+
+    def get_contents(self, path: str, ref: Optional[str] = None) -> FakeContentFile:
+        self._server.call("contents")
+        with self._lock:
+            tree = self._trees[self._commits[self._resolve_commit(ref)].tree]
+            if path not in tree:
+                raise UnknownObjectException(404, {"message": "Not Found"}, self._server.rate_headers())
+            return self._content_file(path, tree[path])
+
+    def get_git_blob(self, sha: str) -> FakeGitBlob:
+        self._server.call("git/blobs")
+        with self._lock:
+            if sha not in self._blobs:
+                raise UnknownObjectException(404, {"message": "Not Found"}, self._server.rate_headers())
+            raw = self._blobs[sha]
+        return FakeGitBlob(sha, base64.b64encode(raw).decode("ascii"), len(raw))
+
+    def get_git_tree(self, sha: str, recursive: bool = False) -> FakeGitTree:
+        self._server.call("git/trees")
+        with self._lock:
+            if sha in self._trees:
+                return self._tree_object(sha)
+            return self._tree_object(self._commits[self._resolve_commit(sha)].tree)
+
+    def get_git_ref(self, ref: str) -> FakeGitRef:
+        self._server.call("git/refs")
+        with self._lock:
+            if ref not in self._refs:
+                raise UnknownObjectException(404, {"message": "Not Found"}, self._server.rate_headers())
+            return FakeGitRef(self, ref, self._refs[ref])
+
+    def get_git_commit(self, sha: str) -> FakeGitCommit:
+        self._server.call("git/commits")
+        with self._lock:
+            if sha not in self._commits:
+                raise UnknownObjectException(404, {"message": "Not Found"}, self._server.rate_headers())
+            return self._commit_object(sha)
+
+    def create_git_blob(self, content: str, encoding: str) -> FakeGitBlob:
+        self._server.call("git/blobs:create")
+        raw = base64.b64decode(content) if encoding == "base64" else content.encode("utf-8")
+        with self._lock:
+            sha = self._put_blob(raw)
+        return FakeGitBlob(sha, base64.b64encode(raw).decode("ascii"), len(raw))
+
+    def create_git_tree(self, tree: List[Any], base_tree: Optional[FakeGitTree] = None) -> FakeGitTree:
+        self._server.call("git/trees:create")
+        with self._lock:
+            entries = dict(self._trees[base_tree.sha]) if base_tree is not None else {}
+            for element in tree:
+                identity = element._identity  # InputGitTreeElement
+                if identity.get("sha") is None and "content" not in identity:
+                    entries.pop(identity["path"], None)
+                elif identity.get("sha") is not None:
+                    if identity["sha"] not in self._blobs:
+                        raise GithubException(422, {"message": "Invalid tree info"}, self._server.rate_headers())
+                    entries[identity["path"]] = identity["sha"]
+                else:
+                    entries[identity["path"]] = self._put_blob(identity["content"].encode("utf-8"))
+            return self._tree_object(self._put_tree(entries))
+
+    def create_git_commit(self, message: str, tree: FakeGitTree, parents: List[Any]) -> FakeGitCommit:
+        self._server.call("git/commits:create")
+        with self._lock:
+            sha = self._put_commit(message, tree.sha, [p.sha for p in parents])
+            return self._commit_object(sha)
+
+    def update_file(self, path: str, message: str, content: Union[str, bytes], sha: str,
+                    branch: str = DEFAULT_BRANCH) -> Dict[str, Any]:
+        self._server.call("contents:update")
+        raw = content.encode("utf-8") if isinstance(content, str) else content
+        with self._lock:
+            current = self._trees[self._commits[self._resolve_commit(branch)].tree].get(path)
+            if current is None:
+                raise GithubException(422, {"message": "Invalid request. \"sha\" wasn't supplied."},
+                                      self._server.rate_headers())
+            if current != sha:
+                raise GithubException(409, {"message": f"{path} does not match {sha}"}, self._server.rate_headers())
+            return self._commit_file(branch, path, raw, message)
+
+    def create_file(self, path: str, message: str, content: Union[str, bytes],
+                    branch: str = DEFAULT_BRANCH) -> Dict[str, Any]:
+        self._server.call("contents:create")
+        raw = content.encode("utf-8") if isinstance(content, str) else content
+        with self._lock:
+            if path in self._trees[self._commits[self._resolve_commit(branch)].tree]:
+                raise GithubException(422, {"message": "Invalid request. \"sha\" wasn't supplied."},
+                                      self._server.rate_headers())
+            return self._commit_file(branch, path, raw, message)
+
+    def get_commits(self, sha: Optional[str] = None, path: Optional[str] = None,
+                    until: Optional[datetime] = None, since: Optional[datetime] = None) -> List[FakeCommit]:
+        """첫 번째 부모를 따라 최신순으로, path를 바꾼 커밋만 반환합니다 (페이지 구분 없이 요청 한 번)."""
+        self._server.call("commits")
+        until, since = _as_utc(until), _as_utc(since)
+        with self._lock:
+            commits: List[FakeCommit] = []
+            current: Optional[str] = self._resolve_commit(sha)
+            while current is not None:
+                data = self._commits[current]
+                parent = data.parents[0] if data.parents else None
+                blob = self._trees[data.tree].get(path) if path else None
+                parent_blob = self._trees[self._commits[parent].tree].get(path) if path and parent else None
+                touched = path is None or blob != parent_blob
+                date = data.author.date
+                if touched and (until is None or date <= until) and (since is None or date >= since):
+                    commits.append(FakeCommit(current, self._commit_object(current, depth=0)))
+                current = parent
+            return commits
+
+    # 조건부 ref 요청 (Requester.requestJson) ----------------------------------
+
+    def _ref_response(self, branch: str, etag: Optional[str]) -> Tuple[int, Dict[str, str], str]:
+        with self._lock:
+            head = self._refs.get(f"heads/{branch}")
+        if head is None:
+            return 404, self._server.rate_headers(), json.dumps({"message": "Not Found"})
+        current_etag = f'W/"{head}"'
+        if etag == current_etag:
+            return 304, self._server.rate_headers(), ""
+        body = {"ref": f"refs/heads/{branch}", "object": {"sha": head, "type": "commit"}}
+        return 200, {**self._server.rate_headers(), "etag": current_etag}, json.dumps(body)
+
+
+class FakeRequester:
+    """PyGithub Requester 대역 (할당량 속성과 브랜치 ref 조건부 요청만 지원)"""
+
+    def __init__(self, client: "FakeGithub") -> None:
+        self._client = client
+
+    @property
+    def rate_limiting(self) -> Tuple[int, int]:
+        server = self._client._server
+        return server.remaining, server.config.rate_limit
+
+    @property
+    def rate_limiting_resettime(self) -> int:
+        return self._client._server.reset_at
+
+    def requestJson(self, verb: str, url: str, parameters: Any = None, headers: Optional[Dict[str, str]] = None,
+                    input: Any = None, cnx: Any = None) -> Tuple[int, Dict[str, str], str]:
+        """GET /repos/{owner}/{repo}/git/ref/heads/{branch}만 지원 (304는 할당량을 쓰지 않음)"""
+        parts = url.strip("/").split("/")
+        if verb != "GET" or len(parts) < 7 or parts[0] != "repos" or parts[3:6] != ["git", "ref", "heads"]:
+            return 404, self._client._server.rate_headers(), json.dumps({"message": "Not Found"})
+        repo = self._client._repository(f"{parts[1]}/{parts[2]}")
+        etag = (headers or {}).get("If-None-Match")
+        status, response_headers, body = repo._ref_response("/".join(parts[6:]), etag)
+        self._client._server.call("git/ref", consume=status != 304)
+        return status, response_headers, body
+
+
+class FakeGithub:
+    """
+    PyGithub Github 클라이언트 대역
+
+    get_repo()로 얻은 저장소는 클라이언트가 살아 있는 동안 유지되며(같은 이름이면 같은 저장소),
+    처음 열 때 seed_data_dir의 JSON 파일을 첫 커밋으로 올립니다.
+    """
+
+    def __init__(self, config: Optional[FakeGithubConfig] = None) -> None:
+        self.config = config or FakeGithubConfig()
+        self._server = _Server(self.config)
+        self._repos: Dict[str, FakeRepository] = {}
+        self._lock = threading.Lock()
+        self.requester = FakeRequester(self)
+
+    def _repository(self, full_name: str) -> FakeRepository:
+        with self._lock:
+            if full_name not in self._repos:
+                seed_dir = Path(self.config.seed_data_dir) if self.config.seed_data_dir else None
+                self._repos[full_name] = FakeRepository(self._server, full_name, seed_dir)
+            return self._repos[full_name]
+
+    def get_repo(self, full_name_or_id: str, lazy: bool = False) -> FakeRepository:
+        if not lazy:
+            self._server.call("repos")
+        return self._repository(full_name_or_id)
+
+    def fail_next(self, status: int, times: int = 1, endpoint: Optional[str] = None) -> None:
+        """
+        다음 요청(들)을 지정한 상태로 실패시킵니다 (시험용, 무작위 오류보다 우선).
+
+        Args:
+            status: HTTP 상태 코드 (NETWORK_ERROR=0이면 연결 오류)
+            times: 실패시킬 요청 수
+            endpoint: 대상 엔드포인트 (예: 'contents', 'contents:update', None이면 모든 요청)
+        """
+        self._server.fail_next(status, times, endpoint)
+
+    def stats(self) -> Dict[str, Any]:
+        """엔드포인트별 요청 수, 주입된 오류 수, 남은 할당량, 누적 지연(초)"""
+        server = self._server
+        return {
+            "calls": dict(server.calls),
+            "errors": {str(status): count for status, count in server.errors.items()},
+            "remaining": server.remaining,
+            "limit": server.config.rate_limit,
+            "latency_seconds": round(server.latency_total, 3),
+        }
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """
+    조회 조건 시각을 UTC(시간대 있음)로 바꿉니다.
+    PyGithub처럼 시간대가 없는 값은 UTC로 간주합니다 (커밋 시각도 GitHub처럼 UTC로 기록).
+    """
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -3,50 +3,465 @@ GitHub API 연동 모듈
 GitHub Repository를 데이터베이스처럼 활용하여 JSON 파일을 저장/로드합니다.
 """
 
+import os
 import json
+import base64
+import hashlib
 import streamlit as st
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import BinaryIO, Callable, Dict, Any, List, Mapping, Optional, Tuple
 from github import Github
 from github.GithubException import GithubException
+from github.InputGitTreeElement import InputGitTreeElement
 import time
+import requests
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
+from utils.query_cache import get_query_cache
+from utils.rate_limiter import RateLimitedError, get_scheduler
+from utils.single_flight import SingleFlight
+from utils.merge import merge_for_file
+from utils.change_watcher import ChangeWatcher
+from utils.journal import JournalReplayer, ReplayRejected, WriteAheadJournal
+from utils.json_stream import is_json_array, iter_array_records
+from utils.local_store import StampedCache, atomic_write, make_temp_path, replace_file
+from utils.shared_store import SharedDatasetStore, freeze
+from utils.blob_cache import BlobCache, git_blob_sha
+from utils.fake_github import FakeGithub, FakeGithubConfig
+from utils.aggregates import derive_files, get_materialized_targets
+from utils.storage_format import FORMAT_JSON, decode_data, encode_data, get_compact_format
+from utils.storage_backend import (
+    DEFAULT_DB_PATH, INDEX_FIELD_MAP, SQLiteBackend, StorageBackend, match_record
+)
+
+# 로드 결과 (데이터, 해당 데이터의 버전 blob SHA)
+Loaded = Tuple[Any, str]
 
 # 상수 정의
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_RETRIES = 3
 TIMEOUT_SECONDS = 30
+LARGE_FILE_THRESHOLD = 1 * 1024 * 1024  # Contents API 한도 (초과 시 Git Data API 사용)
+STREAM_CHUNK_SIZE = 3 * 256 * 1024      # 업로드 파일을 임시 파일로 옮길 때 읽는 청크 크기
+HISTORY_LIMIT = 30                      # 버전 기록 조회 시 기본 커밋 수 (GitHub 페이지 크기)
+WATCH_INTERVAL_SECONDS = 15             # 브랜치 변경 감시 주기 (secrets의 CHANGE_WATCH_INTERVAL로 변경, 0이면 끔)
+
+# 파일별 마지막으로 로드/저장한 데이터 버전 (Git blob SHA)
+_data_versions: Dict[str, str] = {}
+# blob SHA별 레코드 수 (내용을 한 번이라도 읽은 버전만 기록)
+_record_counts: Dict[str, int] = {}
+# (파일명, 수정 시각, 크기)별 로컬 파일 blob SHA
+_local_sha_cache: Dict[tuple, str] = {}
+# 로컬 파일별 (변경 표식, (데이터, blob SHA)). 다른 프로세스가 파일을 바꾸면 표식이 달라져 다시 읽음
+# 공유 데이터셋으로만 읽은 파일은 (None, blob SHA)만 남김 (데이터는 _shared_store의 읽기 전용 사본 하나)
+_local_cache = StampedCache()
+# 모든 세션이 참조하는 파일별 읽기 전용 데이터셋 (버전이 바뀔 때만 다시 변환)
+_shared_store = SharedDatasetStore()
+# 과거 버전 blob (SHA별, 불변이므로 무효화 없음)
+_blob_cache = BlobCache()
+# (파일 경로, 커밋 SHA)별 해당 시점 blob SHA (불변, 파일이 없던 커밋은 None)
+_commit_blobs: Dict[tuple, Optional[str]] = {}
+# 같은 파일에 대한 동시 로드를 하나로 합침
+_load_flight = SingleFlight()
+# 변경 감시가 동작 중일 때 재사용하는 파일별 (blob SHA, 데이터). 원격에서 바뀐 파일만 제거됨
+# 공유 데이터셋으로만 읽은 파일은 데이터 없이 (blob SHA, None)만 남김
+_watched_data: Dict[str, tuple] = {}
+# 브랜치 ref 조건부 요청 상태 (ETag, 마지막 head 커밋 SHA). 바뀐 파일을 모두 반영한 뒤에만 갱신
+_watch_state: Dict[str, Optional[str]] = {"etag": None, "head": None}
+# 이번 확인에서 받은 ETag/head (반영이 끝나면 _watch_state로 확정)
+_watch_pending: Dict[str, Optional[str]] = {}
+
+
+def count_records(data: Any) -> int:
+    """JSON 데이터의 레코드 수 (리스트는 항목 수, 딕셔너리는 키 개수)를 반환합니다."""
+    if isinstance(data, (list, dict)):
+        return len(data)
+    return 1
+
+
+class SaveRejectedError(ReplayRejected):
+    """재시도해도 저장할 수 없는 경우 (인증 오류, 기준 버전 없음, 충돌 등). 화면 표시는 호출 측에서 합니다."""
+
+    def __init__(self, message: str, conflicts: Optional[List[Any]] = None, auth: bool = False) -> None:
+        super().__init__(message)
+        self.conflicts = conflicts or []
+        self.auth = auth
+
+
+@dataclass(frozen=True)
+class _SaveTarget:
+    """
+    GitHub 저장 설정. 메인 스레드에서 secrets를 한 번 읽어 만들고,
+    스크립트 실행 컨텍스트가 없는 재전송 스레드에는 이 값을 넘깁니다.
+    """
+    github_client: Github
+    repo_name: str
+    branch_name: str
+    compact: bool
+    backend: Optional[StorageBackend]
+
+
+def _remember_version(filename: str, sha: str, data: Any) -> None:
+    """로드/저장한 파일의 데이터 버전과 레코드 수를 기록합니다."""
+    _data_versions[filename] = sha
+    _record_counts[sha] = count_records(data)
+
+
+def get_data_version(filename: str) -> Optional[str]:
+    """
+    마지막으로 로드/저장한 파일의 데이터 버전(Git blob SHA)을 반환합니다.
+    캐시 키로 사용하며, 데이터가 바뀌면 값도 바뀝니다.
+    
+    Args:
+        filename: JSON 파일명 (예: 'staff_profiles.json')
+        
+    Returns:
+        blob SHA 문자열 또는 None (아직 로드되지 않은 경우)
+    """
+    return _data_versions.get(filename)
+
+
+def compute_data_version(filename: str, data: Any) -> str:
+    """
+    데이터를 현재 저장 형식으로 저장했을 때의 데이터 버전(Git blob SHA)을 계산합니다.
+    저장 후 get_data_version()과 비교하면 병합 없이 이 데이터가 그대로 저장되었는지 알 수 있습니다.
+    
+    Args:
+        filename: JSON 파일명
+        data: 저장할 데이터
+        
+    Returns:
+        blob SHA 문자열
+    """
+    return git_blob_sha(encode_data(data, _storage_format(filename)))
+
+
+def _fake_github_options() -> Optional[Any]:
+    """secrets의 FAKE_GITHUB 설정 (true 또는 설정 테이블, 없거나 꺼져 있으면 None)"""
+    try:
+        options = st.secrets.get("FAKE_GITHUB")
+    except Exception:
+        return None
+    return options or None
+
+
+@st.cache_resource(show_spinner=False)
+def _create_fake_github(options_key: str) -> FakeGithub:
+    """설정별로 GitHub 에뮬레이터를 프로세스당 하나만 생성합니다 (저장한 커밋이 세션 간에 유지됨)."""
+    return FakeGithub(FakeGithubConfig.from_options(json.loads(options_key)))
+
+
+def get_fake_github() -> Optional[FakeGithub]:
+    """FAKE_GITHUB이 설정되어 있으면 GitHub 에뮬레이터를 반환합니다 (요청/오류 통계 확인용)."""
+    options = _fake_github_options()
+    if options is None:
+        return None
+    return _create_fake_github(json.dumps(dict(options) if isinstance(options, Mapping) else {}, sort_keys=True))
+
+
+def _create_github_client() -> Optional[Github]:
+    """
+    GitHub 클라이언트를 생성합니다 (화면 출력 없음, 토큰이 없으면 None).
+    FAKE_GITHUB이 설정되어 있으면 에뮬레이터를 사용합니다.
+    """
+    fake = get_fake_github()
+    if fake is not None:
+        return fake
+    token = st.secrets.get("GITHUB_TOKEN")
+    if not token:
+        return None
+    # 재시도/대기는 공유 스케줄러가 담당하므로 PyGithub 내부 재시도는 끔
+    return Github(token, timeout=TIMEOUT_SECONDS, retry=None)
 
 
 def _get_github_client() -> Optional[Github]:
-    """GitHub 클라이언트를 생성합니다."""
+    """GitHub 클라이언트를 생성합니다. 토큰이 없거나 생성에 실패하면 안내를 표시하고 None을 반환합니다."""
     try:
-        token = st.secrets.get("GITHUB_TOKEN")
-        if not token:
-            st.warning("⚠️ GitHub 토큰이 설정되지 않았습니다. 로컬 데이터를 사용합니다.")
-            return None
-        return Github(token, timeout=TIMEOUT_SECONDS)
+        github_client = _create_github_client()
     except Exception as e:
         st.warning(f"⚠️ GitHub 클라이언트 생성 실패: {e}. 로컬 데이터를 사용합니다.")
         return None
+    if github_client is None:
+        st.warning("⚠️ GitHub 토큰이 설정되지 않았습니다. 로컬 데이터를 사용합니다.")
+    return github_client
 
 
-def _load_from_local(filename: str) -> Optional[Dict[str, Any]]:
-    """로컬 파일에서 JSON 데이터를 로드합니다."""
-    data_path = Path('data') / filename
+def _get_save_target(github_client: Optional[Github]) -> Optional[_SaveTarget]:
+    """
+    저장 설정을 읽습니다 (메인 스레드에서 호출).
+    
+    Returns:
+        _SaveTarget, 클라이언트나 레포지토리 이름이 없으면(GitHub 미설정) None
+    """
+    if github_client is None:
+        return None
     try:
-        if data_path.exists():
-            with open(data_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+        repo_name = st.secrets.get("REPO_NAME")
+        branch_name = st.secrets.get("BRANCH_NAME", "main")
+        compact = bool(st.secrets.get("COMPACT_STORAGE", False))
+    except Exception:
+        return None
+    if not repo_name:
         return None
-    except (IOError, json.JSONDecodeError) as e:
+    return _SaveTarget(github_client, repo_name, branch_name, compact, get_storage_backend())
+
+
+def _storage_format(filename: str, compact: Optional[bool] = None) -> str:
+    """
+    저장 형식을 결정합니다. secrets의 COMPACT_STORAGE가 켜져 있으면 파일별 압축 형식,
+    아니면 사람이 읽는 JSON을 사용합니다. 로드는 형식과 관계없이 자동 판별합니다.
+    compact를 넘기면 secrets를 읽지 않습니다 (재전송 스레드용).
+    """
+    if compact is None:
+        try:
+            compact = bool(st.secrets.get("COMPACT_STORAGE", False))
+        except Exception:
+            compact = False
+    return get_compact_format(filename) if compact else FORMAT_JSON
+
+
+def _load_from_local(filename: str, retain: bool = True) -> Optional[Loaded]:
+    """
+    로컬 파일에서 JSON 데이터를 로드합니다 (데이터, blob SHA).
+    retain이 False면 파싱한 데이터는 캐시에 남기지 않고 버전만 기록합니다 (공유 데이터셋 로드용).
+    """
+    data_path = Path('data') / filename
+    try:
+        # 파일 변경 표식이 같으면 이전에 파싱한 결과 재사용
+        loaded = _local_cache.read(data_path, lambda raw: (decode_data(raw), git_blob_sha(raw)),
+                                   retain=None if retain else lambda value: (None, value[1]))
+        if loaded is None:
+            return None
+        data, sha = loaded
+        _remember_version(filename, sha, data)
+        return loaded
+    except (IOError, EOFError, ValueError) as e:
         st.error(f"❌ 로컬 파일 로드 실패 ({filename}): {e}")
         return None
 
 
+def _show_auth_error() -> None:
+    """GitHub 인증 오류(401) 안내 메시지를 표시합니다."""
+    st.error("❌ GitHub 인증 오류: 토큰이 만료되었거나 유효하지 않습니다.")
+    st.info("""
+    **해결 방법:**
+    1. GitHub → Settings → Developer settings → Personal access tokens
+    2. 새 토큰 생성 (repo 권한)
+    3. `.streamlit/secrets.toml` 파일의 `GITHUB_TOKEN` 값을 업데이트
+    4. 앱을 재시작하세요
+    """)
+
+
+def _read_file_bytes(repo: Any, file_content: Any) -> bytes:
+    """
+    Contents API 응답에서 파일 바이트를 꺼냅니다.
+    1MB를 넘는 파일은 응답에 내용이 없으므로 Git blob API로 받습니다.
+    """
+    if file_content.encoding == "base64" and file_content.content:
+        return file_content.decoded_content
+    get_scheduler().acquire()
+    blob = repo.get_git_blob(file_content.sha)
+    return base64.b64decode(blob.content)
+
+
+def _commit_files(repo: Any, branch_name: str, message: str, expected: Dict[str, Optional[str]],
+                  build: Callable[[Dict[str, str]], Dict[str, bytes]]) -> None:
+    """
+    Git Data API(blob → tree → commit → ref)로 여러 파일을 커밋 하나로 저장합니다.
+    Contents API의 크기 제한이 없고, 원본과 파생 파일을 한 번에 저장할 수 있습니다. 요청마다 스케줄러 토큰을 받습니다.
+    기준 커밋에서 expected의 파일이 기대한 blob SHA가 아니면(None인데 파일이 있어도) 409로 거절하고,
+    ref는 fast-forward로만 갱신하므로 그 사이 다른 커밋이 들어오면 GitHub가 422로 거절합니다.
+    
+    Args:
+        repo: 레포지토리 객체
+        branch_name: 브랜치 이름
+        message: 커밋 메시지
+        expected: 파일 경로 → 편집 기준 blob SHA (파일이 없어야 하면 None)
+        build: 기준 커밋의 {파일 경로: blob SHA} → 저장할 {파일 경로: 바이트}
+    
+    Raises:
+        GithubException: 409 (조회 이후 파일이 바뀜) 또는 422 (ref fast-forward 실패)
+    """
+    scheduler = get_scheduler()
+    scheduler.acquire()
+    ref = repo.get_git_ref(f"heads/{branch_name}")
+    scheduler.acquire()
+    base_commit = repo.get_git_commit(ref.object.sha)
+    scheduler.acquire()
+    base_tree = repo.get_git_tree(base_commit.tree.sha, recursive=True)
+    blobs = {e.path: e.sha for e in base_tree.tree if e.type == "blob"}
+    for path, sha in expected.items():
+        if blobs.get(path) != sha:
+            raise GithubException(409, {"message": f"{path} is at {blobs.get(path)}, expected {sha}"}, None)
+    
+    elements = []
+    for path, raw in build(blobs).items():
+        if blobs.get(path) == git_blob_sha(raw):
+            continue  # 내용이 같은 파일은 커밋에서 제외
+        scheduler.acquire()
+        blob = repo.create_git_blob(base64.b64encode(raw).decode('ascii'), "base64")
+        elements.append(InputGitTreeElement(path, "100644", "blob", sha=blob.sha))
+    if not elements:
+        return
+    scheduler.acquire()
+    tree = repo.create_git_tree(elements, base_commit.tree)
+    scheduler.acquire()
+    commit = repo.create_git_commit(message, tree, [base_commit])
+    scheduler.acquire()
+    ref.edit(commit.sha)
+
+
+def _read_blob_data(repo: Any, blob_sha: Optional[str]) -> Optional[Any]:
+    """blob SHA의 데이터를 읽습니다 (blob 캐시 사용, SHA가 None이면 None)."""
+    if blob_sha is None:
+        return None
+    
+    def fetch() -> bytes:
+        get_scheduler().acquire()
+        return base64.b64decode(repo.get_git_blob(blob_sha).content)
+    
+    return decode_data(_blob_cache.get_or_fetch(blob_sha, fetch))
+
+
+@st.cache_resource(show_spinner=False)
+def _create_sqlite_backend(db_path: str) -> SQLiteBackend:
+    """SQLite 백엔드를 프로세스당 하나만 생성합니다."""
+    return SQLiteBackend(db_path)
+
+
+def get_storage_backend() -> Optional[StorageBackend]:
+    """
+    설정된 저장소 백엔드를 반환합니다.
+    secrets의 STORAGE_BACKEND가 'sqlite'이면 SQLite를 기본 저장소로 쓰고 GitHub는 동기화 대상이 됩니다.
+    
+    Returns:
+        StorageBackend 또는 None (GitHub + 로컬 JSON만 사용)
+    """
+    try:
+        backend_name = st.secrets.get("STORAGE_BACKEND", "github")
+        db_path = st.secrets.get("SQLITE_PATH", DEFAULT_DB_PATH)
+    except Exception:
+        return None
+    if backend_name == SQLiteBackend.name:
+        return _create_sqlite_backend(db_path)
+    return None
+
+
+def _poll_data_tree(github_client: Github, repo_name: str, branch_name: str) -> Optional[Dict[str, str]]:
+    """
+    브랜치 ref를 조건부 요청(If-None-Match)으로 확인합니다. 304 응답은 API 할당량을 쓰지 않습니다.
+    head가 바뀐 경우에만 트리를 조회하여 data/*.json의 {파일명: blob SHA}를 반환합니다.
+    감시 스레드에서 실행되므로 secrets/화면 출력을 사용하지 않고, 실패는 예외로 감시자에 전달합니다.
+    
+    Returns:
+        파일별 blob SHA 스냅샷, 변경이 없으면 None
+    """
+    _watch_pending.clear()
+    scheduler = get_scheduler()
+    with scheduler.background():
+        scheduler.acquire()
+        headers = {"If-None-Match": _watch_state["etag"]} if _watch_state["etag"] else {}
+        status, response_headers, body = github_client.requester.requestJson(
+            "GET", f"/repos/{repo_name}/git/ref/heads/{branch_name}", headers=headers
+        )
+        scheduler.observe(github_client)
+        if status == 304:
+            return None
+        if status != 200:
+            raise GithubException(status, body, response_headers)
+        
+        head = json.loads(body)["object"]["sha"]
+        # 트리 조회와 캐시 무효화가 끝나기 전에 ETag를 확정하면 실패 시 이후 확인이 모두 304가 되므로 보류
+        _watch_pending.update(etag=response_headers.get("etag"), head=head)
+        if head == _watch_state["head"]:
+            return None
+        
+        scheduler.acquire()
+        tree = github_client.get_repo(repo_name, lazy=True).get_git_tree(head, recursive=True)
+    
+    return {
+        element.path[len("data/"):]: element.sha
+        for element in tree.tree
+        if element.type == "blob" and element.path.startswith("data/") and element.path.endswith(".json")
+        and "/" not in element.path[len("data/"):]
+    }
+
+
+def _commit_watch_state() -> None:
+    """확인 결과가 모두 반영된 뒤 보류해 둔 ETag와 head를 확정합니다."""
+    if _watch_pending:
+        _watch_state.update(_watch_pending)
+        _watch_pending.clear()
+
+
+def _apply_remote_changes(github_client: Github, repo_name: str, branch_name: str,
+                          backend: Optional[StorageBackend], snapshot: Dict[str, str], changed: List[str]) -> None:
+    """
+    원격에서 바뀐 파일 중 이 프로세스가 다른 버전을 들고 있는 파일의 캐시와 색인만 무효화합니다.
+    대시보드 집계 등 파생 파일은 원본과 같은 커밋으로 바뀌고, 읽을 때도 원본 버전을 비교하므로 따로 다시 계산하지 않습니다.
+    감시 스레드에서 실행되므로 실패는 예외로 감시자에 전달합니다 (다음 확인에서 다시 반영).
+    """
+    for filename in changed:
+        remote_sha = snapshot.get(filename)
+        cached = _watched_data.get(filename)
+        if cached is not None and cached[0] != remote_sha:
+            _watched_data.pop(filename, None)
+        if _data_versions.get(filename) not in (None, remote_sha):
+            get_query_cache().invalidate(filename)
+        # SQLite 백엔드는 다음 조회 전에 원격 버전으로 다시 채움
+        if backend is not None and remote_sha and backend.version(filename) not in (None, remote_sha):
+            backend.save(filename, *_fetch_remote(github_client, repo_name, branch_name, filename))
+
+
+@st.cache_resource(show_spinner=False)
+def _start_change_watcher(repo_name: str, branch_name: str, interval: float, _github_client: Github,
+                          _backend: Optional[StorageBackend]) -> ChangeWatcher:
+    """
+    (레포지토리, 브랜치)별로 변경 감시 스레드를 프로세스당 하나만 시작합니다.
+    감시 스레드에는 스크립트 실행 컨텍스트가 없으므로 설정과 클라이언트는 여기서 받아 넘깁니다.
+    """
+    return ChangeWatcher(
+        lambda: _poll_data_tree(_github_client, repo_name, branch_name),
+        lambda snapshot, changed: _apply_remote_changes(_github_client, repo_name, branch_name, _backend,
+                                                        snapshot, changed),
+        interval, on_synced=_commit_watch_state
+    ).start()
+
+
+def _get_change_watcher() -> Optional[ChangeWatcher]:
+    """GitHub가 설정되어 있으면 변경 감시자를 반환합니다 (필요 시 시작). 설정이 없거나 꺼져 있으면 None."""
+    try:
+        interval = float(st.secrets.get("CHANGE_WATCH_INTERVAL", WATCH_INTERVAL_SECONDS))
+        repo_name = st.secrets.get("REPO_NAME")
+        has_token = bool(st.secrets.get("GITHUB_TOKEN")) or _fake_github_options() is not None
+        branch_name = st.secrets.get("BRANCH_NAME", "main")
+    except Exception:
+        return None
+    if interval <= 0 or not repo_name or not has_token:
+        return None
+    github_client = _get_github_client()
+    if github_client is None:
+        return None
+    return _start_change_watcher(repo_name, branch_name, interval, github_client, get_storage_backend())
+
+
+def get_watcher_stats() -> Optional[Dict[str, Any]]:
+    """변경 감시 상태를 반환합니다 (감시하지 않으면 None)."""
+    watcher = _get_change_watcher()
+    if watcher is None:
+        return None
+    stats = watcher.stats()
+    stats["head"] = _watch_state["head"]
+    return stats
+
+
 def load_data(filename: str) -> Optional[Dict[str, Any]]:
     """
-    GitHub Repository에서 JSON 파일을 로드합니다.
-    실패 시 로컬 data/ 폴더에서 로드합니다.
+    JSON 데이터를 로드합니다.
+    SQLite 백엔드가 설정되어 있으면 먼저 조회하고, 없으면 GitHub → 로컬 data/ 폴더 순으로 로드한 뒤
+    백엔드에 채워 둡니다. 같은 파일을 동시에 요청한 세션들은 한 번의 조회/파싱 결과를 공유하므로
+    반환된 데이터를 직접 수정하지 마세요.
     
     Args:
         filename: 로드할 JSON 파일명 (예: 'dashboard_data.json')
@@ -54,6 +469,178 @@ def load_data(filename: str) -> Optional[Dict[str, Any]]:
     Returns:
         JSON 데이터 (dict) 또는 None
     """
+    return load_data_with_version(filename)[0]
+
+
+def load_data_with_version(filename: str) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    load_data와 같지만 반환한 데이터의 버전(Git blob SHA)을 함께 반환합니다.
+    get_data_version()은 다른 세션의 로드/저장으로 바뀔 수 있으므로 캐시 키에는 이 값을 사용하세요.
+    
+    Args:
+        filename: 로드할 JSON 파일명
+        
+    Returns:
+        (데이터, 버전) 튜플, 로드하지 못하면 (None, None)
+    """
+    loaded = _load_flight.do(filename, lambda: _load_data(filename))
+    return loaded if loaded is not None else (None, None)
+
+
+def load_shared_data(filename: str) -> Optional[Any]:
+    """
+    읽기 전용 공유 데이터셋을 로드합니다. 프로세스 전체에서 파일 버전당 사본 하나만 유지되므로
+    동시 사용자가 늘어도 메모리가 늘지 않습니다. 레코드는 dict처럼 읽을 수 있는 FrozenRecord,
+    목록은 tuple이며 수정할 수 없습니다 (수정/저장이 필요하면 load_data 사용).
+    
+    Args:
+        filename: 로드할 JSON 파일명 (예: 'staff_profiles.json')
+        
+    Returns:
+        읽기 전용 데이터 또는 None
+    """
+    return load_shared_data_with_version(filename)[0]
+
+
+def load_shared_data_with_version(filename: str) -> Tuple[Optional[Any], Optional[str]]:
+    """
+    load_shared_data와 같지만 반환한 데이터셋의 버전을 함께 반환합니다 (검색/색인 캐시 키용).
+    
+    Args:
+        filename: 로드할 JSON 파일명
+        
+    Returns:
+        (읽기 전용 데이터, 버전) 튜플, 로드하지 못하면 (None, None)
+    """
+    # 다시 받거나 파싱하지 않고 알 수 있는 현재 버전이 공유 데이터셋과 같으면 그대로 반환
+    version = _peek_version(filename)
+    if version is not None:
+        frozen = _shared_store.peek(filename, version)
+        if frozen is not None:
+            return frozen, version
+    
+    # 변환할 원본 데이터는 캐시에 남기지 않음 (프로세스에 남는 사본은 읽기 전용 데이터셋 하나)
+    loaded = _load_flight.do(filename, lambda: _load_data(filename, retain=False))
+    if loaded is None:
+        return None, None
+    data, version = loaded
+    return _shared_store.get(filename, version, data), version
+
+
+def _peek_version(filename: str) -> Optional[str]:
+    """
+    원격 조회나 파싱 없이 알 수 있는 파일의 현재 버전 (_load_data와 같은 우선순위).
+    저널 대기 중이거나, 감시 결과를 신뢰할 수 없는 GitHub 모드면 None.
+    """
+    if _get_replayer().journal.has_pending(filename):
+        return None
+    watcher = _get_change_watcher()
+    if watcher is not None:
+        cached = _watched_data.get(filename) if watcher.is_fresh() else None
+        return cached[0] if cached is not None else None
+    backend = get_storage_backend()
+    if backend is not None:
+        return backend.version(filename)
+    if _get_github_client():
+        return None
+    cached = _local_cache.peek(Path('data') / filename)
+    return cached[1] if cached is not None else None
+
+
+def get_shared_store_stats() -> Dict[str, int]:
+    """공유 데이터셋 저장소 통계 (데이터셋 수, 재사용/변환 횟수)를 반환합니다."""
+    return _shared_store.stats()
+
+
+def _load_data(filename: str, retain: bool = True) -> Optional[Loaded]:
+    """
+    백엔드 → GitHub → 로컬 순으로 데이터를 로드합니다 (load_data의 실제 작업).
+    retain이 False면 받은 데이터는 캐시하지 않고 버전만 기록합니다 (공유 데이터셋 로드용).
+    """
+    # GitHub 반영을 기다리는 저장이 있으면 원격보다 최신이므로 저널 내용을 사용
+    pending = _get_replayer().journal.get_pending(filename)
+    if pending is not None:
+        data = pending["payload"]
+        sha = compute_data_version(filename, data)
+        _remember_version(filename, sha, data)
+        return data, sha
+    
+    # 변경 감시가 최근 확인에 성공했으면 원격에서 바뀌지 않은 파일은 다시 받지 않음
+    watcher = _get_change_watcher()
+    cached = _watched_data.get(filename) if watcher is not None and watcher.is_fresh() else None
+    if cached is not None and cached[1] is not None:
+        sha, data = cached
+        _remember_version(filename, sha, data)
+        return data, sha
+    
+    loaded, from_remote = _load_uncached(filename, retain)
+    # 오류로 대신 읽은 로컬 사본은 원격 버전이 아니므로 재사용하지 않음 (다음 로드에서 다시 시도)
+    if watcher is not None and loaded is not None and from_remote:
+        data, sha = loaded
+        _watched_data[filename] = (sha, data if retain else None)
+    return loaded
+
+
+def _load_uncached(filename: str, retain: bool = True) -> Tuple[Optional[Loaded], bool]:
+    """
+    백엔드 → GitHub → 로컬 순으로 데이터를 로드합니다.
+    
+    Returns:
+        (로드 결과, 백엔드/GitHub에서 받았는지 여부). 로컬 폴백이면 False
+    """
+    backend = get_storage_backend()
+    if backend is not None:
+        stored = backend.load(filename)
+        if stored is not None:
+            data, version = stored
+            _remember_version(filename, version, data)
+            return (data, version), True
+    
+    loaded = _fetch_from_github(filename)
+    if loaded is None:
+        return _load_from_local(filename, retain), False
+    if backend is not None:
+        backend.save(filename, *loaded)
+    return loaded, True
+
+
+def _fetch_remote(github_client: Github, repo_name: str, branch_name: str, filename: str) -> Loaded:
+    """
+    GitHub에서 파일을 받아 파싱합니다 (데이터, blob SHA). 화면 출력 없이 실패를 예외로 전달하므로
+    백그라운드 스레드에서도 사용할 수 있습니다.
+    
+    Raises:
+        GithubException: 재시도 후에도 실패한 경우 (401은 재시도하지 않음)
+        ValueError, EOFError: 파일 형식 오류
+    """
+    # lazy: 저장소 정보 조회 요청 없이 객체만 만듦 (요청은 파일 조회 한 번, 토큰 하나)
+    repo = github_client.get_repo(repo_name, lazy=True)
+    file_path = f"data/{filename}"
+    
+    # 재시도 로직 (속도 제한/백오프는 공유 스케줄러가 결정)
+    scheduler = get_scheduler()
+    for attempt in range(MAX_RETRIES):
+        try:
+            scheduler.acquire()
+            file_content = repo.get_contents(file_path, ref=branch_name)
+            # 바이트를 바로 파싱하여 디코딩된 문자열 사본을 만들지 않음 (형식 자동 판별)
+            data = decode_data(_read_file_bytes(repo, file_content))
+            scheduler.observe(github_client)
+            _remember_version(filename, file_content.sha, data)
+            return data, file_content.sha
+        except GithubException as e:
+            scheduler.observe(github_client)
+            if e.status != 401 and attempt < MAX_RETRIES - 1 and scheduler.should_retry(e):
+                scheduler.backoff(attempt, e)
+                continue
+            raise  # 마지막 시도는 항상 여기서 끝남
+
+
+def _fetch_from_github(filename: str) -> Optional[Loaded]:
+    """
+    GitHub Repository에서 JSON 파일을 로드합니다 (데이터, blob SHA).
+    설정이 없거나 실패하면 None을 반환하며, 로컬 data/ 폴더 폴백은 호출 측에서 처리합니다.
+    """
     # GitHub에서 로드 시도
     github_client = _get_github_client()
     if github_client:
@@ -63,57 +650,117 @@ def load_data(filename: str) -> Optional[Dict[str, Any]]:
             
             if not repo_name:
                 st.warning("⚠️ GitHub 레포지토리 이름이 설정되지 않았습니다. 로컬 데이터를 사용합니다.")
-                return _load_from_local(filename)
-            
-            repo = github_client.get_repo(repo_name)
-            file_path = f"data/{filename}"
+                return None
             
-            # 재시도 로직
-            for attempt in range(MAX_RETRIES):
-                try:
-                    file_content = repo.get_contents(file_path, ref=branch_name)
-                    content = file_content.decoded_content.decode('utf-8')
-                    data = json.loads(content)
-                    return data
-                except GithubException as e:
-                    # 401 인증 오류 처리
-                    if e.status == 401:
-                        st.error("❌ GitHub 인증 오류: 토큰이 만료되었거나 유효하지 않습니다.")
-                        st.info("""
-                        **해결 방법:**
-                        1. GitHub → Settings → Developer settings → Personal access tokens
-                        2. 새 토큰 생성 (repo 권한)
-                        3. `.streamlit/secrets.toml` 파일의 `GITHUB_TOKEN` 값을 업데이트
-                        4. 앱을 재시작하세요
-                        """)
-                        break
-                    elif attempt < MAX_RETRIES - 1:
-                        time.sleep(1)  # 1초 대기 후 재시도
-                        continue
-                    else:
-                        st.warning(f"⚠️ GitHub에서 파일을 로드할 수 없습니다 ({filename}): {e}. 로컬 데이터를 사용합니다.")
-                        break
-                except json.JSONDecodeError as e:
-                    st.error(f"❌ JSON 파싱 오류 ({filename}): {e}")
-                    return _load_from_local(filename)
+            return _fetch_remote(github_client, repo_name, branch_name, filename)
         except GithubException as e:
-            # 최상위 레벨 인증 오류 처리
+            # 인증 오류 처리
             if e.status == 401:
-                st.error("❌ GitHub 인증 오류: 토큰이 만료되었거나 유효하지 않습니다.")
-                st.info("""
-                **해결 방법:**
-                1. GitHub → Settings → Developer settings → Personal access tokens
-                2. 새 토큰 생성 (repo 권한)
-                3. `.streamlit/secrets.toml` 파일의 `GITHUB_TOKEN` 값을 업데이트
-                4. 앱을 재시작하세요
-                """)
+                _show_auth_error()
             else:
-                st.warning(f"⚠️ GitHub 연동 오류: {e}. 로컬 데이터를 사용합니다.")
+                st.warning(f"⚠️ GitHub에서 파일을 로드할 수 없습니다 ({filename}): {e}. 로컬 데이터를 사용합니다.")
+        except (ValueError, EOFError) as e:
+            st.error(f"❌ JSON 파싱 오류 ({filename}): {e}")
         except Exception as e:
             st.warning(f"⚠️ GitHub 연동 오류: {e}. 로컬 데이터를 사용합니다.")
     
-    # 로컬 폴백
-    return _load_from_local(filename)
+    return None
+
+
+def _get_repo() -> Optional[Any]:
+    """설정된 GitHub 레포지토리 객체를 반환합니다 (설정이 없거나 실패하면 None). 조회 요청 없이 만든 lazy 객체입니다."""
+    github_client = _get_github_client()
+    if not github_client:
+        return None
+    repo_name = st.secrets.get("REPO_NAME")
+    if not repo_name:
+        st.warning("⚠️ GitHub 레포지토리 이름이 설정되지 않았습니다. 로컬 데이터를 사용합니다.")
+        return None
+    return github_client.get_repo(repo_name, lazy=True)
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _get_last_commit(path: str, blob_sha: str) -> Dict[str, Any]:
+    """
+    파일의 마지막 커밋 정보를 조회합니다.
+    같은 blob SHA에 대해서는 결과가 바뀌지 않으므로 SHA를 키로 캐시합니다.
+    """
+    repo = _get_repo()
+    branch_name = st.secrets.get("BRANCH_NAME", "main")
+    get_scheduler().acquire()
+    commit = repo.get_commits(sha=branch_name, path=path)[0]
+    return {
+        "sha": commit.sha,
+        "message": commit.commit.message.splitlines()[0],
+        "date": commit.commit.author.date.strftime("%Y-%m-%d %H:%M")
+    }
+
+
+def _list_local_files() -> List[Dict[str, Any]]:
+    """로컬 data/ 폴더의 JSON 파일 메타데이터 목록"""
+    files = []
+    for path in sorted(Path('data').glob('*.json')):
+        try:
+            stat = path.stat()
+            # 수정 시각/크기가 같으면 이전에 계산한 SHA 재사용
+            stamp = (path.name, stat.st_mtime_ns, stat.st_size)
+            sha = _local_sha_cache.get(stamp)
+            if sha is None:
+                sha = git_blob_sha(path.read_bytes())
+                _local_sha_cache[stamp] = sha
+        except OSError as e:
+            st.warning(f"⚠️ 로컬 파일 정보를 읽을 수 없습니다 ({path.name}): {e}")
+            continue
+        files.append({
+            "name": path.name,
+            "size": stat.st_size,
+            "sha": sha,
+            "last_commit": f"로컬 수정 {time.strftime('%Y-%m-%d %H:%M', time.localtime(stat.st_mtime))}",
+            "records": _record_counts.get(sha)
+        })
+    return files
+
+
+def list_data_files() -> List[Dict[str, Any]]:
+    """
+    data/ 폴더의 JSON 파일 메타데이터(크기, blob SHA, 마지막 커밋, 레코드 수)를 반환합니다.
+    GitHub에서는 트리 API 한 번으로 목록을 가져오며 파일 내용은 다운로드하지 않습니다.
+    레코드 수는 해당 버전을 한 번이라도 로드한 경우에만 표시됩니다.
+    
+    Returns:
+        파일 정보 딕셔너리 리스트 (name, size, sha, last_commit, records)
+    """
+    try:
+        repo = _get_repo()
+        if repo is None:
+            return _list_local_files()
+        branch_name = st.secrets.get("BRANCH_NAME", "main")
+        get_scheduler().acquire()
+        tree = repo.get_git_tree(branch_name, recursive=True)
+        files = []
+        for element in tree.tree:
+            if element.type != "blob" or not element.path.startswith("data/") or not element.path.endswith(".json"):
+                continue
+            if "/" in element.path[len("data/"):]:
+                continue
+            try:
+                commit = _get_last_commit(element.path, element.sha)
+                last_commit = f"{commit['date']} · {commit['message']}"
+            except Exception:
+                last_commit = "-"
+            files.append({
+                "name": element.path[len("data/"):],
+                "size": element.size,
+                "sha": element.sha,
+                "last_commit": last_commit,
+                "records": _record_counts.get(element.sha)
+            })
+        return files
+    except GithubException as e:
+        st.warning(f"⚠️ GitHub 파일 목록 조회 실패: {e}. 로컬 데이터를 사용합니다.")
+    except Exception as e:
+        st.warning(f"⚠️ GitHub 연동 오류: {e}. 로컬 데이터를 사용합니다.")
+    return _list_local_files()
 
 
 def _validate_json_data(data: Dict[str, Any], filename: str) -> bool:
@@ -134,13 +781,138 @@ def _validate_json_data(data: Dict[str, Any], filename: str) -> bool:
     return True
 
 
-def save_data(filename: str, json_content: Dict[str, Any]) -> bool:
+def _save_to_local(filename: str, raw: bytes, json_content: Any, target: Optional[_SaveTarget] = None) -> str:
+    """
+    인코딩된 파일 바이트를 로컬 data/ 폴더(와 설정된 백엔드)에 저장하고 데이터 버전을 갱신합니다.
+    target을 넘기면 백엔드 설정을 secrets에서 다시 읽지 않습니다.
+    
+    Returns:
+        저장한 데이터의 버전 (blob SHA)
+    """
+    data_path = Path('data') / filename
+    # 임시 파일 작성 후 교체: 다른 프로세스는 이전 내용 또는 새 내용만 읽음
+    stamp = atomic_write(data_path, raw)
+    sha = git_blob_sha(raw)
+    _local_cache.put(data_path, stamp, (json_content, sha))
+    _remember_version(filename, sha, json_content)
+    _watched_data.pop(filename, None)
+    # 이전 버전의 검색 결과는 더 이상 조회되지 않으므로 즉시 정리
+    get_query_cache().invalidate(filename)
+    
+    backend = target.backend if target is not None else get_storage_backend()
+    if backend is not None:
+        backend.save(filename, json_content, sha)
+    return sha
+
+
+def _save_derived_to_local(derived: Dict[str, Any], target: Optional[_SaveTarget] = None) -> None:
+    """원본과 함께 계산한 파생 파일(대시보드 집계, KPI 이력)을 로컬 사본에 반영합니다."""
+    for name, content in derived.items():
+        compact = target.compact if target is not None else None
+        _save_to_local(name, encode_data(content, _storage_format(name, compact)), content, target)
+
+
+def _get_remote_file(repo: Any, branch_name: str, file_path: str) -> Optional[Any]:
+    """원격 파일 정보(ContentFile)를 조회합니다. 파일이 없으면 None."""
+    try:
+        return repo.get_contents(file_path, ref=branch_name)
+    except GithubException as e:
+        if e.status == 404:
+            return None
+        raise
+
+
+def _write_file(repo: Any, branch_name: str, file_path: str, filename: str, raw: bytes,
+                current_sha: Optional[str], json_content: Any = None,
+                compact: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    파일을 커밋합니다. current_sha를 조건으로 업데이트하므로 그 사이 원격이 바뀌면
+    409(Contents API의 SHA 불일치, Git Data API는 기준 커밋의 blob 비교) 또는
+    422(ref fast-forward 실패)로 거절되어 호출 측의 재조회/병합 루프가 처리합니다.
+    원본 데이터셋이면 json_content로 파생 파일(대시보드 집계, KPI 이력)을 계산하여 같은 커밋으로 저장합니다.
+    
+    Returns:
+        함께 저장한 {파생 파일명: 내용}
+    """
+    targets = get_materialized_targets(filename)
+    if targets or len(raw) > LARGE_FILE_THRESHOLD:
+        # 대용량 파일과 파생 파일이 있는 원본은 Git Data API로 커밋 하나에 저장
+        derived: Dict[str, Any] = {}
+        
+        def build(blobs: Dict[str, str]) -> Dict[str, bytes]:
+            derived.clear()
+            if targets:
+                # 파생 파일은 기준 커밋의 내용에서 계산하므로 그 사이 바뀐 내용을 덮어쓰지 않음
+                derived.update(derive_files(filename, json_content, git_blob_sha(raw),
+                                            lambda name: _read_blob_data(repo, blobs.get(f"data/{name}"))))
+            files = {file_path: raw}
+            for name, content in derived.items():
+                files[f"data/{name}"] = encode_data(content, _storage_format(name, compact))
+            return files
+        
+        _commit_files(repo, branch_name, f"Update {filename}", {file_path: current_sha}, build)
+        return derived
+    if current_sha:
+        get_scheduler().acquire()
+        repo.update_file(file_path, f"Update {filename}", raw, current_sha, branch=branch_name)
+    else:
+        get_scheduler().acquire()
+        repo.create_file(file_path, f"Create {filename}", raw, branch=branch_name)
+    return {}
+
+
+def _merge_remote_changes(repo: Any, filename: str, base_sha: str, ours: Any, remote_file: Any) -> Any:
+    """
+    편집 시작 이후 원격 파일이 바뀐 경우 base/ours/theirs를 레코드 단위로 3-way 병합합니다.
+    
+    Returns:
+        병합된 데이터
+    
+    Raises:
+        SaveRejectedError: 같은 레코드를 양쪽에서 다르게 바꾼 충돌이 있는 경우
+    """
+    theirs = decode_data(_read_file_bytes(repo, remote_file))
+    try:
+        get_scheduler().acquire()
+        base = decode_data(base64.b64decode(repo.get_git_blob(base_sha).content))
+    except GithubException:
+        # 기준 버전을 찾을 수 없으면 양쪽에 모두 있는 다른 레코드를 충돌로 처리
+        base = None
+    
+    result = merge_for_file(filename, base, ours, theirs)
+    if not result.ok:
+        raise SaveRejectedError(
+            f"저장 충돌 ({filename}): 다른 사용자가 같은 레코드를 수정했습니다. 최신 데이터를 다시 불러와 수정해주세요.",
+            conflicts=[c["key"] if c["key"] is not None else "(파일 전체)" for c in result.conflicts[:20]]
+        )
+    return result.merged
+
+
+def _show_save_rejected(error: SaveRejectedError) -> None:
+    """저장 거절 사유를 표시합니다."""
+    if error.auth:
+        _show_auth_error()
+        return
+    st.error(f"❌ {error}")
+    if error.conflicts:
+        st.write("충돌 레코드:", error.conflicts)
+
+
+def save_data(filename: str, json_content: Dict[str, Any], base_version: Optional[str]) -> bool:
     """
     JSON 데이터를 GitHub Repository에 저장합니다.
+    편집 기준 버전(base_version) 이후 원격 파일이 바뀌었으면 레코드 단위 3-way 병합 후 저장하고,
+    같은 레코드를 양쪽에서 다르게 바꾼 경우에만 충돌로 실패합니다.
+    기준 버전이 없는데(None) 원격에 파일이 있으면 다른 사용자의 변경을 덮어쓸 수 있으므로 저장하지 않습니다.
+    GitHub에 연결할 수 없으면 로컬 저널에 기록하고 로컬 사본에 바로 반영한 뒤,
+    연결이 돌아오면 백그라운드에서 순서대로 GitHub에 반영합니다.
+    GitHub가 설정되지 않았으면(토큰 또는 레포지토리 이름 없음) 로컬 data/ 폴더에만 저장합니다.
     
     Args:
         filename: 저장할 JSON 파일명 (예: 'dashboard_data.json')
         json_content: 저장할 JSON 데이터 (dict)
+        base_version: 편집을 시작할 때 데이터와 함께 받은 버전 (load_data_with_version 결과,
+            파일이 없던 상태에서 새로 만들면 None). 세션별로 보관하여 전달해야 합니다.
         
     Returns:
         저장 성공 여부 (bool)
@@ -149,92 +921,473 @@ def save_data(filename: str, json_content: Dict[str, Any]) -> bool:
     if not _validate_json_data(json_content, filename):
         return False
     
-    # GitHub 클라이언트 확인
-    github_client = _get_github_client()
-    if not github_client:
-        st.error("❌ GitHub 토큰이 설정되지 않아 저장할 수 없습니다.")
+    # 같은 파일의 이전 저장이 아직 저널에서 대기 중이면 순서를 지키기 위해 뒤에 이어서 기록
+    if _get_replayer().journal.has_pending(filename):
+        return _save_offline(filename, json_content, base_version)
+    
+    # GitHub 설정 확인 (설정이 없으면 반영할 곳이 없으므로 저널에 기록하지 않음)
+    target = _get_save_target(_get_github_client())
+    if target is None:
+        st.warning(f"⚠️ GitHub가 설정되지 않아 로컬 data/ 폴더에만 저장합니다 ({filename}).")
+        _save_locally(filename, json_content)
+        return True
+    
+    try:
+        _, merged = _save_to_github(target, filename, json_content, base_version)
+    except SaveRejectedError as e:
+        _show_save_rejected(e)
         return False
+    except Exception as e:
+        if not _is_offline_error(e):
+            st.error(f"❌ GitHub 연동 오류: {e}")
+            return False
+        st.warning(f"⚠️ GitHub에 연결할 수 없습니다 ({e}). 로컬에 저장하고 연결되면 반영합니다.")
+        return _save_offline(filename, json_content, base_version)
+    if merged:
+        st.info(f"🔀 다른 사용자의 변경 사항과 병합하여 저장했습니다 ({filename}).")
+    return True
+
+
+def _is_offline_error(error: Exception) -> bool:
+    """연결 문제(네트워크 오류, 시간 초과, 서버 오류, 한도 초과)인지 확인합니다."""
+    if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout, RateLimitedError)):
+        return True
+    return isinstance(error, GithubException) and error.status >= 500
+
+
+def _save_locally(filename: str, json_content: Any) -> str:
+    """
+    로컬 사본과 파생 파일(대시보드 집계, KPI 이력)에만 반영합니다.
+    
+    Returns:
+        저장한 데이터의 버전 (blob SHA)
+    """
+    sha = _save_to_local(filename, encode_data(json_content, _storage_format(filename)), json_content)
+    local = lambda name: (_load_from_local(name) or (None, None))[0]
+    _save_derived_to_local(derive_files(filename, json_content, sha, local))
+    return sha
+
+
+def _save_offline(filename: str, json_content: Any, base_version: Optional[str]) -> bool:
+    """
+    저장 요청을 저널에 기록(fsync)하고 로컬 사본과 집계에 바로 반영합니다.
+    저널에는 원본만 기록하며, 파생 파일은 재전송할 때 원격 내용으로 다시 계산하여 같은 커밋으로 저장합니다.
+    """
+    replayer = _get_replayer()
+    replayer.journal.append(filename, json_content, base_version)
+    _save_locally(filename, json_content)
+    replayer.wake()
+    return True
+
+
+def _replay_journal_entry(target: Optional[_SaveTarget], filename: str, json_content: Any,
+                          base_version: Optional[str]) -> str:
+    """
+    저널에 대기 중인 저장 요청을 GitHub에 반영합니다 (파생 파일도 같은 커밋으로 다시 계산하여 저장).
+    재전송 스레드에서 실행되므로 화면에 출력하지 않고, 거절 사유는 get_journal_stats()로 확인합니다.
     
+    Returns:
+        반영 후 원격 데이터 버전
+    
+    Raises:
+        SaveRejectedError: 충돌, 인증 오류 등 재시도해도 반영할 수 없는 경우
+        requests.exceptions.ConnectionError: GitHub 설정이 없거나 연결할 수 없는 경우 (다음 주기에 다시 시도)
+    """
+    if target is None:
+        raise requests.exceptions.ConnectionError("GitHub가 설정되지 않았습니다")
+    with get_scheduler().background():
+        version, _ = _save_to_github(target, filename, json_content, base_version)
+    return version
+
+
+@st.cache_resource(show_spinner=False)
+def _get_replayer() -> JournalReplayer:
+    """
+    저장 저널과 재전송 작업자를 프로세스당 하나만 생성합니다.
+    재전송 스레드에는 스크립트 실행 컨텍스트가 없으므로 저장 설정은 여기서(메인 스레드) 한 번 읽어 넘깁니다.
+    """
     try:
-        repo_name = st.secrets.get("REPO_NAME")
-        branch_name = st.secrets.get("BRANCH_NAME", "main")
+        target = _get_save_target(_create_github_client())
+    except Exception:
+        target = None
+    return JournalReplayer(WriteAheadJournal(), partial(_replay_journal_entry, target)).start()
+
+
+def get_journal_stats() -> Dict[str, Any]:
+    """저장 저널 상태 (대기/실패 항목 수, 실패/거절 사유, 마지막 재전송 오류)를 반환합니다."""
+    replayer = _get_replayer()
+    stats = replayer.journal.stats()
+    stats["rejected"] = dict(replayer.rejections)
+    stats["last_error"] = replayer.last_error
+    return stats
+
+
+def _save_to_github(target: _SaveTarget, filename: str, json_content: Any,
+                    base_version: Optional[str]) -> Tuple[str, bool]:
+    """
+    GitHub에 저장합니다 (충돌 시 3-way 병합). 원본 데이터셋이면 대시보드 집계와 KPI 이력도 같은 커밋으로 저장합니다.
+    화면에 출력하지 않으므로 재전송 스레드에서도 사용하며, 연결 문제는 예외로 그대로 전달합니다.
+    
+    Returns:
+        (저장한 데이터 버전, 원격 변경과 병합했는지 여부)
+    
+    Raises:
+        SaveRejectedError: 인증 오류, 충돌 등 재시도해도 안 되는 실패
+    """
+    github_client = target.github_client
+    repo = github_client.get_repo(target.repo_name, lazy=True)
+    file_path = f"data/{filename}"
+    raw = encode_data(json_content, _storage_format(filename, target.compact))
+    base_sha = base_version
+    merged = False
+    
+    # 재시도 로직 (속도 제한/백오프는 공유 스케줄러가 결정)
+    scheduler = get_scheduler()
+    for attempt in range(MAX_RETRIES):
+        try:
+            scheduler.acquire()
+            remote_file = _get_remote_file(repo, target.branch_name, file_path)
+            current_sha = remote_file.sha if remote_file else None
+            if base_sha is None and current_sha is not None:
+                raise SaveRejectedError(f"저장 거절 ({filename}): 편집 기준 버전을 알 수 없어 다른 사용자의 변경을 "
+                                        "덮어쓸 수 있습니다. 최신 데이터를 다시 불러와 수정해주세요.")
+            if base_sha and current_sha and current_sha != base_sha:
+                # 편집 시작 이후 원격 파일이 바뀜 → 레코드 단위 3-way 병합
+                json_content = _merge_remote_changes(repo, filename, base_sha, json_content, remote_file)
+                raw = encode_data(json_content, _storage_format(filename, target.compact))
+                base_sha = current_sha
+                merged = True
+            derived = _write_file(repo, target.branch_name, file_path, filename, raw, current_sha, json_content,
+                                  target.compact)
+            scheduler.observe(github_client)
+            
+            # 로컬에도 저장 (폴백용), 함께 커밋한 파생 파일도 반영
+            sha = _save_to_local(filename, raw, json_content, target)
+            _save_derived_to_local(derived, target)
+            
+            return sha, merged
+            
+        except SaveRejectedError:
+            raise
+        except GithubException as e:
+            scheduler.observe(github_client)
+            # 401 인증 오류 처리
+            if e.status == 401:
+                raise SaveRejectedError(f"GitHub 인증 오류 ({filename}): {e}", auth=True) from e
+            elif e.status in (409, 422) and attempt < MAX_RETRIES - 1:
+                # 조회와 커밋 사이에 원격이 바뀜 → 다시 조회하여 병합
+                continue
+            elif attempt < MAX_RETRIES - 1 and scheduler.should_retry(e):
+                scheduler.backoff(attempt, e)
+                continue
+            elif _is_offline_error(e):
+                raise
+            else:
+                raise SaveRejectedError(f"GitHub 저장 실패 ({filename}): {e}") from e
+        except Exception as e:
+            if _is_offline_error(e):
+                raise
+            raise SaveRejectedError(f"저장 중 오류 발생 ({filename}): {e}") from e
+    raise SaveRejectedError(f"GitHub 저장 실패 ({filename}): 재시도 횟수를 초과했습니다.")
+
+
+def _count_file_records(path: Path) -> int:
+    """JSON 파일의 레코드 수 (최상위 배열은 스트리밍으로 세어 파일 전체를 객체로 만들지 않음)"""
+    with open(path, 'rb') as f:
+        if is_json_array(f):
+            return sum(1 for _ in iter_array_records(f))
+        return count_records(json.load(f))
+
+
+def save_raw_data(filename: str, stream: BinaryIO, base_version: Optional[str]) -> bool:
+    """
+    업로드된 JSON 파일을 파싱/재직렬화 없이 원본 바이트 그대로 GitHub에 저장합니다.
+    청크 단위로 읽으면서 임시 파일 기록과 blob SHA 계산을 한 번에 처리하고,
+    1MB를 넘는 파일은 Git Data API로 커밋합니다. JSON 형식 검증은 호출 측에서 수행합니다.
+    압축 저장 형식(COMPACT_STORAGE)을 쓰는 파일은 원본 바이트를 그대로 저장할 수 없으므로 save_data로 저장합니다.
+    GitHub에 연결할 수 없으면 save_data와 같이 로컬 저널에 기록하고 연결되면 반영하며,
+    GitHub가 설정되지 않았으면 로컬 data/ 폴더에만 저장합니다.
+    
+    Args:
+        filename: 저장할 JSON 파일명
+        stream: 파일 바이너리 스트림 (예: st.file_uploader 결과)
+        base_version: 편집 기준 버전 (save_data와 같음, 새 파일이면 None)
         
-        if not repo_name:
-            st.error("❌ GitHub 레포지토리 이름이 설정되지 않았습니다.")
-            return False
+    Returns:
+        저장 성공 여부 (bool)
+    """
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(0)
+    if size > MAX_FILE_SIZE:
+        st.error(f"❌ 파일 크기가 너무 큽니다 (최대 {MAX_FILE_SIZE / 1024 / 1024}MB): {filename}")
+        return False
+    
+    # 저널에 대기 중인 저장이 있으면 순서를 지키기 위해, 압축 형식이면 인코딩을 위해,
+    # 원본 데이터셋이면 파생 파일을 같은 커밋으로 저장하기 위해,
+    # GitHub가 설정되지 않았으면 로컬에만 저장하기 위해 일반 저장 경로 사용
+    target = _get_save_target(_get_github_client())
+    if (target is None or _get_replayer().journal.has_pending(filename)
+            or _storage_format(filename) != FORMAT_JSON or get_materialized_targets(filename)):
+        return save_data(filename, json.loads(stream.read().decode('utf-8')), base_version)
+    
+    data_path = Path('data') / filename
+    tmp_path = make_temp_path(data_path)
+    
+    try:
+        github_client = target.github_client
+        repo = github_client.get_repo(target.repo_name, lazy=True)
+        branch_name = target.branch_name
         
-        repo = github_client.get_repo(repo_name)
-        file_path = f"data/{filename}"
-        content_str = json.dumps(json_content, ensure_ascii=False, indent=4)
+        # 스트리밍: 임시 파일 + blob SHA (업로드 내용을 메모리에 모아 두지 않음)
+        blob_sha = hashlib.sha1(f"blob {size}\0".encode('utf-8'))
+        with open(tmp_path, 'wb') as f:
+            while True:
+                chunk = stream.read(STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                blob_sha.update(chunk)
+        sha = blob_sha.hexdigest()
         
-        # 재시도 로직
+        file_path = f"data/{filename}"
+        base_sha = base_version
+        scheduler = get_scheduler()
         for attempt in range(MAX_RETRIES):
             try:
-                # 기존 파일 확인
-                try:
-                    existing_file = repo.get_contents(file_path, ref=branch_name)
-                    # 파일이 존재하면 업데이트
-                    repo.update_file(
-                        file_path,
-                        f"Update {filename}",
-                        content_str,
-                        existing_file.sha,
-                        branch=branch_name
-                    )
-                except GithubException:
-                    # 파일이 없으면 생성
-                    repo.create_file(
-                        file_path,
-                        f"Create {filename}",
-                        content_str,
-                        branch=branch_name
-                    )
-                
-                # 로컬에도 저장 (폴백용)
-                data_path = Path('data') / filename
-                data_path.parent.mkdir(exist_ok=True)
-                with open(data_path, 'w', encoding='utf-8') as f:
-                    json.dump(json_content, f, ensure_ascii=False, indent=4)
-                
-                return True
-                
+                scheduler.acquire()
+                remote_file = _get_remote_file(repo, branch_name, file_path)
+                current_sha = remote_file.sha if remote_file else None
+                if current_sha is not None and current_sha != base_sha:
+                    # 원격이 바뀌었으면(또는 기준 버전이 없으면) 파싱하여 병합/거절 판단을 save_data에 맡김
+                    json_content = json.loads(tmp_path.read_bytes().decode('utf-8'))
+                    return save_data(filename, json_content, base_version=base_sha)
+                # blob API 요청 본문(JSON)은 한 번에 보내야 하므로 base64 문자열은 커밋 직전에 한 번만 만듦
+                _write_file(repo, branch_name, file_path, filename, tmp_path.read_bytes(), current_sha)
+                scheduler.observe(github_client)
+                break
             except GithubException as e:
-                # 401 인증 오류 처리
+                scheduler.observe(github_client)
                 if e.status == 401:
-                    st.error("❌ GitHub 인증 오류: 토큰이 만료되었거나 유효하지 않습니다.")
-                    st.info("""
-                    **해결 방법:**
-                    1. GitHub → Settings → Developer settings → Personal access tokens
-                    2. 새 토큰 생성 (repo 권한)
-                    3. `.streamlit/secrets.toml` 파일의 `GITHUB_TOKEN` 값을 업데이트
-                    4. 앱을 재시작하세요
-                    """)
+                    _show_auth_error()
                     return False
-                elif attempt < MAX_RETRIES - 1:
-                    time.sleep(1)
+                elif e.status in (409, 422) and attempt < MAX_RETRIES - 1:
+                    continue
+                elif attempt < MAX_RETRIES - 1 and scheduler.should_retry(e):
+                    scheduler.backoff(attempt, e)
                     continue
+                elif _is_offline_error(e):
+                    raise
                 else:
                     st.error(f"❌ GitHub 저장 실패 ({filename}): {e}")
                     return False
-            except Exception as e:
-                st.error(f"❌ 저장 중 오류 발생 ({filename}): {e}")
-                return False
-                
-    except GithubException as e:
-        # 최상위 레벨 인증 오류 처리
-        if e.status == 401:
-            st.error("❌ GitHub 인증 오류: 토큰이 만료되었거나 유효하지 않습니다.")
-            st.info("""
-            **해결 방법:**
-            1. GitHub → Settings → Developer settings → Personal access tokens
-            2. 새 토큰 생성 (repo 권한)
-            3. `.streamlit/secrets.toml` 파일의 `GITHUB_TOKEN` 값을 업데이트
-            4. 앱을 재시작하세요
-            """)
+        
+        # GitHub 저장이 끝난 뒤에만 로컬 파일 교체
+        replace_file(tmp_path, data_path)
+        _watched_data.pop(filename, None)
+        get_query_cache().invalidate(filename)
+        
+        # 백엔드에 색인해야 하면 파싱, 아니면 레코드 수만 스트리밍으로 셈
+        backend = get_storage_backend()
+        if backend is not None:
+            json_content = json.loads(data_path.read_bytes().decode('utf-8'))
+            _remember_version(filename, sha, json_content)
+            backend.save(filename, json_content, sha)
         else:
+            _data_versions[filename] = sha
+            _record_counts[sha] = _count_file_records(data_path)
+        
+        return True
+        
+    except Exception as e:
+        # 연결 문제면 save_data와 같이 저널에 기록하고 연결되면 반영 (임시 파일은 원격 요청 전에 다 씀)
+        if _is_offline_error(e):
+            st.warning(f"⚠️ GitHub에 연결할 수 없습니다 ({e}). 로컬에 저장하고 연결되면 반영합니다.")
+            return _save_offline(filename, json.loads(tmp_path.read_bytes().decode('utf-8')), base_version)
+        if isinstance(e, GithubException) and e.status == 401:
+            _show_auth_error()
+        elif isinstance(e, GithubException):
             st.error(f"❌ GitHub 연동 오류: {e}")
+        else:
+            st.error(f"❌ 저장 중 오류 발생 ({filename}): {e}")
         return False
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def get_file_history(filename: str, limit: int = HISTORY_LIMIT,
+                     until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    파일을 변경한 커밋 목록을 최신순으로 반환합니다.
+    
+    Args:
+        filename: 데이터 파일명 (예: 'evaluation_manual.json')
+        limit: 최대 커밋 수
+        until: 이 시각 이전의 커밋만 조회 (시간대가 없으면 로컬 시각, None이면 최신부터)
+        
+    Returns:
+        [{'commit', 'message', 'date', 'author'}, ...] (GitHub 설정이 없으면 빈 리스트)
+    """
+    try:
+        repo = _get_repo()
+        if repo is None:
+            st.warning("⚠️ 버전 기록은 GitHub 연동 시에만 조회할 수 있습니다.")
+            return []
+        branch_name = st.secrets.get("BRANCH_NAME", "main")
+        options: Dict[str, Any] = {"sha": branch_name, "path": f"data/{filename}"}
+        if until is not None:
+            # PyGithub는 시간대 없는 값을 UTC로 보내므로 로컬 시각으로 보고 UTC로 바꿔서 전달
+            options["until"] = until.astimezone(timezone.utc)
+        
+        history = []
+        for i, commit in enumerate(repo.get_commits(**options)):
+            if i >= limit:
+                break
+            if i % HISTORY_LIMIT == 0:
+                get_scheduler().acquire()  # 페이지마다 요청 한 번
+            history.append({
+                "commit": commit.sha,
+                "message": commit.commit.message.splitlines()[0],
+                "date": commit.commit.author.date.strftime("%Y-%m-%d %H:%M"),
+                "author": commit.commit.author.name
+            })
+        return history
+    except GithubException as e:
+        if e.status == 401:
+            _show_auth_error()
+        else:
+            st.error(f"❌ 버전 기록 조회 실패 ({filename}): {e}")
+        return []
     except Exception as e:
-        st.error(f"❌ GitHub 연동 오류: {e}")
-        return False
+        st.error(f"❌ 버전 기록 조회 중 오류 발생 ({filename}): {e}")
+        return []
+
+
+def _blob_sha_at(repo: Any, file_path: str, commit_sha: str) -> Optional[str]:
+    """커밋 시점의 파일 blob SHA (받은 내용은 blob 캐시에 저장, 파일이 없었으면 None)"""
+    key = (file_path, commit_sha)
+    if key not in _commit_blobs:
+        get_scheduler().acquire()
+        try:
+            file_content = repo.get_contents(file_path, ref=commit_sha)
+        except GithubException as e:
+            if e.status != 404:
+                raise
+            _commit_blobs[key] = None
+            return None
+        if file_content.encoding == "base64" and file_content.content:
+            _blob_cache.put(file_content.sha, file_content.decoded_content)
+        _commit_blobs[key] = file_content.sha
+    return _commit_blobs[key]
+
+
+def load_data_version(filename: str, commit_sha: str) -> Optional[Any]:
+    """
+    커밋 시점의 데이터를 읽기 전용으로 로드합니다.
+    한 번 받은 blob은 SHA별로 캐시되므로 같은 버전을 다시 비교해도 GitHub에 요청하지 않습니다.
+    
+    Args:
+        filename: 데이터 파일명
+        commit_sha: 커밋 SHA (get_file_history 결과의 'commit')
+        
+    Returns:
+        읽기 전용 데이터 (FrozenRecord/tuple), 해당 시점에 파일이 없으면 None
+    """
+    file_path = f"data/{filename}"
+    try:
+        # 커밋 → blob SHA와 blob 내용이 모두 캐시되어 있으면 GitHub에 연결하지 않음
+        blob_sha = _commit_blobs.get((file_path, commit_sha))
+        raw = _blob_cache.get(blob_sha) if blob_sha else None
+        if raw is None:
+            repo = _get_repo()
+            if repo is None:
+                st.warning("⚠️ 과거 버전은 GitHub 연동 시에만 조회할 수 있습니다.")
+                return None
+            blob_sha = _blob_sha_at(repo, file_path, commit_sha)
+            if blob_sha is None:
+                return None
+            
+            def fetch() -> bytes:
+                get_scheduler().acquire()
+                return base64.b64decode(repo.get_git_blob(blob_sha).content)
+            
+            raw = _blob_cache.get_or_fetch(blob_sha, fetch)
+        return freeze(decode_data(raw))
+    except GithubException as e:
+        st.error(f"❌ 과거 버전 로드 실패 ({filename}@{commit_sha[:7]}): {e}")
+        return None
+    except Exception as e:
+        st.error(f"❌ 과거 버전 로드 중 오류 발생 ({filename}): {e}")
+        return None
+
+
+def load_data_as_of(filename: str, when: datetime) -> Optional[Any]:
+    """
+    지정한 시각 기준 마지막 커밋의 데이터를 읽기 전용으로 로드합니다.
+    
+    Args:
+        filename: 데이터 파일명
+        when: 기준 시각 (시간대가 없으면 로컬 시각)
+        
+    Returns:
+        읽기 전용 데이터, 그 시각 이전에 파일이 없었으면 None
+    """
+    history = get_file_history(filename, limit=1, until=when)
+    if not history:
+        return None
+    return load_data_version(filename, history[0]["commit"])
+
+
+def get_blob_cache_stats() -> Dict[str, int]:
+    """과거 버전 blob 캐시 통계를 반환합니다."""
+    return _blob_cache.stats()
+
+
+def query_records(filename: str, limit: Optional[int] = None, **filters: Any) -> List[Dict[str, Any]]:
+    """
+    색인 필드(name/date/dept/org) 조건으로 레코드를 조회합니다.
+    SQLite 백엔드에서는 색인 질의로 필요한 행만 읽고, 그 외에는 전체 로드 후 필터링합니다.
+    
+    Args:
+        filename: 데이터 파일명 (예: 'schedules.json')
+        limit: 최대 결과 수
+        **filters: 색인 필드 조건 (값 또는 값 목록, 예: name=['김철수', '이영희'])
+        
+    Returns:
+        조건에 맞는 레코드 리스트
+    """
+    backend = get_storage_backend()
+    if backend is not None:
+        if backend.version(filename) is None:
+            load_data(filename)  # 백엔드에 아직 없으면 채워 둠
+        return backend.query(filename, filters, limit)
+    
+    records = [r for r in (load_data(filename) or []) if match_record(r, filename, filters)]
+    return records[:limit] if limit is not None else records
+
+
+def distinct_values(filename: str, field: str) -> List[str]:
+    """
+    색인 필드의 고유 값 목록을 정렬하여 반환합니다 (예: 일정 데이터의 직원 이름).
+    
+    Args:
+        filename: 데이터 파일명
+        field: 색인 필드 ('name', 'date', 'dept', 'org')
+        
+    Returns:
+        고유 값 리스트
+    """
+    backend = get_storage_backend()
+    if backend is not None:
+        if backend.version(filename) is None:
+            load_data(filename)
+        return backend.distinct(filename, field)
+    
+    column = INDEX_FIELD_MAP.get(filename, {}).get(field, field)
+    return sorted({r.get(column) for r in (load_data(filename) or []) if r.get(column)})
+
 
+def get_load_stats() -> Dict[str, int]:
+    """load_data 단일 실행 통계 (실제 로드 횟수, 다른 세션과 결과를 공유한 횟수)를 반환합니다."""
+    return _load_flight.stats()
@@ -0,0 +1,394 @@
+"""
+쓰기 선행 저널(WAL) 모듈
+GitHub에 바로 저장할 수 없을 때 저장 요청을 로컬 저널 파일에 먼저 기록합니다.
+동시에 들어온 기록은 fsync 한 번으로 함께 디스크에 반영(그룹 커밋)하고,
+백그라운드 작업자가 연결이 돌아오면 파일별로 순서대로 재전송합니다.
+같은 파일에 대한 여러 저장은 마지막 내용만 남기도록 압축합니다.
+저널 파일은 프로세스마다 따로 두고(wal-<pid>.ndjson) 살아 있는 동안 잠가 두므로 압축 시 교체해도
+다른 프로세스의 기록이 사라지지 않으며, 종료된 프로세스의 저널은 다음에 시작하는 프로세스가 넘겨받습니다.
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 생존 여부를 알 수 없으므로 저널 파일 하나를 사용 (단일 프로세스 가정)
+    fcntl = None
+
+# 상수 정의
+DEFAULT_JOURNAL_DIR = "data/.journal"
+JOURNAL_GLOB = "wal*.ndjson"
+FSYNC_BATCH_WINDOW = 0.005   # 그룹 커밋을 위해 fsync 전에 다른 기록을 기다리는 시간 (초)
+REPLAY_INTERVAL = 10.0       # 재전송 시도 주기 (초)
+MAX_REPLAY_ATTEMPTS = 5      # 이 횟수만큼 실패하면 실패 항목으로 보관
+COMPACT_MIN_LINES = 200      # 저널 줄 수가 이보다 많고 대기 항목의 4배를 넘으면 압축
+
+
+class ReplayRejected(Exception):
+    """재시도해도 반영할 수 없는 저장 요청 (충돌, 인증 오류 등). 메시지는 실패 사유로 기록됩니다."""
+
+
+def _apply_entry(pending: Dict[str, Dict[str, Any]], failed: Dict[str, Dict[str, Any]],
+                 entry: Dict[str, Any]) -> None:
+    """저널 항목 하나를 대기/실패 상태에 반영합니다."""
+    filename = entry["filename"]
+    if entry["type"] == "put":
+        previous = pending.get(filename)
+        pending[filename] = {
+            "seq": entry["seq"],
+            "first_seq": previous["first_seq"] if previous else entry.get("first_seq", entry["seq"]),
+            "base_version": previous["base_version"] if previous else entry.get("base_version"),
+            "payload": entry["payload"],
+            "timestamp": entry["timestamp"],
+            "attempts": 0
+        }
+        failed.pop(filename, None)
+    elif entry["type"] == "ack":
+        current = pending.get(filename)
+        if current and current["seq"] <= entry["upto"]:
+            del pending[filename]
+        elif current and entry.get("version"):
+            # upto 이후에 다시 저장된 내용은 계속 대기하되, 반영된 버전 위에서 병합하도록 기준을 옮김
+            current["base_version"] = entry["version"]
+    elif entry["type"] == "fail":
+        current = pending.pop(filename, None)
+        if current:
+            current["error"] = entry.get("error")
+            failed[filename] = current
+
+
+def _read_journal(path: Path, pending: Dict[str, Dict[str, Any]],
+                  failed: Dict[str, Dict[str, Any]]) -> Tuple[int, int]:
+    """
+    저널 파일을 읽어 대기/실패 상태를 복구합니다 (마지막 줄이 잘렸으면 무시).
+
+    Returns:
+        (마지막 순번, 읽은 줄 수)
+    """
+    seq = lines = 0
+    if not path.exists():
+        return seq, lines
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            _apply_entry(pending, failed, entry)
+            seq = max(seq, entry.get("seq", 0))
+            lines += 1
+    return seq, lines
+
+
+def _is_same_file(f: TextIO, path: Path) -> bool:
+    """열린 파일이 아직 path에 있는 파일인지 확인합니다 (교체/삭제되지 않았는지)."""
+    try:
+        return os.stat(path).st_ino == os.fstat(f.fileno()).st_ino
+    except FileNotFoundError:
+        return False
+
+
+def _live_entries(pending: Dict[str, Dict[str, Any]],
+                  failed: Dict[str, Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+    """대기/실패 항목을 처음 대기한 순서대로 반환합니다."""
+    return sorted(list(pending.items()) + list(failed.items()), key=lambda item: item[1]["first_seq"])
+
+
+class WriteAheadJournal:
+    """
+    파일별 저장 요청 저널 (스레드 안전)
+
+    파일마다 대기 중인 최신 내용 하나와, 처음 대기하기 시작한 시점의 기준 버전(base_version)을 유지합니다.
+    기준 버전은 재전송 시 3-way 병합의 base로 사용됩니다.
+    """
+
+    def __init__(self, directory: str = DEFAULT_JOURNAL_DIR) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / (f"wal-{os.getpid()}.ndjson" if fcntl else "wal.ndjson")
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._seq = 0
+        self._written_seq = 0
+        self._synced_seq = 0
+        self._lines = 0
+        self._fsyncs = 0
+        # 파일명 → {'seq', 'first_seq', 'base_version', 'payload', 'timestamp', 'attempts'}
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._failed: Dict[str, Dict[str, Any]] = {}
+        self._file = self._open()
+        self._seq, self._lines = _read_journal(self.path, self._pending, self._failed)
+        self._written_seq = self._synced_seq = self._seq
+        self._adopt_orphans()
+
+    # 복구 / 기록 ---------------------------------------------------------------
+
+    def _open(self) -> TextIO:
+        """자기 저널 파일을 추가 모드로 열고, 살아 있는 동안 다른 프로세스가 넘겨받지 않도록 잠급니다."""
+        while True:
+            f = open(self.path, "a", encoding="utf-8")
+            if fcntl is None:
+                return f
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            # 잠금을 기다리는 사이 이전 프로세스(같은 pid)의 파일을 다른 프로세스가 넘겨받아 지웠으면 다시 엶
+            if _is_same_file(f, self.path):
+                return f
+            f.close()
+
+    def _adopt_orphans(self) -> None:
+        """
+        종료된 프로세스가 남긴 저널(잠겨 있지 않은 다른 wal 파일)의 대기/실패 항목을 자기 저널로 옮깁니다.
+        옮긴 내용을 fsync한 뒤에만 원래 파일을 지우므로 중간에 중단되어도 항목이 사라지지 않습니다.
+        """
+        if fcntl is None:
+            return
+        for path in sorted(self.directory.glob(JOURNAL_GLOB)):
+            if path == self.path:
+                continue
+            with open(path, "a+", encoding="utf-8") as orphan:
+                try:
+                    fcntl.flock(orphan.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    continue  # 다른 프로세스가 사용 중
+                if not _is_same_file(orphan, path):
+                    continue  # 잠금을 기다리는 사이 다른 프로세스가 이미 넘겨받음
+                pending: Dict[str, Dict[str, Any]] = {}
+                failed: Dict[str, Dict[str, Any]] = {}
+                _read_journal(path, pending, failed)
+                with self._lock:
+                    for name, entry in _live_entries(pending, failed):
+                        self._write({"type": "put", "filename": name, "base_version": entry["base_version"],
+                                           "payload": entry["payload"], "timestamp": entry["timestamp"]})
+                        if name in failed:
+                            self._write({"type": "fail", "filename": name, "error": entry.get("error")})
+                self._sync(self._seq)
+                path.unlink()
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        """저널 항목 하나를 메모리 상태에 반영합니다."""
+        self._seq = max(self._seq, entry.get("seq", 0))
+        _apply_entry(self._pending, self._failed, entry)
+
+    def _write(self, entry: Dict[str, Any]) -> int:
+        """항목을 저널 끝에 쓰고(아직 fsync 전) 순번을 반환합니다. 잠금 안에서 호출합니다."""
+        self._seq += 1
+        entry["seq"] = self._seq
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self._apply(entry)
+        self._lines += 1
+        self._written_seq = self._seq
+        return self._seq
+
+    def _sync(self, seq: int) -> None:
+        """
+        seq까지 디스크에 반영될 때까지 기다립니다.
+        fsync 중에 도착한 기록은 다음 fsync 한 번으로 함께 반영됩니다 (그룹 커밋).
+        """
+        if self._synced_seq >= seq:
+            return
+        with self._sync_lock:
+            if self._synced_seq >= seq:
+                return
+            time.sleep(FSYNC_BATCH_WINDOW)
+            with self._lock:
+                target = self._written_seq
+                fd = self._file.fileno()
+            os.fsync(fd)
+            self._fsyncs += 1
+            self._synced_seq = target
+
+    def append(self, filename: str, payload: Any, base_version: Optional[str]) -> int:
+        """
+        저장 요청을 저널에 기록하고 디스크에 반영된 뒤 반환합니다.
+
+        Args:
+            filename: 데이터 파일명
+            payload: 저장할 데이터
+            base_version: 편집을 시작한 데이터 버전 (이미 대기 중인 파일이면 기존 기준 유지)
+
+        Returns:
+            저널 순번
+        """
+        entry = {
+            "type": "put",
+            "filename": filename,
+            "base_version": base_version,
+            "payload": payload,
+            "timestamp": datetime.now().isoformat(timespec="seconds")
+        }
+        with self._lock:
+            seq = self._write(entry)
+        self._sync(seq)
+        return seq
+
+    def ack(self, filename: str, seq: int, version: Optional[str] = None) -> None:
+        """
+        seq까지의 저장 요청이 원격에 반영되었음을 기록합니다.
+
+        Args:
+            filename: 데이터 파일명
+            seq: 반영된 마지막 저널 순번
+            version: 반영 후 원격 데이터 버전 (그 뒤에 다시 대기 중인 내용의 새 기준 버전)
+        """
+        with self._lock:
+            seq_written = self._write({"type": "ack", "filename": filename, "upto": seq, "version": version})
+        self._sync(seq_written)
+
+    def fail(self, filename: str, error: str) -> None:
+        """재전송을 포기한 저장 요청을 실패 항목으로 옮깁니다."""
+        with self._lock:
+            seq_written = self._write({"type": "fail", "filename": filename, "error": error})
+        self._sync(seq_written)
+
+    # 조회 / 압축 ---------------------------------------------------------------
+
+    def has_pending(self, filename: str) -> bool:
+        with self._lock:
+            return filename in self._pending
+
+    def get_pending(self, filename: str) -> Optional[Dict[str, Any]]:
+        """파일의 대기 중인 최신 저장 요청 (없으면 None)"""
+        with self._lock:
+            entry = self._pending.get(filename)
+            return dict(entry, filename=filename) if entry else None
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """대기 중인 저장 요청 (파일별 최신 내용, 처음 대기한 순서대로)"""
+        with self._lock:
+            items = [dict(entry, filename=name) for name, entry in self._pending.items()]
+        return sorted(items, key=lambda e: e["first_seq"])
+
+    def record_attempt(self, filename: str) -> int:
+        """재전송 실패 횟수를 하나 늘리고 반환합니다."""
+        with self._lock:
+            entry = self._pending.get(filename)
+            if entry is None:
+                return 0
+            entry["attempts"] += 1
+            return entry["attempts"]
+
+    def compact(self) -> bool:
+        """
+        대기/실패 항목만 남기도록 저널을 다시 씁니다 (임시 파일 작성 후 교체).
+
+        Returns:
+            압축 수행 여부
+        """
+        with self._lock:
+            live = len(self._pending) + len(self._failed)
+            if self._lines < COMPACT_MIN_LINES or self._lines < live * 4:
+                return False
+            entries: List[Dict[str, Any]] = []
+            for name, entry in _live_entries(self._pending, self._failed):
+                entries.append({
+                    "type": "put",
+                    "seq": entry["seq"],
+                    "first_seq": entry["first_seq"],
+                    "filename": name,
+                    "base_version": entry["base_version"],
+                    "payload": entry["payload"],
+                    "timestamp": entry["timestamp"]
+                })
+                if name in self._failed:
+                    entries.append({"type": "fail", "seq": entry["seq"], "filename": name,
+                                    "error": entry.get("error")})
+
+            # 저널 파일은 이 프로세스만 씀. 교체 전에 새 파일을 잠가 두어 다른 프로세스가 넘겨받지 못하게 함
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            f = open(tmp_path, "w", encoding="utf-8")
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+            self._file.close()
+            self._file = f
+            self._lines = len(entries)
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "failed": len(self._failed),
+                "failed_files": sorted(self._failed),
+                "failed_errors": {name: entry.get("error") for name, entry in sorted(self._failed.items())},
+                "lines": self._lines,
+                "fsyncs": self._fsyncs
+            }
+
+
+class JournalReplayer:
+    """
+    저널 재전송 작업자 (데몬 스레드)
+
+    replay_fn(filename, payload, base_version)이 반영 후 원격 버전을 반환하면 반영 완료,
+    ReplayRejected가 발생하면 거절(사유를 rejections에 기록하고 여러 번 거절되면 실패 항목으로 보관),
+    다른 예외가 발생하면 연결 문제로 보고 다음 주기에 다시 시도합니다.
+    """
+
+    def __init__(self, journal: WriteAheadJournal,
+                 replay_fn: Callable[[str, Any, Optional[str]], str],
+                 interval: float = REPLAY_INTERVAL) -> None:
+        self.journal = journal
+        self.interval = interval
+        self._replay_fn = replay_fn
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="journal-replayer", daemon=True)
+        self.last_error: Optional[str] = None
+        self.rejections: Dict[str, str] = {}  # 대기 중인 파일별 마지막 거절 사유
+
+    def start(self) -> "JournalReplayer":
+        self._thread.start()
+        return self
+
+    def wake(self) -> None:
+        """다음 주기를 기다리지 않고 재전송을 시도합니다."""
+        self._wake.set()
+
+    def replay_once(self) -> int:
+        """
+        대기 항목을 처음 대기한 순서대로 재전송합니다. 연결 오류가 나면 이번 주기는 중단합니다.
+
+        Returns:
+            반영된 항목 수
+        """
+        replayed = 0
+        for entry in self.journal.pending():
+            filename = entry["filename"]
+            try:
+                version = self._replay_fn(filename, entry["payload"], entry["base_version"])
+            except ReplayRejected as e:
+                self.rejections[filename] = str(e)
+                if self.journal.record_attempt(filename) >= MAX_REPLAY_ATTEMPTS:
+                    self.journal.fail(filename, str(e))
+                    self.rejections.pop(filename, None)
+                continue
+            except Exception as e:
+                self.last_error = str(e)
+                break
+            self.journal.ack(filename, entry["seq"], version)
+            self.rejections.pop(filename, None)
+            replayed += 1
+        else:
+            self.last_error = None
+        self.journal.compact()
+        return replayed
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                self.replay_once()
+            except Exception as e:
+                self.last_error = str(e)
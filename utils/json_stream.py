@@ -0,0 +1,142 @@
+"""
+스트리밍 JSON 파싱 모듈
+최상위가 배열인 JSON 파일을 청크 단위로 읽으면서 레코드를 하나씩 반환합니다.
+파일 전체를 문자열/객체로 만들지 않으므로 큰 파일도 제한된 메모리로 미리보기/검증할 수 있습니다.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Dict, Iterator, List
+
+# 상수 정의
+STREAM_CHUNK_SIZE = 64 * 1024
+PREVIEW_RECORDS = 20
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_DELIMITERS = ' \t\n\r,]'
+
+
+def is_json_array(stream: BinaryIO) -> bool:
+    """스트림의 최상위 JSON 값이 배열인지 확인합니다 (스트림 위치는 처음으로 되돌림)."""
+    stream.seek(0)
+    head = stream.read(STREAM_CHUNK_SIZE).decode('utf-8', errors='ignore').lstrip('\ufeff \t\n\r')
+    stream.seek(0)
+    return head.startswith('[')
+
+
+def iter_array_records(stream: BinaryIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    최상위 배열의 원소를 하나씩 파싱하여 반환합니다.
+
+    Args:
+        stream: JSON 바이너리 스트림 (UTF-8)
+        chunk_size: 한 번에 읽을 바이트 수
+
+    Yields:
+        배열 원소 (dict, list, 값)
+
+    Raises:
+        json.JSONDecodeError: 최상위가 배열이 아니거나 JSON 형식이 잘못된 경우
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    buffer = ""
+    pos = 0
+    eof = False
+    consumed = 0  # 버퍼에서 잘라낸 문자 수 (오류 위치 표시용)
+
+    def fill() -> None:
+        nonlocal buffer, pos, eof, consumed
+        chunk = stream.read(chunk_size)
+        eof = not chunk
+        consumed += pos
+        buffer = buffer[pos:] + utf8.decode(chunk, final=eof)
+        pos = 0
+
+    def next_char() -> str:
+        """공백을 건너뛰고 다음 문자를 반환합니다 (끝이면 빈 문자열)."""
+        nonlocal pos
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos < len(buffer) or eof:
+                return buffer[pos:pos + 1]
+            fill()
+
+    def error(message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, buffer, pos + consumed)
+
+    while not buffer and not eof:
+        fill()
+    if buffer.startswith('\ufeff'):
+        pos = 1
+    if next_char() != '[':
+        raise error("최상위 JSON 값이 배열이 아닙니다")
+    pos += 1
+
+    # 빈 배열도 배열 뒤 추가 데이터 검사를 거침
+    if next_char() != ']':
+        while True:
+            next_char()
+            # 값이 청크 경계에서 잘렸을 수 있으므로 값 뒤에 구분자가 보일 때까지 더 읽음 (예: 숫자 '2.|5')
+            while True:
+                try:
+                    record, end = decoder.raw_decode(buffer, pos)
+                    if eof or (end < len(buffer) and buffer[end] in _DELIMITERS):
+                        break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise error("배열 원소를 파싱할 수 없습니다")
+                fill()
+            pos = end
+            yield record
+
+            separator = next_char()
+            if separator == ']':
+                break
+            if separator != ',':
+                raise error("',' 또는 ']'가 필요합니다")
+            pos += 1
+
+    pos += 1
+    if next_char():
+        raise error("배열 뒤에 추가 데이터가 있습니다")
+
+
+def scan_array(stream: BinaryIO, preview_count: int = PREVIEW_RECORDS) -> Dict[str, Any]:
+    """
+    최상위 배열을 끝까지 스트리밍하며 검증하고, 미리보기용 요약을 만듭니다.
+    처음 preview_count개 레코드만 메모리에 남깁니다.
+
+    Args:
+        stream: JSON 바이너리 스트림
+        preview_count: 미리보기로 보관할 레코드 수
+
+    Returns:
+        {'count': 전체 레코드 수, 'preview': 앞부분 레코드,
+         'item_types': {타입명: 개수}, 'fields': 딕셔너리 레코드의 필드명 목록}
+
+    Raises:
+        json.JSONDecodeError: JSON 형식이 잘못된 경우
+    """
+    preview: List[Any] = []
+    item_types: Dict[str, int] = {}
+    fields: Dict[str, None] = {}
+    count = 0
+
+    stream.seek(0)
+    for record in iter_array_records(stream):
+        count += 1
+        type_name = type(record).__name__
+        item_types[type_name] = item_types.get(type_name, 0) + 1
+        if isinstance(record, dict):
+            fields.update(dict.fromkeys(record))
+        if len(preview) < preview_count:
+            preview.append(record)
+    stream.seek(0)
+
+    return {
+        "count": count,
+        "preview": preview,
+        "item_types": item_types,
+        "fields": list(fields)
+    }
@@ -0,0 +1,204 @@
+"""
+로컬 파일 저장 모듈
+여러 Streamlit 워커 프로세스가 같은 data/ 폴더를 읽고 쓸 때 파일이 잘리거나 섞이지 않도록
+임시 파일 작성 후 교체(원자적 쓰기)와 파일 잠금(advisory lock)을 제공합니다.
+잠금은 파일 교체와 읽기가 겹치지 않도록 할 뿐 읽기-수정-쓰기 전체를 감싸지 않으므로,
+여러 편집자의 변경 충돌은 저장 시 기준 버전(base_version) 비교와 3-way 병합으로 처리합니다.
+읽는 쪽은 파일 변경 표식(수정 시각, 크기, inode)이 같으면 이전에 파싱한 결과를 재사용합니다.
+"""
+
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows: 잠금 없이 원자적 교체만 사용
+    fcntl = None
+
+# 상수 정의
+LOCK_PREFIX = "."
+LOCK_SUFFIX = ".lock"
+TMP_SUFFIX = ".tmp"
+
+DEFAULT_FILE_MODE = 0o666  # umask를 적용하기 전 새 파일 권한 (open()으로 만든 파일과 같음)
+
+PathLike = Union[str, Path]
+Stamp = Tuple[int, int, int]
+
+
+def _lock_path(path: Path) -> Path:
+    """잠금 파일 경로 (data/.schedules.json.lock, *.json 목록에 나타나지 않음)"""
+    return path.with_name(f"{LOCK_PREFIX}{path.name}{LOCK_SUFFIX}")
+
+
+@contextmanager
+def locked(path: PathLike, exclusive: bool = True) -> Iterator[None]:
+    """
+    파일 단위 잠금을 잡습니다. 쓰기는 배타 잠금, 읽기는 공유 잠금을 사용합니다.
+
+    Args:
+        path: 잠글 데이터 파일 경로
+        exclusive: 배타 잠금 여부 (False면 공유 잠금)
+    """
+    if fcntl is None:
+        yield
+        return
+    lock_path = _lock_path(Path(path))
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def file_stamp(path: PathLike) -> Optional[Stamp]:
+    """
+    파일 변경 표식 (수정 시각 ns, 크기, inode). 파일이 없으면 None.
+    원자적 교체는 항상 새 inode를 만들므로 같은 시각/크기로 다시 써도 표식이 바뀝니다.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+def _current_umask() -> int:
+    """프로세스 umask (읽으려면 잠시 바꿨다가 되돌려야 함)"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _current_umask()
+
+
+def make_temp_path(path: PathLike) -> Path:
+    """
+    같은 폴더에 고유한 임시 파일을 만들고 경로를 반환합니다 (os.replace가 원자적이도록).
+    mkstemp는 0600으로 만들므로, 교체 후에도 권한이 바뀌지 않게 대상 파일의 권한
+    (대상이 없으면 umask를 적용한 기본 권한)으로 맞춥니다.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{LOCK_PREFIX}{path.name}.", suffix=TMP_SUFFIX)
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = DEFAULT_FILE_MODE & ~_UMASK
+    try:
+        os.fchmod(fd, mode)
+    except AttributeError:  # Windows: fchmod 없음 (권한 비트도 사용하지 않음)
+        pass
+    finally:
+        os.close(fd)
+    return Path(tmp_name)
+
+
+def replace_file(tmp_path: PathLike, path: PathLike) -> Stamp:
+    """
+    다 쓴 임시 파일을 디스크에 반영한 뒤 배타 잠금 안에서 대상 파일과 교체합니다.
+
+    Returns:
+        교체된 파일의 변경 표식
+    """
+    with open(tmp_path, "rb+") as f:
+        os.fsync(f.fileno())
+    with locked(path):
+        os.replace(tmp_path, path)
+        return file_stamp(path)
+
+
+def atomic_write(path: PathLike, raw: bytes) -> Stamp:
+    """
+    바이트를 임시 파일에 쓴 뒤 원자적으로 교체합니다. 읽는 쪽은 이전 내용 또는 새 내용만 봅니다.
+
+    Args:
+        path: 대상 파일 경로
+        raw: 저장할 바이트
+
+    Returns:
+        새 파일의 변경 표식
+    """
+    tmp_path = make_temp_path(path)
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(raw)
+        return replace_file(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+class StampedCache:
+    """
+    변경 표식 기반 파싱 결과 캐시 (스레드 안전)
+
+    표식이 같으면 파일을 다시 읽지 않고 이전 결과를 반환하므로 반환값을 직접 수정하지 마세요.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # 경로 → (표식, 값, read로 그대로 반환할 수 있는 값인지)
+        self._entries: Dict[str, Tuple[Stamp, Any, bool]] = {}
+        self._hits = 0
+        self._reads = 0
+
+    def read(self, path: PathLike, parse: Callable[[bytes], Any],
+             retain: Optional[Callable[[Any], Any]] = None) -> Optional[Any]:
+        """
+        파일을 읽어 parse 결과를 반환합니다 (표식이 같으면 캐시 사용, 파일이 없으면 None).
+
+        Args:
+            path: 파일 경로
+            parse: 파일 바이트 → 결과 변환 함수
+            retain: 결과 대신 캐시에 남길 값 (예: 데이터는 버리고 버전만). 이렇게 남긴 값은
+                peek로만 조회되며 다음 read는 파일을 다시 읽습니다
+        """
+        key = str(path)
+        stamp = file_stamp(path)
+        if stamp is None:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == stamp and cached[2]:
+                self._hits += 1
+                return cached[1]
+
+        # 공유 잠금 안에서 읽고, 실제로 읽은 파일의 표식을 기록 (읽는 중 교체되어도 일관됨)
+        with locked(path, exclusive=False):
+            with open(path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                raw = f.read()
+        value = parse(raw)
+        with self._lock:
+            self._reads += 1
+            self._entries[key] = ((stat.st_mtime_ns, stat.st_size, stat.st_ino),
+                                  value if retain is None else retain(value), retain is None)
+        return value
+
+    def peek(self, path: PathLike) -> Optional[Any]:
+        """파일을 읽지 않고, 표식이 같으면 캐시에 남은 값(retain으로 남긴 값 포함)을 반환합니다."""
+        stamp = file_stamp(path)
+        with self._lock:
+            cached = self._entries.get(str(path))
+        if cached is None or stamp is None or cached[0] != stamp:
+            return None
+        return cached[1]
+
+    def put(self, path: PathLike, stamp: Stamp, value: Any) -> None:
+        """방금 쓴 파일의 결과를 기록합니다 (다음 읽기에서 다시 파싱하지 않음)."""
+        with self._lock:
+            self._entries[str(path)] = (stamp, value, True)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self._hits, "reads": self._reads}
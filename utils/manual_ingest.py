@@ -0,0 +1,302 @@
+"""
+평가 매뉴얼 가져오기 모듈
+긴 평가 매뉴얼 문서(마크다운/텍스트)를 한 줄씩 읽으며 평가 항목별 구간으로 나누고,
+가이드라인/전년도 피드백 필드를 추출하여 evaluation_manual.json 형식의 레코드로 만듭니다.
+문서 전체를 메모리에 올리지 않고 현재 구간과 기록 대기 중인 레코드 묶음만 유지합니다.
+
+지원하는 문서 구조:
+    # 교육과정                 (또는 '1. 교육과정')        → 카테고리
+    ## 전임교원 확보율           (또는 '1.1 전임교원 확보율') → 평가 항목
+    가이드라인: ...             (또는 '### 가이드라인', '**가이드라인**') → guide
+    전년도 피드백: ...          (또는 '### 전년도 피드백')                → prev_feedback
+    표시 없는 본문은 가이드라인으로 취급합니다.
+"""
+
+import io
+import json
+import re
+from itertools import chain, islice
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from pathlib import Path
+
+import streamlit as st
+
+from utils.evaluation_index import MANUAL_FIELD_WEIGHTS, register_text_index
+from utils.blob_cache import git_blob_sha
+from utils.github_handler import LARGE_FILE_THRESHOLD, compute_data_version, get_data_version, save_data, save_raw_data
+from utils.local_store import make_temp_path
+from utils.text_index import TextIndex
+
+# 상수 정의
+MANUAL_FILENAME = "evaluation_manual.json"
+SHARD_SIZE = 200            # 한 번에 파일로 내보내는 레코드 수
+PROGRESS_EVERY_LINES = 500  # 진행 상황 보고 간격 (줄)
+MAX_FIELD_CHARS = 4000      # 필드 하나의 최대 길이 (넘으면 잘라내고 경고)
+DETECT_LINES = 200          # 제목 단계 자동 판별에 사용할 문서 앞부분 줄 수
+
+# 필드 표시어 → 필드명
+FIELD_LABELS = {
+    "가이드라인": "guide",
+    "가이드": "guide",
+    "작성 지침": "guide",
+    "전년도 피드백": "prev_feedback",
+    "전년도 지적사항": "prev_feedback",
+    "피드백": "prev_feedback",
+}
+
+_MD_HEADING = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+_NUMBERED = re.compile(r"^(\d+(?:\.\d+)*)\.?\s+(\S.*)$")
+# 표시어 뒤에는 ':' 또는 줄 끝이 와야 함 ('피드백을 반영하여...' 같은 본문은 제외)
+_LABEL = re.compile(
+    r"^\s*(?:[-*]\s*)?(?:#{1,6}\s*)?(?:\*\*)?(" + "|".join(sorted(map(re.escape, FIELD_LABELS), key=len, reverse=True))
+    + r")(?:\*\*)?\s*(?:[:：]\s*(?:\*\*)?\s*(.*)|$)"
+)
+
+
+@dataclass
+class IngestResult:
+    """가져오기 결과"""
+    records: int = 0
+    categories: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    text_index: Optional[TextIndex] = None
+
+
+class _Section:
+    """현재 읽고 있는 평가 항목 구간"""
+
+    def __init__(self, category: str, criteria: str, line_no: int) -> None:
+        self.category = category
+        self.criteria = criteria
+        self.line_no = line_no
+        self.fields: Dict[str, List[str]] = {"guide": [], "prev_feedback": []}
+        self.current = "guide"
+
+    def to_record(self) -> Dict[str, str]:
+        record = {"category": self.category, "criteria": self.criteria}
+        for name, lines in self.fields.items():
+            record[name] = " ".join(" ".join(lines).split())
+        return record
+
+
+def _heading(line: str, numbered: bool) -> Optional[Tuple[int, str]]:
+    """
+    제목 줄이면 (단계, 제목), 아니면 None.
+    마크다운은 '#' 개수, 텍스트 문서(numbered=True)는 번호 단계('1.2' → 2)를 단계로 사용합니다.
+    """
+    match = _MD_HEADING.match(line)
+    if match:
+        return len(match.group(1)), match.group(2).strip()
+    if not numbered:
+        return None
+    match = _NUMBERED.match(line.strip())
+    if match and len(match.group(2)) <= 80:
+        return match.group(1).count(".") + 1, match.group(2).strip()
+    return None
+
+
+def _detect_category_level(lines: List[str], numbered: bool) -> Optional[int]:
+    """
+    본문이 바로 이어지는 첫 제목을 평가 항목으로 보고, 그보다 한 단계 위를 카테고리 단계로 판별합니다.
+    (문서 제목처럼 바로 아래 제목이 이어지는 제목은 건너뜀)
+    """
+    previous: Optional[int] = None
+    for line in lines:
+        if not line.strip():
+            continue
+        heading = _heading(line, numbered) if not _LABEL.match(line) else None
+        if heading is not None:
+            previous = heading[0]
+        elif previous is not None:
+            return max(previous - 1, 1)
+    return None
+
+
+def iter_manual_records(lines: Iterable[str], result: Optional[IngestResult] = None,
+                        category_level: Optional[int] = None,
+                        numbered: bool = False) -> Iterator[Dict[str, str]]:
+    """
+    문서 줄을 읽어 평가 항목 레코드를 구간이 끝날 때마다 하나씩 반환합니다.
+
+    평가 항목은 카테고리보다 한 단계 아래 제목입니다.
+    필드 표시어로 시작하는 제목은 평가 항목이 아니라 필드 구분으로 취급합니다.
+
+    Args:
+        lines: 문서 줄 (파일 객체 등)
+        result: 경고/카테고리를 기록할 결과 객체
+        category_level: 카테고리 제목 단계 (None이면 문서 앞부분으로 자동 판별)
+        numbered: 번호 제목('1.', '1.1') 인식 여부 (텍스트 문서용)
+
+    Yields:
+        {'category', 'criteria', 'guide', 'prev_feedback'}
+    """
+    result = result or IngestResult()
+    category = "기타"
+    section: Optional[_Section] = None
+    if category_level is None:
+        # 앞부분만 읽어 제목 단계를 판별한 뒤 이어서 처리 (메모리 사용은 DETECT_LINES줄로 제한)
+        lines = iter(lines)
+        head = list(islice(lines, DETECT_LINES))
+        category_level = _detect_category_level(head, numbered)
+        lines = chain(head, lines)
+
+    def finish(current: Optional[_Section]) -> Optional[Dict[str, str]]:
+        if current is None:
+            return None
+        record = current.to_record()
+        for name in ("guide", "prev_feedback"):
+            if len(record[name]) > MAX_FIELD_CHARS:
+                record[name] = record[name][:MAX_FIELD_CHARS]
+                result.warnings.append(f"{current.line_no}행 '{current.criteria}': {name}가 너무 길어 잘랐습니다.")
+        if not record["guide"] and not record["prev_feedback"]:
+            result.warnings.append(f"{current.line_no}행 '{current.criteria}': 내용이 없습니다.")
+        return record
+
+    for line_no, raw_line in enumerate(lines, start=1):
+        line = raw_line.rstrip("\r\n")
+        if not line.strip():
+            continue
+
+        label = _LABEL.match(line)
+        if label and section is not None:
+            section.current = FIELD_LABELS[label.group(1)]
+            text = (label.group(2) or "").strip()
+            if text:
+                section.fields[section.current].append(text)
+            continue
+
+        heading = _heading(line, numbered)
+        if heading is not None:
+            level, title = heading
+            if category_level is None or level <= category_level:
+                category_level = level if category_level is None else category_level
+                if level == category_level:
+                    record = finish(section)
+                    if record:
+                        yield record
+                    section = None
+                    category = title
+                    if title not in result.categories:
+                        result.categories.append(title)
+                    continue
+            if level == category_level + 1:
+                record = finish(section)
+                if record:
+                    yield record
+                section = _Section(category, title, line_no)
+                continue
+
+        if section is not None:
+            section.fields[section.current].append(line.strip().lstrip("-*• ").strip())
+
+    record = finish(section)
+    if record:
+        yield record
+
+
+def ingest_manual(lines: Iterable[str], out: BinaryIO,
+                  progress: Optional[Callable[[int, int], None]] = None,
+                  category_level: Optional[int] = None, numbered: bool = False) -> IngestResult:
+    """
+    매뉴얼 문서를 JSON 배열로 변환하여 out에 씁니다.
+    레코드는 SHARD_SIZE개씩 묶어 내보내고, 검색 색인은 레코드마다 바로 추가합니다.
+
+    Args:
+        lines: 문서 줄
+        out: JSON 배열을 쓸 바이너리 파일
+        progress: progress(읽은 줄 수, 변환된 레코드 수) 콜백
+        category_level: 카테고리 제목 단계 (None이면 자동)
+        numbered: 번호 제목 인식 여부 (텍스트 문서용)
+
+    Returns:
+        IngestResult (레코드 수, 카테고리, 경고, 검색 색인)
+    """
+    result = IngestResult(text_index=TextIndex(MANUAL_FIELD_WEIGHTS))
+    shard: List[Dict[str, Any]] = []
+    counter = {"lines": 0}
+
+    def counted(source: Iterable[str]) -> Iterator[str]:
+        for line in source:
+            counter["lines"] += 1
+            if progress and counter["lines"] % PROGRESS_EVERY_LINES == 0:
+                progress(counter["lines"], result.records)
+            yield line
+
+    def flush() -> None:
+        for record in shard:
+            prefix = b"[\n    " if result.records == 0 else b",\n    "
+            out.write(prefix + json.dumps(record, ensure_ascii=False).encode("utf-8"))
+            result.records += 1
+        shard.clear()
+
+    for record in iter_manual_records(counted(lines), result, category_level, numbered):
+        result.text_index.add(record)
+        shard.append(record)
+        if len(shard) >= SHARD_SIZE:
+            flush()
+    flush()
+    out.write(b"\n]\n" if result.records else b"[]\n")
+    result.text_index.build()
+    if progress:
+        progress(counter["lines"], result.records)
+    return result
+
+
+def open_text(stream: BinaryIO) -> TextIO:
+    """업로드된 바이너리 파일을 UTF-8(BOM 허용) 텍스트 줄 단위로 읽습니다."""
+    return io.TextIOWrapper(stream, encoding="utf-8-sig", errors="replace", newline=None)
+
+
+def import_manual_document(stream: BinaryIO, base_version: Optional[str], numbered: bool = False,
+                           category_level: Optional[int] = None,
+                           progress: Optional[Callable[[float, int, int], None]] = None) -> Optional[IngestResult]:
+    """
+    업로드된 매뉴얼 문서를 변환하여 evaluation_manual.json으로 저장합니다.
+    변환 결과는 임시 파일로 스트리밍하고, 1MB를 넘으면 재직렬화 없이 원본 바이트를 저장합니다.
+
+    Args:
+        stream: 문서 바이너리 스트림 (st.file_uploader 결과)
+        base_version: 문서를 올릴 때의 evaluation_manual.json 버전 (save_data의 편집 기준, 파일이 없었으면 None)
+        numbered: 번호 제목 인식 여부 (텍스트 문서)
+        category_level: 카테고리 제목 단계 (None이면 자동)
+        progress: progress(진행률 0~1, 읽은 줄 수, 변환된 레코드 수) 콜백
+
+    Returns:
+        IngestResult, 변환된 평가 항목이 없거나 저장에 실패하면 None
+    """
+    stream.seek(0, io.SEEK_END)
+    total = stream.tell() or 1
+    stream.seek(0)
+
+    def report(lines: int, records: int) -> None:
+        if progress:
+            progress(min(stream.tell() / total, 1.0), lines, records)
+
+    tmp_path = make_temp_path(Path('data') / MANUAL_FILENAME)
+    try:
+        with open(tmp_path, 'wb') as out:
+            result = ingest_manual(open_text(stream), out, report, category_level, numbered)
+        if result.records == 0:
+            st.error("❌ 평가 항목을 찾지 못했습니다. 제목(#, ##) 구조를 확인해주세요.")
+            return None
+
+        # 병합 없이 그대로 저장되었을 때의 버전 (원격 변경과 병합되면 색인이 저장된 레코드와 맞지 않음)
+        if tmp_path.stat().st_size > LARGE_FILE_THRESHOLD:
+            expected = git_blob_sha(tmp_path.read_bytes())
+            with open(tmp_path, 'rb') as f:
+                saved = save_raw_data(MANUAL_FILENAME, f, base_version)
+        else:
+            records = json.loads(tmp_path.read_bytes().decode('utf-8'))
+            expected = compute_data_version(MANUAL_FILENAME, records)
+            saved = save_data(MANUAL_FILENAME, records, base_version)
+        if not saved:
+            return None
+
+        if get_data_version(MANUAL_FILENAME) == expected:
+            register_text_index(expected, result.text_index)
+        return result
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
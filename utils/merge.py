@@ -0,0 +1,160 @@
+"""
+3-way 병합 모듈
+저장 충돌 시 기준(base) / 내 변경(ours) / 원격 변경(theirs)을 레코드 단위로 병합합니다.
+목록형 데이터는 파일별 레코드 식별 필드로, 딕셔너리는 최상위 키로 레코드를 구분하며
+(딕셔너리 안의 목록은 NESTED_RECORD_KEYS의 식별 필드로 다시 레코드 단위 병합)
+같은 레코드를 양쪽에서 다르게 바꾼 경우만 충돌로 보고합니다.
+"""
+
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# 상수 정의
+# 파일별 레코드 식별 필드 (목록에 없는 목록형 파일은 파일 전체를 하나의 값으로 병합)
+RECORD_KEYS: Dict[str, Tuple[str, ...]] = {
+    "schedules.json": ("name", "date"),
+    "staff_profiles.json": ("email",),
+    "business_cards.json": ("name", "org"),
+    "weekly_reports.json": ("date", "department"),
+    "evaluation_manual.json": ("category", "criteria"),
+    "kpi_history.json": ("timestamp",),
+}
+# 딕셔너리 파일의 최상위 키별 목록 레코드 식별 필드 (목록에 없는 키는 값 전체를 하나의 레코드로 병합)
+NESTED_RECORD_KEYS: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "dashboard_data.json": {"students": ("id",), "mou_partners": ("name",)},
+}
+
+_MISSING = object()  # 레코드가 없음 (추가/삭제 표시)
+
+
+@dataclass
+class MergeResult:
+    """병합 결과 (conflicts가 비어 있으면 merged를 그대로 저장 가능)"""
+    merged: Any
+    conflicts: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.conflicts
+
+
+def _resolve(base: Any, ours: Any, theirs: Any) -> Tuple[Any, bool]:
+    """레코드 하나의 3-way 결과와 충돌 여부를 반환합니다."""
+    if ours == theirs or base == theirs:
+        return ours, False
+    if base == ours:
+        return theirs, False
+    return ours, True
+
+
+def _show(value: Any) -> Any:
+    return None if value is _MISSING else value
+
+
+def _merge_keyed(base: Dict[Hashable, Any], ours: Dict[Hashable, Any], theirs: Dict[Hashable, Any],
+                 order: List[Hashable], nested: Optional[Mapping[Hashable, Sequence[str]]] = None
+                 ) -> Tuple[Dict[Hashable, Any], List[Dict[str, Any]]]:
+    """
+    키 → 레코드 매핑 세 개를 병합합니다 (order 순서로 결과 생성).
+    nested에 있는 키의 목록 값은 해당 식별 필드로 레코드 단위 병합하며, 충돌 키는 (키, 레코드 키)로 표시합니다.
+    """
+    merged: Dict[Hashable, Any] = {}
+    conflicts: List[Dict[str, Any]] = []
+    for key in order:
+        b, o, t = base.get(key, _MISSING), ours.get(key, _MISSING), theirs.get(key, _MISSING)
+        if nested and key in nested and o is not _MISSING and t is not _MISSING:
+            result = three_way_merge(None if b is _MISSING else b, o, t, nested[key])
+            conflicts.extend({**c, "key": (key, c["key"])} for c in result.conflicts)
+            merged[key] = result.merged
+            continue
+        value, conflict = _resolve(b, o, t)
+        if conflict:
+            conflicts.append({"key": key, "base": _show(b), "ours": _show(o), "theirs": _show(t)})
+        if value is not _MISSING:
+            merged[key] = value
+    return merged, conflicts
+
+
+def index_records(records: Sequence[Any], key_fields: Sequence[str]) -> Optional[Dict[Hashable, Any]]:
+    """레코드를 식별 키로 색인합니다. 매핑이 아니거나 키가 중복되면 None."""
+    indexed: Dict[Hashable, Any] = {}
+    for record in records:
+        if not isinstance(record, Mapping):
+            return None
+        key = tuple(record.get(f) for f in key_fields)
+        if key in indexed:
+            return None
+        indexed[key] = record
+    return indexed
+
+
+def _merged_order(ours: Sequence[Hashable], theirs: Sequence[Hashable]) -> List[Hashable]:
+    """
+    결과 순서: 내 순서를 유지하고, 원격에만 있는 레코드는 원격에서 바로 앞에 있던 공통 레코드
+    (와 그 뒤에 이어지는 내 추가분) 뒤에 둡니다. 예: 양쪽에서 이력 끝에 추가한 스냅샷이 모두 끝부분에 남음
+    """
+    ours_set = set(ours)
+    followers: Dict[Any, List[Hashable]] = defaultdict(list)
+    anchor: Any = None
+    for key in theirs:
+        if key in ours_set:
+            anchor = key
+        else:
+            followers[anchor].append(key)
+
+    # 공통 레코드 뒤에 이어지는 내 추가분 다음에 원격 추가분을 둠
+    theirs_set = set(theirs)
+    order = list(followers[None])
+    pending: List[Hashable] = []
+    for key in ours:
+        if key in theirs_set:
+            order.extend(pending)
+            pending = followers.get(key, [])
+        order.append(key)
+    order.extend(pending)
+    return order
+
+
+def three_way_merge(base: Any, ours: Any, theirs: Any,
+                    key_fields: Optional[Sequence[str]] = None,
+                    nested: Optional[Mapping[Hashable, Sequence[str]]] = None) -> MergeResult:
+    """
+    기준/내 변경/원격 변경을 레코드 단위로 병합합니다.
+
+    Args:
+        base: 내가 편집을 시작한 버전의 데이터
+        ours: 저장하려는 데이터
+        theirs: 현재 원격(GitHub)에 있는 데이터
+        key_fields: 목록형 데이터의 레코드 식별 필드 (None이면 파일 전체를 하나의 값으로 취급)
+        nested: 딕셔너리 데이터에서 키별 목록 값의 레코드 식별 필드
+
+    Returns:
+        MergeResult (병합 결과와 충돌 목록)
+    """
+    value, conflict = _resolve(base, ours, theirs)
+    if not conflict:
+        return MergeResult(value)
+
+    if isinstance(ours, dict) and isinstance(theirs, dict):
+        base_dict = base if isinstance(base, dict) else {}
+        order = _merged_order(list(ours), list(theirs))
+        merged, conflicts = _merge_keyed(base_dict, ours, theirs, order, nested)
+        return MergeResult(merged, conflicts)
+
+    if key_fields and isinstance(ours, list) and isinstance(theirs, list):
+        base_index = index_records(base if isinstance(base, list) else [], key_fields)
+        ours_index = index_records(ours, key_fields)
+        theirs_index = index_records(theirs, key_fields)
+        if base_index is not None and ours_index is not None and theirs_index is not None:
+            order = _merged_order(list(ours_index), list(theirs_index))
+            merged, conflicts = _merge_keyed(base_index, ours_index, theirs_index, order)
+            return MergeResult(list(merged.values()), conflicts)
+
+    return MergeResult(ours, [{"key": None, "base": base, "ours": ours, "theirs": theirs}])
+
+
+def merge_for_file(filename: str, base: Any, ours: Any, theirs: Any) -> MergeResult:
+    """파일에 맞는 레코드 식별 필드로 3-way 병합합니다."""
+    return three_way_merge(base, ours, theirs, RECORD_KEYS.get(filename), NESTED_RECORD_KEYS.get(filename))
@@ -0,0 +1,117 @@
+"""
+페이지네이션 모듈
+검색 결과 중 현재 페이지에 해당하는 항목만 위젯/DataFrame으로 렌더링합니다.
+"""
+
+import math
+import streamlit as st
+from dataclasses import dataclass
+from typing import Any, Hashable, List, Sequence
+
+# 상수 정의
+DEFAULT_PAGE_SIZE = 20
+PAGE_SIZE_OPTIONS = [10, 20, 50, 100]
+
+
+@dataclass(frozen=True)
+class Page:
+    """한 페이지 분량의 결과와 커서 정보"""
+    items: List[Any]
+    page: int          # 1부터 시작하는 현재 페이지 번호
+    page_size: int
+    total: int
+
+    @property
+    def total_pages(self) -> int:
+        return max(1, math.ceil(self.total / self.page_size))
+
+    @property
+    def start(self) -> int:
+        """현재 페이지 첫 항목의 0 기반 오프셋 (커서)"""
+        return (self.page - 1) * self.page_size
+
+    @property
+    def end(self) -> int:
+        return min(self.start + self.page_size, self.total)
+
+
+def paginate(items: Sequence[Any], page: int, page_size: int = DEFAULT_PAGE_SIZE) -> Page:
+    """
+    시퀀스에서 요청한 페이지 구간만 잘라냅니다.
+
+    Args:
+        items: 전체 결과 (리스트/튜플)
+        page: 페이지 번호 (1부터 시작, 범위를 벗어나면 보정)
+        page_size: 페이지당 항목 수
+
+    Returns:
+        Page 객체 (items에는 현재 페이지 항목만 포함)
+    """
+    page_size = max(1, int(page_size))
+    total = len(items)
+    total_pages = max(1, math.ceil(total / page_size))
+    page = min(max(1, int(page)), total_pages)
+    start = (page - 1) * page_size
+    return Page(
+        items=list(items[start:start + page_size]),
+        page=page,
+        page_size=page_size,
+        total=total
+    )
+
+
+def render_pagination(items: Sequence[Any], key: str, page_size: int = DEFAULT_PAGE_SIZE,
+                      reset_on: Hashable = None) -> Page:
+    """
+    페이지 크기/페이지 번호 컨트롤을 렌더링하고 현재 페이지를 반환합니다.
+    커서는 st.session_state에 보관되며, 결과 집합(reset_on 값 또는 결과 개수)이 바뀌면 첫 페이지로 돌아갑니다.
+
+    Args:
+        items: 전체 결과
+        key: 위젯 키 접두사 (페이지 내에서 고유해야 함)
+        page_size: 기본 페이지 크기
+        reset_on: 결과 집합을 구분하는 값 (예: 검색어, 파일명). 값이 바뀌면 개수가 같아도 커서 초기화
+
+    Returns:
+        Page 객체
+    """
+    size_key = f"{key}_page_size"
+    page_key = f"{key}_page"
+    result_key = f"{key}_result"
+
+    # 결과 집합이 바뀌면 커서 초기화 (같은 개수의 다른 검색 결과도 구분)
+    result_id = (reset_on, len(items))
+    if st.session_state.get(result_key) != result_id:
+        st.session_state[result_key] = result_id
+        st.session_state[page_key] = 1
+
+    if size_key not in st.session_state:
+        st.session_state[size_key] = page_size if page_size in PAGE_SIZE_OPTIONS else DEFAULT_PAGE_SIZE
+
+    col1, col2, col3 = st.columns([1, 1, 2])
+
+    with col1:
+        selected_size = st.selectbox("페이지당 항목 수", PAGE_SIZE_OPTIONS, key=size_key)
+
+    total_pages = max(1, math.ceil(len(items) / selected_size))
+    if st.session_state.get(page_key, 1) > total_pages:
+        st.session_state[page_key] = total_pages
+
+    with col2:
+        current_page = st.number_input(
+            "페이지",
+            min_value=1,
+            max_value=total_pages,
+            step=1,
+            key=page_key
+        )
+
+    page = paginate(items, current_page, selected_size)
+
+    with col3:
+        if page.total:
+            st.caption(f"{page.total:,}건 중 {page.start + 1:,}–{page.end:,} 표시 (페이지 {page.page}/{page.total_pages})")
+        else:
+            st.caption("표시할 항목이 없습니다.")
+
+    return page
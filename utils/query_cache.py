@@ -0,0 +1,117 @@
+"""
+검색 결과 캐시 모듈
+모든 세션이 공유하는 LRU 캐시로, 질의 → 순위가 매겨진 결과 인덱스를 보관합니다.
+캐시 키에 데이터 버전(Git blob SHA)이 포함되므로 데이터가 바뀌면 자동으로 무효화됩니다.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# 상수 정의
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class QueryCache:
+    """
+    스레드 안전한 크기 제한 LRU 캐시 (히트율 통계 포함)
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[int, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Tuple[int, ...]]:
+        """캐시된 값을 반환하고 최근 사용으로 표시합니다. 없으면 None."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Tuple[int, ...]) -> None:
+        """값을 저장하고 용량을 넘으면 가장 오래 사용되지 않은 항목을 제거합니다."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, namespace: Optional[str] = None) -> int:
+        """
+        캐시 항목을 제거합니다.
+
+        Args:
+            namespace: 지정하면 해당 네임스페이스(데이터 파일명) 항목만 제거
+
+        Returns:
+            제거된 항목 수
+        """
+        with self._lock:
+            if namespace is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [k for k in self._entries if isinstance(k, tuple) and k and k[0] == namespace]
+            for k in keys:
+                del self._entries[k]
+            return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        """히트/미스/제거 횟수와 히트율을 반환합니다."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": (self._hits / lookups) if lookups else 0.0
+            }
+
+
+# 프로세스 전체에서 공유하는 캐시 인스턴스
+_query_cache = QueryCache()
+
+
+def get_query_cache() -> QueryCache:
+    """공유 검색 결과 캐시를 반환합니다."""
+    return _query_cache
+
+
+def cached_search(namespace: str, version: Optional[str], query: str, records: Sequence[Any],
+                  search_fn: Callable[[str, Sequence[Any]], List[Any]]) -> List[Any]:
+    """
+    검색 결과를 공유 캐시에서 조회하고, 없으면 검색 후 결과 인덱스를 저장합니다.
+
+    Args:
+        namespace: 캐시 네임스페이스 (데이터 파일명, 예: 'staff_profiles.json')
+        version: 데이터 버전 (Git blob SHA). None이면 캐시를 사용하지 않음
+        query: 검색어
+        records: 검색 대상 레코드
+        search_fn: 실제 검색 함수 (query, records) -> 순위순 레코드 리스트
+
+    Returns:
+        순위순 레코드 리스트
+    """
+    if version is None:
+        return search_fn(query, records)
+
+    key = (namespace, version, search_fn.__name__, query.lower())
+    indices = _query_cache.get(key)
+    if indices is not None:
+        return [records[i] for i in indices]
+
+    results = search_fn(query, records)
+    positions = {id(record): i for i, record in enumerate(records)}
+    _query_cache.put(key, tuple(positions[id(r)] for r in results))
+    return results
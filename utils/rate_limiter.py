@@ -0,0 +1,207 @@
+"""
+GitHub 요청 스케줄러 모듈
+프로세스 전체에서 공유하는 토큰 버킷으로 GitHub API 호출 속도를 제한하고,
+X-RateLimit-Remaining/Reset 및 Retry-After 헤더를 반영한 지터 지수 백오프로 재시도 간격을 정합니다.
+화면 요청(interactive)은 백그라운드 갱신(background)보다 우선하며, 남은 할당량이 적으면
+백그라운드 요청이 먼저 대기합니다.
+"""
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+# 상수 정의
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+
+BUCKET_RATE = 5000 / 3600        # 초당 토큰 (인증 사용자 시간당 한도 기준)
+BUCKET_CAPACITY = 30             # 순간 최대 요청 수
+INTERACTIVE_RESERVE = 10         # 백그라운드 요청이 남겨 둘 버킷 토큰
+QUOTA_RESERVE = 200              # 백그라운드 요청이 남겨 둘 시간당 할당량
+MAX_INTERACTIVE_WAIT = 5.0       # 화면 요청이 기다릴 최대 시간 (초과하면 로컬 데이터 사용)
+BACKOFF_BASE = 1.0
+BACKOFF_CAP = 60.0
+RETRYABLE_STATUS = {403, 429, 500, 502, 503, 504}
+
+
+class RateLimitedError(Exception):
+    """할당량이 소진되어 화면 요청을 제한 시간 안에 보낼 수 없을 때 발생합니다."""
+
+
+class GitHubScheduler:
+    """
+    GitHub API 호출 스케줄러 (스레드 안전)
+
+    acquire()로 호출 전에 토큰을 받고, observe()로 응답 헤더의 할당량을 기록하며,
+    backoff()로 실패 후 재시도 전 대기합니다.
+    """
+
+    def __init__(self, rate: float = BUCKET_RATE, capacity: int = BUCKET_CAPACITY) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        # 응답 헤더에서 관찰한 할당량 (-1: 아직 모름)
+        self._remaining = -1
+        self._limit = -1
+        self._reset_at = 0.0       # 할당량 초기화 시각 (epoch)
+        self._blocked_until = 0.0  # Retry-After/한도 초과로 모든 요청을 멈출 시각 (epoch)
+        self._waits = 0
+        self._throttled = 0
+
+    # 우선순위 -----------------------------------------------------------------
+
+    @property
+    def priority(self) -> str:
+        """현재 스레드의 요청 우선순위 (기본값: interactive)"""
+        return getattr(self._local, "priority", PRIORITY_INTERACTIVE)
+
+    @contextmanager
+    def background(self) -> Iterator[None]:
+        """블록 안의 GitHub 호출을 백그라운드 우선순위로 실행합니다."""
+        previous = self.priority
+        self._local.priority = PRIORITY_BACKGROUND
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    # 토큰 버킷 ----------------------------------------------------------------
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _wait_time(self, priority: str) -> float:
+        """지금 요청하려면 기다려야 하는 시간 (잠금 안에서 호출)"""
+        now = time.time()
+        if self._blocked_until > now:
+            return self._blocked_until - now
+
+        if priority == PRIORITY_BACKGROUND:
+            # 시간당 할당량이 얼마 남지 않았으면 초기화될 때까지 백그라운드 요청 보류
+            if 0 <= self._remaining < QUOTA_RESERVE and self._reset_at > now:
+                return self._reset_at - now
+            needed = min(INTERACTIVE_RESERVE + 1, self.capacity)
+        else:
+            if self._remaining == 0 and self._reset_at > now:
+                return self._reset_at - now
+            needed = 1
+
+        if self._tokens >= needed:
+            return 0.0
+        return (needed - self._tokens) / self.rate
+
+    def acquire(self, priority: Optional[str] = None) -> None:
+        """
+        요청 토큰 하나를 받을 때까지 기다립니다.
+
+        Args:
+            priority: 요청 우선순위 (None이면 현재 스레드 우선순위)
+
+        Raises:
+            RateLimitedError: 화면 요청이 MAX_INTERACTIVE_WAIT보다 오래 기다려야 하는 경우
+        """
+        priority = priority or self.priority
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                wait = self._wait_time(priority)
+                if wait <= 0:
+                    self._tokens -= 1
+                    return
+                self._waits += 1
+            if priority == PRIORITY_INTERACTIVE and wait > MAX_INTERACTIVE_WAIT:
+                with self._lock:
+                    self._throttled += 1
+                raise RateLimitedError(f"GitHub API 한도 초과: 약 {int(wait)}초 후 다시 시도할 수 있습니다.")
+            time.sleep(min(wait, BACKOFF_CAP))
+
+    # 할당량 관찰 / 백오프 -------------------------------------------------------
+
+    def observe(self, github_client: Any) -> None:
+        """PyGithub 클라이언트가 마지막 응답 헤더에서 읽은 할당량을 기록합니다 (추가 API 호출 없음)."""
+        requester = getattr(github_client, "requester", None)
+        if requester is None:
+            return
+        remaining, limit = requester.rate_limiting
+        if limit < 0:
+            return
+        with self._lock:
+            self._remaining = remaining
+            self._limit = limit
+            self._reset_at = float(requester.rate_limiting_resettime)
+
+    def should_retry(self, error: Any) -> bool:
+        """재시도할 만한 오류인지 확인합니다 (한도 초과, 서버 오류, 네트워크 오류)."""
+        status = getattr(error, "status", None)
+        if status == 403:
+            # 403은 한도 초과 헤더가 있을 때만 재시도 (권한 오류는 재시도하지 않음)
+            return self._header_delay(getattr(error, "headers", None) or {}) is not None
+        return status is None or status in RETRYABLE_STATUS
+
+    def _header_delay(self, headers: Dict[str, str]) -> Optional[float]:
+        """Retry-After 또는 X-RateLimit-Reset 헤더가 지정한 대기 시간 (없으면 None)"""
+        headers = {k.lower(): v for k, v in (headers or {}).items()}
+        if "retry-after" in headers:
+            try:
+                return float(headers["retry-after"])
+            except ValueError:
+                return None
+        if headers.get("x-ratelimit-remaining") == "0" and "x-ratelimit-reset" in headers:
+            return max(0.0, float(headers["x-ratelimit-reset"]) - time.time())
+        return None
+
+    def backoff(self, attempt: int, error: Any = None) -> None:
+        """
+        실패한 요청을 재시도하기 전에 기다립니다.
+        헤더가 대기 시간을 지정하면 그 시각까지 모든 요청을 멈추고, 아니면 지터 지수 백오프를 적용합니다.
+
+        Args:
+            attempt: 0부터 시작하는 재시도 횟수
+            error: 발생한 예외 (GithubException이면 headers 사용)
+
+        Raises:
+            RateLimitedError: 화면 요청이 MAX_INTERACTIVE_WAIT보다 오래 기다려야 하는 경우
+        """
+        delay = self._header_delay(getattr(error, "headers", None) or {})
+        if delay is not None:
+            with self._lock:
+                self._blocked_until = max(self._blocked_until, time.time() + delay)
+        else:
+            # Full jitter: 0 ~ min(cap, base * 2^attempt)
+            delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+        if self.priority == PRIORITY_INTERACTIVE and delay > MAX_INTERACTIVE_WAIT:
+            with self._lock:
+                self._throttled += 1
+            raise RateLimitedError(f"GitHub API 한도 초과: 약 {int(delay)}초 후 다시 시도할 수 있습니다.")
+        time.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 버킷/할당량 상태와 대기 통계를 반환합니다."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return {
+                "tokens": round(self._tokens, 1),
+                "capacity": self.capacity,
+                "remaining": self._remaining,
+                "limit": self._limit,
+                "reset_at": self._reset_at,
+                "blocked_until": self._blocked_until,
+                "waits": self._waits,
+                "throttled": self._throttled
+            }
+
+
+# 프로세스 전체에서 공유하는 스케줄러 인스턴스
+_scheduler = GitHubScheduler()
+
+
+def get_scheduler() -> GitHubScheduler:
+    """공유 GitHub 요청 스케줄러를 반환합니다."""
+    return _scheduler
@@ -0,0 +1,113 @@
+"""
+레코드 단위 비교 모듈
+두 버전의 데이터셋을 레코드 식별 필드(RECORD_KEYS)로 색인하여 추가/삭제/변경된 레코드를 찾습니다.
+식별 필드가 없거나 중복되는 목록은 레코드 내용 전체를 키로 비교합니다 (변경은 삭제+추가로 표시).
+"""
+
+import json
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+from utils.merge import RECORD_KEYS, index_records
+from utils.shared_store import thaw
+
+
+@dataclass
+class RecordDiff:
+    """비교 결과"""
+    added: List[Any] = field(default_factory=list)
+    removed: List[Any] = field(default_factory=list)
+    # {'key', 'before', 'after', 'fields': 값이 바뀐 필드 목록}
+    changed: List[Dict[str, Any]] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
+def _changed_fields(before: Any, after: Any) -> List[str]:
+    """두 레코드에서 값이 다른 필드 목록 (레코드가 매핑이 아니면 빈 목록)"""
+    if not isinstance(before, Mapping) or not isinstance(after, Mapping):
+        return []
+    names = list(before) + [k for k in after if k not in before]
+    return [k for k in names if before.get(k) != after.get(k)]
+
+
+def _diff_keyed(old: Dict[Hashable, Any], new: Dict[Hashable, Any]) -> RecordDiff:
+    diff = RecordDiff()
+    for key, record in new.items():
+        if key not in old:
+            diff.added.append(record)
+        elif old[key] != record:
+            diff.changed.append({
+                "key": key,
+                "before": old[key],
+                "after": record,
+                "fields": _changed_fields(old[key], record)
+            })
+        else:
+            diff.unchanged += 1
+    diff.removed = [record for key, record in old.items() if key not in new]
+    return diff
+
+
+def _canonical(record: Any) -> str:
+    return json.dumps(thaw(record), ensure_ascii=False, sort_keys=True)
+
+
+def _diff_multiset(old: Sequence[Any], new: Sequence[Any]) -> RecordDiff:
+    """식별 필드 없이 레코드 내용 전체로 비교합니다 (같은 레코드가 여러 번 있어도 개수로 비교)."""
+    old_keys = [_canonical(r) for r in old]
+    new_keys = [_canonical(r) for r in new]
+    remaining = Counter(old_keys)
+    diff = RecordDiff()
+    for key, record in zip(new_keys, new):
+        if remaining[key] > 0:
+            remaining[key] -= 1
+            diff.unchanged += 1
+        else:
+            diff.added.append(record)
+    for key, record in zip(old_keys, old):
+        if remaining[key] > 0:
+            remaining[key] -= 1
+            diff.removed.append(record)
+    return diff
+
+
+def diff_records(old: Any, new: Any, key_fields: Optional[Sequence[str]] = None) -> RecordDiff:
+    """
+    두 버전의 데이터를 레코드 단위로 비교합니다.
+
+    Args:
+        old: 이전 버전 데이터 (없으면 None)
+        new: 새 버전 데이터 (없으면 None)
+        key_fields: 목록형 데이터의 레코드 식별 필드
+
+    Returns:
+        RecordDiff (딕셔너리 데이터는 최상위 키 단위로 비교)
+    """
+    if isinstance(old, Mapping) or isinstance(new, Mapping):
+        old_map = old if isinstance(old, Mapping) else {}
+        new_map = new if isinstance(new, Mapping) else {}
+        diff = _diff_keyed(dict(old_map), dict(new_map))
+        # 최상위 키 단위 비교에서는 추가/삭제도 키를 알 수 있도록 (키, 값)으로 표시
+        diff.added = [(k, new_map[k]) for k in new_map if k not in old_map]
+        diff.removed = [(k, old_map[k]) for k in old_map if k not in new_map]
+        return diff
+
+    old_list = list(old or [])
+    new_list = list(new or [])
+    if key_fields:
+        old_index = index_records(old_list, key_fields)
+        new_index = index_records(new_list, key_fields)
+        if old_index is not None and new_index is not None:
+            return _diff_keyed(old_index, new_index)
+    return _diff_multiset(old_list, new_list)
+
+
+def diff_for_file(filename: str, old: Any, new: Any) -> RecordDiff:
+    """파일에 맞는 레코드 식별 필드로 두 버전을 비교합니다."""
+    return diff_records(old, new, RECORD_KEYS.get(filename))
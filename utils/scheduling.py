@@ -0,0 +1,48 @@
+"""
+일정 계산 모듈
+일정 레코드를 날짜/직원별로 묶고 선택한 직원들의 공통 빈 시간대를 계산합니다.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Set
+
+# 상수 정의
+WORK_SLOTS = [f"{h}:00" for h in range(9, 18)]  # 시간대 (9:00 ~ 17:00)
+
+
+def group_by_date(schedules: Iterable[Mapping[str, Any]]) -> Dict[str, List[Mapping[str, Any]]]:
+    """일정을 날짜별로 묶습니다 (날짜가 없는 일정은 제외)."""
+    schedules_by_date: Dict[str, List[Mapping[str, Any]]] = defaultdict(list)
+    for schedule in schedules:
+        date = schedule.get('date')
+        if date:
+            schedules_by_date[date].append(schedule)
+    return schedules_by_date
+
+
+def busy_slots_by_staff(date_schedules: Iterable[Mapping[str, Any]]) -> Dict[str, Set[str]]:
+    """하루 일정에서 직원별 바쁜 시간대를 모읍니다."""
+    staff_busy_times: Dict[str, Set[str]] = {}
+    for schedule in date_schedules:
+        staff_busy_times.setdefault(schedule.get('name'), set()).update(schedule.get('time_slots', []))
+    return staff_busy_times
+
+
+def find_free_slots(staff_busy_times: Mapping[str, Set[str]], names: Sequence[str],
+                    time_slots: Sequence[str] = WORK_SLOTS) -> List[str]:
+    """
+    선택한 직원 모두가 비어 있는 시간대를 찾습니다.
+
+    Args:
+        staff_busy_times: busy_slots_by_staff() 결과
+        names: 직원 이름 목록
+        time_slots: 후보 시간대
+
+    Returns:
+        공통 빈 시간대 (time_slots 순서)
+    """
+    # 모든 직원의 바쁜 시간대 합집합
+    all_busy_times: Set[str] = set()
+    for name in names:
+        all_busy_times.update(staff_busy_times.get(name, ()))
+    return [t for t in time_slots if t not in all_busy_times]
@@ -0,0 +1,95 @@
+"""
+검색 모듈
+주간보고서, 직원 프로필, 명함 데이터에 대한 키워드 기반 검색 함수
+"""
+
+from typing import Any, Dict, List, Sequence
+from utils.autocomplete import contains_query
+
+
+def search_reports(query: str, reports: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """키워드 기반 보고서 검색"""
+    query_lower = query.lower()
+    results = []
+    
+    for report in reports:
+        score = 0
+        # 부서명 매칭
+        if query_lower in report.get("department", "").lower():
+            score += 10
+        # 요약 내용 매칭
+        if query_lower in report.get("summary", "").lower():
+            score += 5
+        # 이슈 매칭
+        for issue in report.get("issues", []):
+            if query_lower in issue.lower():
+                score += 8
+        
+        if score > 0:
+            results.append((report, score))
+    
+    # 점수순 정렬
+    results.sort(key=lambda x: x[1], reverse=True)
+    return [r[0] for r in results]
+
+
+def search_staff(keyword: str, profiles: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """키워드 기반 직원 검색"""
+    if not keyword:
+        return list(profiles)
+    
+    results = []
+    
+    for profile in profiles:
+        score = 0
+        # 부서명 매칭
+        if contains_query(profile.get("dept", ""), keyword):
+            score += 10
+        # 전문성 매칭
+        for expertise in profile.get("expertise", []):
+            if contains_query(expertise, keyword):
+                score += 8
+        # 관심사 매칭
+        for interest in profile.get("interests", []):
+            if contains_query(interest, keyword):
+                score += 5
+        # 이름 매칭
+        if contains_query(profile.get("name", ""), keyword):
+            score += 3
+        
+        if score > 0:
+            results.append((profile, score))
+    
+    # 점수순 정렬
+    results.sort(key=lambda x: x[1], reverse=True)
+    return [r[0] for r in results]
+
+
+def search_cards(keyword: str, cards: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """키워드 기반 명함 검색"""
+    if not keyword:
+        return list(cards)
+    
+    results = []
+    
+    for card in cards:
+        score = 0
+        # 기관명 매칭
+        if contains_query(card.get("org", ""), keyword):
+            score += 10
+        # 담당자명 매칭
+        if contains_query(card.get("name", ""), keyword):
+            score += 8
+        # 직책 매칭
+        if contains_query(card.get("position", ""), keyword):
+            score += 5
+        # 이력 매칭
+        if contains_query(card.get("history", ""), keyword):
+            score += 6
+        
+        if score > 0:
+            results.append((card, score))
+    
+    # 점수순 정렬
+    results.sort(key=lambda x: x[1], reverse=True)
+    return [r[0] for r in results]
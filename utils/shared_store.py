@@ -0,0 +1,153 @@
+"""
+공유 데이터셋 저장소 모듈
+프로세스 전체에서 파일(버전)별로 불변 데이터 사본 하나만 유지하고 모든 세션이 같은 객체를 참조합니다.
+레코드는 같은 필드 구성끼리 필드명 → 위치 색인(dict)을 공유하는 슬롯 기반 읽기 전용 Mapping으로,
+목록은 튜플로 바꾸고 짧은 문자열은 intern하여 반복되는 값(부서명, 카테고리 등)을 한 번만 저장합니다.
+"""
+
+import sys
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# 상수 정의
+INTERN_MAX_LENGTH = 64  # 이 길이 이하의 문자열만 intern (긴 본문은 값마다 고유하므로 제외)
+
+
+class FrozenRecord(Mapping):
+    """
+    읽기 전용 레코드 (dict처럼 get/[]/items 사용 가능, 수정 불가)
+
+    필드명 → 위치 색인(dict)은 같은 필드 구성을 가진 레코드끼리 공유하고, 값은 같은 순서의 튜플로 저장합니다.
+    필드 조회는 색인 dict 조회 한 번입니다.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index: Dict[str, int], values: Tuple[Any, ...]) -> None:
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._index[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __repr__(self) -> str:
+        return f"FrozenRecord({dict(self.items())!r})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # st.cache_data 등이 pickle할 때 필드 색인도 함께 저장 (한 번에 pickle한 레코드끼리는 계속 공유)
+        return (FrozenRecord, (self._index, self._values))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """수정 가능한 일반 dict/list 사본을 반환합니다 (저장/직렬화용)."""
+        return {key: thaw(value) for key, value in zip(self._index, self._values)}
+
+
+class _Freezer:
+    """한 데이터셋을 변환하는 동안 필드 구성별 위치 색인을 공유합니다."""
+
+    def __init__(self) -> None:
+        self._schemas: Dict[Tuple[str, ...], Dict[str, int]] = {}
+
+    def freeze(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            fields = tuple(sys.intern(k) if isinstance(k, str) else k for k in value)
+            index = self._schemas.get(fields)
+            if index is None:
+                index = self._schemas[fields] = {name: i for i, name in enumerate(fields)}
+            return FrozenRecord(index, tuple(self.freeze(v) for v in value.values()))
+        if isinstance(value, list):
+            return tuple(self.freeze(v) for v in value)
+        if isinstance(value, str) and len(value) <= INTERN_MAX_LENGTH:
+            return sys.intern(value)
+        return value
+
+
+def freeze(data: Any) -> Any:
+    """
+    JSON 데이터(dict/list)를 읽기 전용 구조로 변환합니다.
+
+    Args:
+        data: json.loads 결과
+
+    Returns:
+        dict → FrozenRecord, list → tuple로 바뀐 데이터 (스칼라 값은 그대로)
+    """
+    return _Freezer().freeze(data)
+
+
+def thaw(value: Any) -> Any:
+    """freeze의 역변환: 수정 가능한 dict/list 사본을 만듭니다."""
+    if isinstance(value, FrozenRecord):
+        return value.to_dict()
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+class SharedDatasetStore:
+    """
+    파일별 최신 버전의 불변 데이터셋 저장소 (스레드 안전)
+
+    버전이 바뀔 때만 다시 변환하고, 이전 버전은 참조가 없어지면 해제됩니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._datasets: Dict[str, Tuple[Optional[str], Any]] = {}
+        self._hits = 0
+        self._builds = 0
+
+    def get(self, filename: str, version: Optional[str], data: Any) -> Any:
+        """
+        파일의 공유 데이터셋을 반환합니다.
+
+        Args:
+            filename: 데이터 파일명
+            version: 데이터 버전 (Git blob SHA)
+            data: 저장된 버전과 다를 때 변환할 원본 데이터
+
+        Returns:
+            읽기 전용 데이터셋 (같은 버전이면 모든 호출자가 같은 객체를 받음)
+        """
+        with self._lock:
+            cached = self._datasets.get(filename)
+            if cached is not None and version is not None and cached[0] == version:
+                self._hits += 1
+                return cached[1]
+
+        frozen = freeze(data)
+        with self._lock:
+            cached = self._datasets.get(filename)
+            # 다른 스레드가 먼저 같은 버전을 만들었으면 그 객체를 사용 (사본 하나 유지)
+            if cached is not None and version is not None and cached[0] == version:
+                return cached[1]
+            self._datasets[filename] = (version, frozen)
+            self._builds += 1
+        return frozen
+
+    def peek(self, filename: str, version: str) -> Optional[Any]:
+        """파일의 공유 데이터셋이 version이면 반환합니다 (아니면 None, 원본 데이터 없이 조회)."""
+        with self._lock:
+            cached = self._datasets.get(filename)
+            if cached is not None and cached[0] == version:
+                self._hits += 1
+                return cached[1]
+        return None
+
+    def invalidate(self, filename: str) -> None:
+        with self._lock:
+            self._datasets.pop(filename, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"datasets": len(self._datasets), "hits": self._hits, "builds": self._builds}
@@ -0,0 +1,82 @@
+"""
+단일 실행(single-flight) 모듈
+같은 키에 대한 동시 요청을 하나의 실행으로 합칩니다. 먼저 도착한 호출이 실제 작업을 수행하고,
+그동안 도착한 호출은 그 결과(또는 예외)를 그대로 공유합니다.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """진행 중인 실행 하나"""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    키별 동시 실행 병합기 (스레드 안전)
+
+    실행이 끝나면 키를 즉시 제거하므로 결과를 캐시하지 않습니다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._executions = 0
+        self._shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        키에 대해 진행 중인 실행이 있으면 그 결과를 기다리고, 없으면 fn을 실행합니다.
+
+        Args:
+            key: 병합 키 (예: 파일명)
+            fn: 실제 작업
+
+        Returns:
+            fn의 결과 (동시 호출자는 같은 객체를 받음)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+                self._executions += 1
+            else:
+                call.waiters += 1
+                self._shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def stats(self) -> Dict[str, int]:
+        """실제 실행 횟수와 다른 호출의 결과를 공유한 횟수를 반환합니다."""
+        with self._lock:
+            return {
+                "executions": self._executions,
+                "shared": self._shared,
+                "in_flight": len(self._calls)
+            }
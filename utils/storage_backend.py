@@ -0,0 +1,224 @@
+"""
+저장소 백엔드 모듈
+load_data/save_data 뒤에 둘 수 있는 저장소 인터페이스와 로컬 SQLite 구현을 제공합니다.
+SQLite 백엔드는 목록형 데이터셋을 레코드 단위로 저장하고 name/date/dept/org 색인을 만들어
+페이지가 파일 전체를 로드하지 않고 색인 질의로 필요한 레코드만 조회할 수 있게 합니다.
+"""
+
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# 상수 정의
+DEFAULT_DB_PATH = "data/platform.db"
+INDEXED_FIELDS = ("name", "date", "dept", "org")
+
+# 파일별 색인 컬럼 → 레코드 필드
+INDEX_FIELD_MAP: Dict[str, Dict[str, str]] = {
+    "schedules.json": {"name": "name", "date": "date"},
+    "staff_profiles.json": {"name": "name", "dept": "dept"},
+    "business_cards.json": {"name": "name", "org": "org"},
+    "weekly_reports.json": {"date": "date", "dept": "department"},
+}
+
+FilterValue = Union[str, Sequence[str]]
+
+
+def _check_fields(filters: Dict[str, Any]) -> None:
+    unknown = set(filters) - set(INDEXED_FIELDS)
+    if unknown:
+        raise ValueError(f"색인되지 않은 필드입니다: {', '.join(sorted(unknown))}")
+
+
+def match_record(record: Dict[str, Any], filename: str, filters: Dict[str, FilterValue]) -> bool:
+    """
+    레코드가 색인 필드 조건을 모두 만족하는지 확인합니다 (SQLite를 쓰지 않을 때의 대체 경로).
+
+    Args:
+        record: 레코드
+        filename: 데이터 파일명 (색인 컬럼 → 레코드 필드 매핑에 사용)
+        filters: {색인 필드: 값 또는 값 목록}
+
+    Returns:
+        조건 만족 여부
+    """
+    _check_fields(filters)
+    field_map = INDEX_FIELD_MAP.get(filename, {})
+    for column, expected in filters.items():
+        value = record.get(field_map.get(column, column))
+        if isinstance(expected, str):
+            if value != expected:
+                return False
+        elif value not in expected:
+            return False
+    return True
+
+
+class StorageBackend(ABC):
+    """
+    저장소 백엔드 인터페이스
+
+    load/save는 필수이고, 색인 질의(query/distinct)는 지원하는 백엔드만 구현합니다.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def load(self, filename: str) -> Optional[Tuple[Any, str]]:
+        """데이터와 데이터 버전을 반환합니다. 저장된 적이 없으면 None."""
+
+    @abstractmethod
+    def save(self, filename: str, data: Any, version: str) -> None:
+        """데이터를 지정한 데이터 버전으로 저장합니다."""
+
+    def version(self, filename: str) -> Optional[str]:
+        """저장된 데이터 버전을 반환합니다 (기본 구현은 전체 로드)."""
+        stored = self.load(filename)
+        return stored[1] if stored else None
+
+    def query(self, filename: str, filters: Dict[str, FilterValue],
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """색인 필드 조건으로 레코드를 조회합니다 (기본 구현은 전체 로드 후 필터)."""
+        stored = self.load(filename)
+        records = [r for r in (stored[0] if stored else []) if match_record(r, filename, filters)]
+        return records[:limit] if limit is not None else records
+
+    def distinct(self, filename: str, field: str) -> List[str]:
+        """색인 필드의 고유 값 목록을 정렬하여 반환합니다."""
+        _check_fields({field: None})
+        column = INDEX_FIELD_MAP.get(filename, {}).get(field, field)
+        stored = self.load(filename)
+        return sorted({r.get(column) for r in (stored[0] if stored else []) if r.get(column)})
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    로컬 SQLite 저장소
+
+    목록형 데이터는 records 테이블에 레코드당 한 행으로, 그 외 데이터는 datasets 테이블에 통째로 저장합니다.
+    하나의 연결을 스레드 간에 공유하므로 모든 접근을 잠금으로 직렬화합니다.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH) -> None:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS datasets (
+                filename TEXT PRIMARY KEY,
+                version TEXT NOT NULL,
+                is_list INTEGER NOT NULL,
+                body TEXT,
+                updated_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS records (
+                filename TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                name TEXT,
+                date TEXT,
+                dept TEXT,
+                org TEXT,
+                body TEXT NOT NULL,
+                PRIMARY KEY (filename, seq)
+            );
+            CREATE INDEX IF NOT EXISTS idx_records_name ON records (filename, name);
+            CREATE INDEX IF NOT EXISTS idx_records_date ON records (filename, date);
+            CREATE INDEX IF NOT EXISTS idx_records_dept ON records (filename, dept);
+            CREATE INDEX IF NOT EXISTS idx_records_org ON records (filename, org);
+        """)
+
+    def load(self, filename: str) -> Optional[Tuple[Any, str]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, is_list, body FROM datasets WHERE filename = ?", (filename,)
+            ).fetchone()
+            if row is None:
+                return None
+            version, is_list, body = row
+            if not is_list:
+                return json.loads(body), version
+            bodies = self._conn.execute(
+                "SELECT body FROM records WHERE filename = ? ORDER BY seq", (filename,)
+            ).fetchall()
+        return [json.loads(b) for (b,) in bodies], version
+
+    def save(self, filename: str, data: Any, version: str) -> None:
+        is_list = isinstance(data, list)
+        field_map = INDEX_FIELD_MAP.get(filename, {})
+
+        def index_value(record: Any, column: str) -> Optional[str]:
+            if not isinstance(record, dict) or column not in field_map:
+                return None
+            value = record.get(field_map[column])
+            return None if value is None else str(value)
+
+        rows = [
+            (filename, seq, *(index_value(record, column) for column in INDEXED_FIELDS),
+             json.dumps(record, ensure_ascii=False))
+            for seq, record in enumerate(data)
+        ] if is_list else []
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM records WHERE filename = ?", (filename,))
+            self._conn.executemany(
+                "INSERT INTO records (filename, seq, name, date, dept, org, body) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO datasets (filename, version, is_list, body, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (filename, version, int(is_list), None if is_list else json.dumps(data, ensure_ascii=False),
+                 datetime.now().isoformat(timespec="seconds"))
+            )
+
+    def version(self, filename: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT version FROM datasets WHERE filename = ?", (filename,)).fetchone()
+        return row[0] if row else None
+
+    def query(self, filename: str, filters: Dict[str, FilterValue],
+              limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        색인 필드 조건으로 레코드를 조회합니다 (조건은 AND, 값 목록은 IN).
+
+        Args:
+            filename: 데이터 파일명
+            filters: {색인 필드: 값 또는 값 목록} (예: {'name': ['김철수', '이영희']})
+            limit: 최대 결과 수
+
+        Returns:
+            저장 순서대로 정렬된 레코드 리스트
+        """
+        _check_fields(filters)
+        clauses = ["filename = ?"]
+        params: List[Any] = [filename]
+        for column, value in filters.items():
+            values = [value] if isinstance(value, str) else list(value)
+            if not values:
+                return []
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+
+        sql = f"SELECT body FROM records WHERE {' AND '.join(clauses)} ORDER BY seq"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            bodies = self._conn.execute(sql, params).fetchall()
+        return [json.loads(b) for (b,) in bodies]
+
+    def distinct(self, filename: str, field: str) -> List[str]:
+        _check_fields({field: None})
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT DISTINCT {field} FROM records WHERE filename = ? AND {field} IS NOT NULL ORDER BY {field}",
+                (filename,)
+            ).fetchall()
+        return [value for (value,) in rows]
@@ -0,0 +1,136 @@
+"""
+저장 형식 모듈
+데이터 파일을 사람이 읽는 JSON 외에 압축 형식(gzip NDJSON, gzip 컬럼형)으로도 인코딩합니다.
+압축 형식은 첫 줄에 형식 헤더를 기록하므로 로드 시 내용만 보고 형식을 판별할 수 있습니다.
+"""
+
+import io
+import gzip
+import json
+from typing import Any, Dict, List
+
+# 상수 정의
+FORMAT_JSON = "json"              # 들여쓰기된 JSON (기본, 사람이 읽는 형식)
+FORMAT_NDJSON_GZ = "ndjson.gz"    # 레코드당 한 줄 + gzip
+FORMAT_COLUMNAR_GZ = "columnar.gz"  # 필드별 값 배열 + gzip (표 형태 파일용)
+FORMAT_JSON_GZ = "json.gz"        # 한 줄 JSON + gzip (배열이 아닌 데이터)
+GZIP_MAGIC = b"\x1f\x8b"
+FORMAT_VERSION = 1
+COMPRESS_LEVEL = 6
+
+# 압축 저장을 켰을 때 파일별 형식 (목록에 없으면 gzip NDJSON, 배열이 아니면 gzip JSON 한 줄)
+COMPACT_FORMATS: Dict[str, str] = {
+    "schedules.json": FORMAT_COLUMNAR_GZ,
+    "business_cards.json": FORMAT_COLUMNAR_GZ,
+    "kpi_history.json": FORMAT_COLUMNAR_GZ,
+}
+
+
+def _dumps_line(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _is_table(data: Any) -> bool:
+    return isinstance(data, list) and all(isinstance(r, dict) for r in data)
+
+
+def _encode_columnar(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """레코드 리스트를 {'columns', 'values', 'absent'} 컬럼형 구조로 변환합니다."""
+    columns = list(dict.fromkeys(key for record in records for key in record))
+    values = {col: [record.get(col) for record in records] for col in columns}
+    # 키가 없는 경우와 값이 null인 경우를 구분하기 위해 없는 행 번호를 기록
+    absent = {
+        col: [i for i, record in enumerate(records) if col not in record]
+        for col in columns
+    }
+    return {
+        "count": len(records),
+        "columns": columns,
+        "values": values,
+        "absent": {col: rows for col, rows in absent.items() if rows}
+    }
+
+
+def _decode_columnar(body: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """컬럼형 구조를 레코드 리스트로 되돌립니다 (키 순서 유지)."""
+    columns = body["columns"]
+    values = body["values"]
+    absent = {col: set(rows) for col, rows in body.get("absent", {}).items()}
+    return [
+        {col: values[col][i] for col in columns if i not in absent.get(col, ())}
+        for i in range(body["count"])
+    ]
+
+
+def encode_data(data: Any, fmt: str = FORMAT_JSON) -> bytes:
+    """
+    데이터를 지정한 형식의 바이트로 인코딩합니다.
+
+    Args:
+        data: JSON 직렬화 가능한 데이터
+        fmt: FORMAT_JSON, FORMAT_NDJSON_GZ, FORMAT_COLUMNAR_GZ 중 하나
+             (압축 형식에 맞지 않는 데이터는 가까운 압축 형식으로 저장)
+
+    Returns:
+        저장할 바이트
+    """
+    if fmt == FORMAT_JSON:
+        return to_readable_json(data).encode("utf-8")
+
+    if fmt == FORMAT_COLUMNAR_GZ and _is_table(data):
+        lines = [_dumps_line({"format": FORMAT_COLUMNAR_GZ, "version": FORMAT_VERSION}),
+                 _dumps_line(_encode_columnar(data))]
+    elif isinstance(data, list):
+        lines = [_dumps_line({"format": FORMAT_NDJSON_GZ, "version": FORMAT_VERSION})]
+        lines.extend(_dumps_line(record) for record in data)
+    else:
+        # 배열이 아닌 데이터는 한 줄 JSON으로 압축
+        lines = [_dumps_line({"format": FORMAT_JSON_GZ, "version": FORMAT_VERSION}), _dumps_line(data)]
+
+    # mtime=0: 같은 데이터는 같은 바이트(같은 blob SHA)가 되도록 고정
+    return gzip.compress("\n".join(lines).encode("utf-8"), compresslevel=COMPRESS_LEVEL, mtime=0)
+
+
+def detect_format(raw: bytes) -> str:
+    """저장된 바이트의 형식을 판별합니다 (gzip이면 헤더 줄에서 읽음)."""
+    if not raw.startswith(GZIP_MAGIC):
+        return FORMAT_JSON
+    with gzip.GzipFile(fileobj=io.BytesIO(raw)) as f:
+        return json.loads(f.readline())["format"]
+
+
+def decode_data(raw: bytes) -> Any:
+    """
+    저장된 바이트를 형식에 맞게 디코딩합니다 (JSON/압축 형식 자동 판별).
+
+    Args:
+        raw: 파일 바이트
+
+    Returns:
+        디코딩된 데이터
+
+    Raises:
+        ValueError: 형식 헤더를 알 수 없는 경우 (json.JSONDecodeError 포함)
+    """
+    if not raw.startswith(GZIP_MAGIC):
+        return json.loads(raw)
+
+    header_line, _, body = gzip.decompress(raw).partition(b"\n")
+    fmt = json.loads(header_line).get("format")
+    if fmt == FORMAT_COLUMNAR_GZ:
+        return _decode_columnar(json.loads(body))
+    if fmt == FORMAT_NDJSON_GZ:
+        return [json.loads(line) for line in body.splitlines() if line.strip()]
+    if fmt == FORMAT_JSON_GZ:
+        return json.loads(body)
+    raise ValueError(f"알 수 없는 저장 형식입니다: {fmt}")
+
+
+def to_readable_json(data: Any) -> str:
+    """사람이 읽는 JSON 문자열 (내보내기/기본 저장 형식)을 반환합니다."""
+    return json.dumps(data, ensure_ascii=False, indent=4)
+
+
+def get_compact_format(filename: str) -> str:
+    """압축 저장 시 파일에 사용할 형식을 반환합니다."""
+    return COMPACT_FORMATS.get(filename, FORMAT_NDJSON_GZ)
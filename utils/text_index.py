@@ -0,0 +1,177 @@
+"""
+전문 검색 색인 모듈
+한글은 띄어쓰기/조사와 관계없이 찾을 수 있도록 글자 2-gram으로, 영문/숫자는 단어 단위로 색인합니다.
+역색인으로 BM25 순위 검색을 제공하고, 두 문서 집합 사이의 TF-IDF 코사인 유사도 조인을
+공통 용어가 있는 후보끼리만 계산합니다.
+"""
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# 상수 정의
+BM25_K1 = 1.2
+BM25_B = 0.75
+_TOKEN_PATTERN = re.compile(r"[가-힣]+|[a-z0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    텍스트를 색인 용어로 나눕니다.
+
+    Args:
+        text: 원문 (예: '장학금 지급률')
+
+    Returns:
+        용어 리스트 (예: ['장학', '학금', '지급', '급률'])
+    """
+    terms: List[str] = []
+    for word in _TOKEN_PATTERN.findall(text.lower()):
+        if "가" <= word[0] <= "힣":
+            # 한 글자 단어(수, 및, 등)는 의미 없이 많은 문서와 겹치므로 제외
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            terms.append(word)
+    return terms
+
+
+def _field_text(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return " ".join(str(v) for v in value)
+    return str(value) if value else ""
+
+
+class TextIndex:
+    """
+    필드 가중치를 지원하는 BM25 역색인
+
+    add()로 문서를 추가한 뒤 build()를 호출해야 search()를 사용할 수 있습니다.
+    """
+
+    def __init__(self, field_weights: Mapping[str, float]) -> None:
+        self.field_weights = dict(field_weights)
+        self._docs: List[Counter] = []
+        self._postings: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        self._idf: Dict[str, float] = {}
+        self._lengths: List[float] = []
+        self._avg_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, record: Mapping[str, Any]) -> int:
+        """
+        레코드의 색인 필드를 문서 하나로 추가합니다.
+
+        Returns:
+            문서 번호 (추가한 순서, 0부터)
+        """
+        counts: Counter = Counter()
+        for field, weight in self.field_weights.items():
+            for term in tokenize(_field_text(record.get(field))):
+                counts[term] += weight
+        self._docs.append(counts)
+        return len(self._docs) - 1
+
+    def build(self) -> "TextIndex":
+        """역색인과 IDF를 계산합니다."""
+        self._postings.clear()
+        self._lengths = [sum(counts.values()) for counts in self._docs]
+        self._avg_length = (sum(self._lengths) / len(self._lengths)) if self._lengths else 0.0
+        for doc_id, counts in enumerate(self._docs):
+            for term, tf in counts.items():
+                self._postings[term].append((doc_id, tf))
+        total = len(self._docs)
+        self._idf = {
+            term: math.log(1 + (total - len(postings) + 0.5) / (len(postings) + 0.5))
+            for term, postings in self._postings.items()
+        }
+        return self
+
+    def term_counts(self, doc_id: int) -> Counter:
+        """문서의 (가중) 용어 빈도"""
+        return self._docs[doc_id]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        질의와 관련된 문서를 BM25 점수순으로 반환합니다.
+
+        Args:
+            query: 검색어
+            limit: 최대 결과 수
+
+        Returns:
+            [(문서 번호, 점수), ...]
+        """
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            idf = self._idf.get(term)
+            if idf is None:
+                continue
+            for doc_id, tf in self._postings[term]:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[doc_id] / (self._avg_length or 1))
+                scores[doc_id] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return ranked[:limit] if limit is not None else ranked
+
+
+def _tfidf_vectors(docs: Sequence[Counter], idf: Mapping[str, float]) -> List[Dict[str, float]]:
+    """L2 정규화된 TF-IDF 벡터"""
+    vectors = []
+    for counts in docs:
+        vector = {term: (1 + math.log(tf)) * idf[term] for term, tf in counts.items() if tf > 0}
+        norm = math.sqrt(sum(v * v for v in vector.values())) or 1.0
+        vectors.append({term: v / norm for term, v in vector.items()})
+    return vectors
+
+
+def similarity_join(left: Sequence[Counter], right: Sequence[Counter],
+                    top_k: int = 3, min_score: float = 0.1) -> List[List[Tuple[int, float]]]:
+    """
+    왼쪽 문서마다 코사인 유사도가 높은 오른쪽 문서를 찾습니다.
+    오른쪽 문서의 역색인으로 공통 용어가 있는 후보만 계산하므로 전체 쌍을 비교하지 않습니다.
+
+    Args:
+        left: 왼쪽 문서 용어 빈도 (예: 평가 항목)
+        right: 오른쪽 문서 용어 빈도 (예: 주간보고 이슈)
+        top_k: 왼쪽 문서당 최대 연결 수
+        min_score: 최소 유사도
+
+    Returns:
+        왼쪽 문서 순서대로 [(오른쪽 문서 번호, 유사도), ...] 리스트
+    """
+    # 두 집합을 합친 문서 빈도로 IDF 계산 (양쪽 용어의 희소성을 같은 기준으로 비교)
+    df: Counter = Counter()
+    for counts in list(left) + list(right):
+        df.update(counts.keys())
+    total = len(left) + len(right)
+    idf = {term: math.log((1 + total) / (1 + n)) + 1 for term, n in df.items()}
+
+    left_vectors = _tfidf_vectors(left, idf)
+    right_vectors = _tfidf_vectors(right, idf)
+    inverted: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+    for doc_id, vector in enumerate(right_vectors):
+        for term, weight in vector.items():
+            inverted[term].append((doc_id, weight))
+
+    links: List[List[Tuple[int, float]]] = []
+    for vector in left_vectors:
+        scores: Dict[int, float] = defaultdict(float)
+        for term, weight in vector.items():
+            for doc_id, other in inverted.get(term, ()):
+                scores[doc_id] += weight * other
+        ranked = sorted(
+            ((doc_id, score) for doc_id, score in scores.items() if score >= min_score),
+            key=lambda item: (-item[1], item[0])
+        )
+        links.append(ranked[:top_k])
+    return links
+
+
+def count_terms(texts: Iterable[str]) -> Counter:
+    """여러 텍스트의 용어 빈도를 합칩니다 (색인하지 않는 문서의 유사도 조인용)."""
+    counts: Counter = Counter()
+    for text in texts:
+        counts.update(tokenize(text))
+    return counts
@@ -0,0 +1,213 @@
+"""
+시계열 모듈
+KPI 이력(일별 스냅샷 시계열) 관리, 기간 대비 증감 계산, 차트용 다운샘플링(LTTB, 최소/최대 버킷)을 제공합니다.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# 상수 정의
+KPI_HISTORY_FILENAME = "kpi_history.json"
+KPI_FIELDS = ["total_students", "partners", "employment_rate"]
+KPI_LABELS = {"total_students": "재학생 수", "partners": "파트너 기관 수", "employment_rate": "취업률"}
+DELTA_PERIOD_DAYS = 30       # 증감 비교 기준 기간
+MAX_CHART_POINTS = 500       # 차트에 그릴 최대 포인트 수
+
+Point = Tuple[float, float]
+
+
+def _same_day(entry: Dict[str, Any], timestamp: datetime) -> bool:
+    """스냅샷이 timestamp와 같은 날짜에 기록되었는지 확인합니다."""
+    return datetime.fromisoformat(entry["timestamp"]).date() == timestamp.date()
+
+
+def needs_kpi_snapshot(history: Optional[Sequence[Dict[str, Any]]], kpi: Dict[str, Any],
+                       timestamp: Optional[datetime] = None) -> bool:
+    """
+    이력에 기록할 변화가 있는지 확인합니다. 오늘 스냅샷이 이미 같은 KPI 값이면 False입니다.
+
+    Args:
+        history: 기존 이력 (시간순)
+        kpi: 현재 KPI 값
+        timestamp: 기록 시각 (기본값: 현재 시각)
+
+    Returns:
+        스냅샷 기록(이력 저장) 필요 여부
+    """
+    if not history:
+        return True
+    last = history[-1]
+    if not _same_day(last, timestamp or datetime.now()):
+        return True
+    return any(last.get(field) != kpi.get(field, 0) for field in KPI_FIELDS)
+
+
+def append_kpi_snapshot(history: Optional[List[Dict[str, Any]]], kpi: Dict[str, Any],
+                        timestamp: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    KPI 이력 끝에 현재 스냅샷을 추가합니다. 하루에 스냅샷 하나만 유지하므로
+    마지막 스냅샷이 같은 날짜이면 그 스냅샷을 현재 값으로 바꾸고, 이전 날짜 포인트는 수정하지 않습니다.
+
+    Args:
+        history: 기존 이력 (시간순)
+        kpi: 현재 KPI 값
+        timestamp: 기록 시각 (기본값: 현재 시각)
+
+    Returns:
+        스냅샷이 반영된 새 이력 리스트 (길이는 기록된 날짜 수 이하)
+    """
+    timestamp = timestamp or datetime.now()
+    snapshot = {"timestamp": timestamp.isoformat(timespec="seconds")}
+    for field in KPI_FIELDS:
+        snapshot[field] = kpi.get(field, 0)
+    history = list(history or [])
+    if history and _same_day(history[-1], timestamp):
+        history.pop()
+    return history + [snapshot]
+
+
+def _format_delta(field: str, current: float, baseline: float) -> str:
+    """KPI 종류에 맞게 증감을 표시용 문자열로 변환합니다."""
+    if field == "total_students":
+        if not baseline:
+            return "±0%" if current == baseline else "+100%"
+        change = (current - baseline) / baseline * 100
+        return "±0%" if round(change, 1) == 0 else f"{change:+.1f}%"
+    if field == "employment_rate":
+        change = current - baseline
+        return "±0%p" if round(change, 1) == 0 else f"{change:+.1f}%p"
+    change = current - baseline
+    return "±0" if change == 0 else f"{change:+,}"
+
+
+def compute_kpi_deltas(history: Sequence[Dict[str, Any]],
+                       period_days: int = DELTA_PERIOD_DAYS) -> Dict[str, Optional[str]]:
+    """
+    최신 스냅샷과 period_days 이전(없으면 가장 오래된) 스냅샷을 비교해 증감을 계산합니다.
+
+    Args:
+        history: KPI 이력 (시간순)
+        period_days: 비교 기준 기간 (일)
+
+    Returns:
+        {KPI 필드: 증감 문자열 또는 None(비교 대상 없음)}
+    """
+    if len(history) < 2:
+        return {field: None for field in KPI_FIELDS}
+
+    latest = history[-1]
+    cutoff = datetime.fromisoformat(latest["timestamp"]) - timedelta(days=period_days)
+    baseline = history[0]
+    # 이력은 시간순이므로 뒤에서부터 기준 시점 이전의 첫 포인트를 찾음
+    for point in reversed(history[:-1]):
+        if datetime.fromisoformat(point["timestamp"]) <= cutoff:
+            baseline = point
+            break
+
+    return {
+        field: _format_delta(field, latest.get(field, 0), baseline.get(field, 0))
+        for field in KPI_FIELDS
+    }
+
+
+def downsample_lttb(points: Sequence[Point], max_points: int = MAX_CHART_POINTS) -> List[Point]:
+    """
+    LTTB(Largest-Triangle-Three-Buckets) 알고리즘으로 시계열을 다운샘플링합니다.
+    첫/마지막 포인트를 유지하고, 버킷마다 시각적으로 가장 중요한 포인트 하나를 고릅니다.
+
+    Args:
+        points: (x, y) 리스트 (x 오름차순)
+        max_points: 결과 최대 포인트 수 (3 이상)
+
+    Returns:
+        다운샘플링된 (x, y) 리스트
+    """
+    n = len(points)
+    if max_points >= n or max_points < 3:
+        return list(points)
+
+    sampled = [points[0]]
+    bucket_size = (n - 2) / (max_points - 2)
+    a = 0  # 직전에 선택한 포인트 인덱스
+
+    for i in range(max_points - 2):
+        # 다음 버킷의 평균점
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        next_bucket = points[next_start:next_end] or [points[-1]]
+        avg_x = sum(p[0] for p in next_bucket) / len(next_bucket)
+        avg_y = sum(p[1] for p in next_bucket) / len(next_bucket)
+
+        # 현재 버킷에서 삼각형 넓이가 최대인 포인트 선택
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        ax, ay = points[a]
+        best_index, best_area = start, -1.0
+        for j in range(start, end):
+            x, y = points[j]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best_index, best_area = j, area
+
+        sampled.append(points[best_index])
+        a = best_index
+
+    sampled.append(points[-1])
+    return sampled
+
+
+def downsample_minmax(points: Sequence[Point], max_points: int = MAX_CHART_POINTS) -> List[Point]:
+    """
+    버킷마다 최솟값/최댓값 포인트를 남기는 방식으로 다운샘플링합니다 (급변 구간 보존).
+
+    Args:
+        points: (x, y) 리스트 (x 오름차순)
+        max_points: 결과 최대 포인트 수
+
+    Returns:
+        다운샘플링된 (x, y) 리스트
+    """
+    n = len(points)
+    if max_points >= n or max_points < 2:
+        return list(points)
+
+    buckets = max(1, max_points // 2)
+    bucket_size = n / buckets
+    sampled: List[Point] = []
+    for b in range(buckets):
+        bucket = points[int(b * bucket_size):int((b + 1) * bucket_size)]
+        if not bucket:
+            continue
+        low = min(bucket, key=lambda p: p[1])
+        high = max(bucket, key=lambda p: p[1])
+        sampled.extend(sorted({low, high}, key=lambda p: p[0]))
+    return sampled
+
+
+def kpi_series(history: Sequence[Dict[str, Any]], field: str, since: Optional[datetime] = None,
+               max_points: int = MAX_CHART_POINTS, method: str = "lttb") -> List[Dict[str, Any]]:
+    """
+    KPI 이력에서 한 지표의 시계열을 추출하고 차트용으로 다운샘플링합니다.
+
+    Args:
+        history: KPI 이력 (시간순)
+        field: KPI 필드명
+        since: 이 시각 이후 포인트만 사용 (None이면 전체)
+        max_points: 최대 포인트 수
+        method: 'lttb' 또는 'minmax'
+
+    Returns:
+        [{'timestamp': datetime, field: 값}] 리스트
+    """
+    points: List[Point] = []
+    for entry in history:
+        ts = datetime.fromisoformat(entry["timestamp"])
+        if since is not None and ts < since:
+            continue
+        points.append((ts.timestamp(), float(entry.get(field, 0))))
+
+    downsample = downsample_minmax if method == "minmax" else downsample_lttb
+    return [
+        {"timestamp": datetime.fromtimestamp(x), field: y}
+        for x, y in downsample(points, max_points)
+    ]